@@ -0,0 +1,262 @@
+'''
+Name: Eric and Sanvi
+Last modified: May 21, 2025
+Program details: An application that provides weather monitoring with a GUI from tkinter package.
+                 It will read weather data from a file, automatically updates conditions at set intervals, and
+                 dynamically display weather conditions (e.g., Sunny, Rainy, or Snowy).
+
+Raises and clears weather alerts as days are ingested, with a gap between the raise and
+clear thresholds so a value hovering at the limit does not flap.
+'''
+import bisect
+import collections
+import datetime
+import Weather_App_Data
+import Weather_Rules
+
+class Alert_Engine():
+    """
+    Checks every ingested day against the alert thresholds of the rule file.
+    Each station's state is one bit per alert plus the last date seen, so checking a
+    day costs the same for any number of stations. An alert that is already raised is
+    not raised again, and one that clears and comes back within the merge window is
+    reopened instead of reported as new. A day older than the last one seen, e.g. a
+    correction, does not raise or clear alerts; it is counted as late, and if it falls
+    inside an alert that is still open that alert's peak is worked out again. A removed
+    day does the same, and clears the alert if no stored day in it still crosses the threshold.
+    """
+    def __init__(self, rules=None, merge_days=2, history=200):
+        """
+        Initializes the Alert_Engine with no alerts raised.
+
+        Parameters:
+            rules: the compiled rules whose alert thresholds are used, default is conditions.json (Rule_Table)
+            merge_days: days after clearing in which a new crossing reopens the same alert, default is 2 (int)
+            history: number of recent alert events kept, default is 200 (int)
+        """
+        rules = rules or Weather_Rules.get_rule_table()
+        self.__alerts = rules.get_alerts()
+        self.__merge_days = merge_days
+        self.__states = {} #maps stations to [active alert bits, last date, {bit: date cleared}]
+        self.__active = {} #maps (station, alert name) to the open alert
+        self.__events = collections.deque(maxlen=history)
+        self.__listeners = []
+        self.__counts = {"raised": 0, "cleared": 0, "merged": 0, "late": 0, "revised": 0, "removed": 0}
+
+    def attach(self, weather_data):
+        """
+        Checks the days already stored, oldest first, and then every day the data ingests.
+
+        Parameters:
+            weather_data: the station's data (Weather_App_Data)
+        """
+        for date_key, record in zip(weather_data.get_day_keys(), weather_data.get_list()):
+            self.check(weather_data, date_key, record, None)
+        weather_data.add_ingest_listener(self.check)
+
+    def add_listener(self, listener):
+        """
+        Calls a function for every alert that is raised, reopened or cleared.
+
+        Parameters:
+            listener: function taking the event (dict)
+        """
+        self.__listeners.append(listener)
+
+    def check(self, weather_data, date_key, record, old_record=None):
+        """
+        Checks one day of a station. Has the signature of an ingest listener.
+        Days older than the last one seen for the station do not raise or clear alerts,
+        but revise the peak of an open alert they fall in. A removed day revises the open
+        alerts it falls in, or clears them.
+
+        Parameters:
+            weather_data: the station's data (Weather_App_Data)
+            date_key: the day in yyyy-mm-dd format (str)
+            record: the day's weather data, or None if the day was removed (dict)
+            old_record: the day's earlier data if it was corrected or removed, not used (dict)
+        """
+        if record is None:
+            self.__counts["removed"] += 1
+            self.revise(weather_data, date_key, True)
+            return
+        station = weather_data.get_station()
+        state = self.__states.get(station)
+        if state is None:
+            state = self.__states[station] = [0, "", {}]
+        if date_key < state[1]:
+            self.__counts["late"] += 1
+            self.revise(weather_data, date_key)
+            return
+        state[1] = date_key
+        values = Weather_App_Data.derived_values(record)
+        for bit, alert in enumerate(self.__alerts):
+            field = alert["field"]
+            value = record[field] if field in record else values[field]
+            mask = 1 << bit
+            if state[0] & mask:
+                #an open alert clears only once the value is back past the clear threshold
+                if value < alert["clear"] if "above" in alert else value > alert["clear"]:
+                    state[0] &= ~mask
+                    state[2][bit] = date_key
+                    self.close(station, alert, date_key, value)
+                else:
+                    self.update(station, alert, date_key, value)
+            elif value >= alert["above"] if "above" in alert else value <= alert["below"]:
+                state[0] |= mask
+                cleared = state[2].pop(bit, None)
+                self.open(station, alert, date_key, value, cleared)
+
+    def open(self, station, alert, date_key, value, cleared):
+        """
+        Raises an alert, or reopens it if it cleared only a short time ago.
+
+        Parameters:
+            station: station name (str)
+            alert: the alert threshold (dict)
+            date_key: the day that crossed the threshold (str)
+            value: the value that crossed it (float)
+            cleared: the day the alert last cleared, or None (str)
+        """
+        key = (station, alert["name"])
+        previous = self.__active.pop(key, None) if cleared is not None else None
+        gap = days_between(cleared, date_key) if previous is not None else None
+        if gap is not None and gap <= self.__merge_days:
+            previous["count"] += 1
+            previous["cleared"] = None
+            self.__active[key] = previous
+            self.update(station, alert, date_key, value)
+            self.emit("merged", previous)
+            return
+        opened = {"station": station, "name": alert["name"], "field": alert["field"], "since": date_key,
+                  "last": date_key, "count": 1, "peak": value, "cleared": None}
+        self.__active[key] = opened
+        self.emit("raised", opened)
+
+    def update(self, station, alert, date_key, value):
+        """
+        Records another day of an open alert without reporting it again.
+
+        Parameters:
+            station: station name (str)
+            alert: the alert threshold (dict)
+            date_key: the day (str)
+            value: the day's value (float)
+        """
+        opened = self.__active[(station, alert["name"])]
+        opened["last"] = date_key
+        if "above" in alert:
+            opened["peak"] = max(opened["peak"], value)
+        else:
+            opened["peak"] = min(opened["peak"], value)
+
+    def revise(self, weather_data, date_key, removed=False):
+        """
+        Works out the days and peak of every open alert of a station again from the
+        stored days, after a day inside the alert arrived late, was corrected or was removed.
+
+        Parameters:
+            weather_data: the station's data (Weather_App_Data)
+            date_key: the late or removed day (str)
+            removed: True if the day was removed, which clears an alert that no stored day
+                     crosses the threshold of any more, default is False (bool)
+        """
+        station = weather_data.get_station()
+        day_keys = weather_data.get_day_keys()
+        days = weather_data.get_list()
+        for bit, alert in enumerate(self.__alerts):
+            opened = self.__active.get((station, alert["name"]))
+            if opened is None or opened["cleared"] is not None or not opened["since"] <= date_key <= opened["last"]:
+                continue
+            field = alert["field"]
+            first = bisect.bisect_left(day_keys, opened["since"])
+            last = bisect.bisect_right(day_keys, opened["last"])
+            values = []
+            for slot in range(first, last):
+                record = days[slot]
+                values.append(record[field] if field in record else Weather_App_Data.derived_values(record)[field])
+            if removed and not any(value >= alert["above"] if "above" in alert else value <= alert["below"]
+                                   for value in values):
+                #the days that raised the alert are gone, so it is cleared without a merge window
+                state = self.__states[station]
+                state[0] &= ~(1 << bit)
+                state[2].pop(bit, None)
+                self.close(station, alert, date_key, None)
+                continue
+            opened["since"] = day_keys[first]
+            opened["last"] = day_keys[last - 1]
+            opened["peak"] = max(values) if "above" in alert else min(values)
+            self.__counts["revised"] += 1
+
+    def close(self, station, alert, date_key, value):
+        """
+        Clears an alert. It is kept for the merge window in case it comes straight back.
+
+        Parameters:
+            station: station name (str)
+            alert: the alert threshold (dict)
+            date_key: the day the value came back, or the removed day (str)
+            value: the day's value, or None if the alert's days were removed (float)
+        """
+        opened = self.__active[(station, alert["name"])]
+        opened["cleared"] = date_key
+        self.emit("cleared", opened)
+
+    def emit(self, kind, alert):
+        """
+        Counts, keeps and passes on an alert event.
+
+        Parameters:
+            kind: "raised", "merged" or "cleared" (str)
+            alert: the alert (dict)
+        """
+        self.__counts[kind] += 1
+        event = dict(alert, event=kind)
+        self.__events.append(event)
+        for listener in self.__listeners:
+            listener(event)
+
+    def get_active(self, station=None):
+        """
+        Returns the alerts that are raised and not cleared.
+
+        Parameters:
+            station: only this station's alerts, default is every station (str)
+        Returns:
+            the open alerts, oldest first (list of dict)
+        """
+        alerts = [alert for (alert_station, _), alert in self.__active.items()
+                  if alert["cleared"] is None and (station is None or alert_station == station)]
+        return sorted(alerts, key=lambda alert: alert["since"])
+
+    def get_events(self):
+        """
+        Returns the most recent alert events.
+        Returns:
+            events, oldest first (list of dict)
+        """
+        return list(self.__events)
+
+    def get_counts(self):
+        """
+        Returns how many alerts were raised, merged and cleared, how many late days were
+        skipped, how many days were removed, and how many open alerts a late or removed day revised.
+        Returns:
+            self.__counts: the counts (dict)
+        """
+        return self.__counts
+
+def days_between(first, last):
+    """
+    Counts the days between two yyyy-mm-dd dates.
+
+    Parameters:
+        first: the earlier date (str)
+        last: the later date (str)
+    Returns:
+        number of days (int) or None if either date does not exist
+    """
+    try:
+        return (datetime.date.fromisoformat(last) - datetime.date.fromisoformat(first)).days
+    except ValueError:
+        return None
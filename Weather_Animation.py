@@ -5,16 +5,37 @@ Program details: An application that provides weather monitoring with a GUI from
                  It will read weather data from a file, automatically updates conditions at set intervals, and
                  dynamically display weather conditions (e.g., Sunny, Rainy, or Snowy).
 '''
+import weakref
 import tkinter as tk
-from PIL import Image, ImageTk
+from PIL import ImageTk
 from Determine_Weather_Condition import Determine_Weather_Condition
+import Weather_Assets
+import Weather_Clock
+
+#Animations that are still alive, counted by the metrics endpoint to spot leaks
+LIVE_ANIMATIONS = weakref.WeakSet()
+#Number of animation frames drawn since the program started
+ANIMATION_STATS = {"frames": 0}
+
+def swing_angle(elapsed):
+    """
+    Works out the rotation of a swinging image from the time since it started.
+    The image starts level, turns 25 degrees a second and swings between -15 and 15 degrees,
+    the same path the old 5 degree steps every 200 ms followed.
+
+    Parameters:
+        elapsed: seconds since the animation started (float)
+    Returns:
+        angle: the rotation in whole degrees (int)
+    """
+    return int(round(Weather_Clock.bounce(15 + 25 * elapsed, -15, 15)))
 
 class WeatherAnimation:
     """
     Creates a default weather animation with a rotating image on a Tkinter canvas.
     Used as a fallback when specific weather condition animations are unavailable.
     """
-    def __init__(self, canvas, x, y):
+    def __init__(self, canvas, x, y, clock=None):
         """
         Initializes the WeatherAnimation with a canvas and position.
 
@@ -22,21 +43,26 @@ class WeatherAnimation:
             canvas: The Tkinter canvas to display the animation (tk.Canvas).
             x: The x-coordinate for the image center (int).
             y: The y-coordinate for the image center (int).
+            clock: The frame clock that drives the animation, default is a 5 fps clock of its own (Frame_Clock).
         """
         #Stores canvas and position
         self.__canvas = canvas
         self.__x = x
         self.__y = y
         #Initializes animation parameters
-        self.__angle = 0        
-        self.__direction = 1  
-        self.__animation_speed = 200
+        self.__angle = 0
+        self.__frames = {} #rotated images already made, keyed by angle
+        self.__fallback = None
+        #Uses the shared frame clock, or its own 5 fps clock like the old 200 ms timer
+        self.__clock = clock or Weather_Clock.Frame_Clock(canvas, fps=5)
         self.__image_item = None
         self.__tk_image = None
+        #Registers the animation so live instances can be counted
+        LIVE_ANIMATIONS.add(self)
        
         #Loads default weather image
         try:
-            img = Image.open("surprise.png").resize((120, 120))
+            img = Weather_Assets.get_image("surprise.png", (120, 120))
             self.__original_image = img
             self.__tk_image = ImageTk.PhotoImage(img)
             self.__image_item = canvas.create_image(x, y, image=self.__tk_image)
@@ -44,32 +70,39 @@ class WeatherAnimation:
             self.__original_image = None
            
         #Starts animation
-        self.animate()
+        if self.__original_image is not None:
+            self.__clock.add_updater(self.animate)
    
-    def animate(self):
+    def animate(self, elapsed):
         """
         Rotates the image back and forth between -15 and 15 degrees.
+
+        Parameters:
+            elapsed: Seconds since the animation started (float).
         """
         #Exits if no image is loaded
         if self.__original_image is None:
             return
-           
-        #Updates rotation angle
-        self.__angle += 5 * self.__direction
-       
-        #Reverses direction at angle limits
-        if self.__angle >= 15:
-            self.__direction = -1
-        elif self.__angle <= -15:
-            self.__direction = 1  
-
-        #Applies rotation and updates canvas
-        rotated_img = self.__original_image.rotate(self.__angle)
-        self.__tk_image = ImageTk.PhotoImage(rotated_img)
+        #Works out the angle from the elapsed time and skips frames where it did not change
+        angle = swing_angle(elapsed)
+        if angle == self.__angle:
+            return
+        self.__angle = angle
+
+        #Applies rotation, reusing images already rotated to this angle, and updates canvas
+        if angle not in self.__frames:
+            self.__frames[angle] = ImageTk.PhotoImage(self.__original_image.rotate(angle))
+        self.__tk_image = self.__frames[angle]
         self.__canvas.itemconfig(self.__image_item, image=self.__tk_image)
-       
-        #Schedules next animation frame
-        self.__canvas.after(self.__animation_speed, self.animate)
+        ANIMATION_STATS["frames"] += 1
+
+    def stop(self):
+        """
+        Stops the animation so the frame clock no longer draws it.
+        """
+        self.__clock.remove_updater(self.animate)
+        if self.__fallback is not None:
+            self.__fallback.stop()
 
     def get_canvas(self):
         """
@@ -112,7 +145,7 @@ class SunnyAnimation:
     """
     Creates an animation for sunny weather with a rotating image on a Tkinter canvas.
     """
-    def __init__(self, canvas, x, y):
+    def __init__(self, canvas, x, y, clock=None):
         """
         Initializes the SunnyAnimation with a canvas and position.
 
@@ -120,6 +153,7 @@ class SunnyAnimation:
             canvas: The Tkinter canvas to display the animation (tk.Canvas).
             x: The x-coordinate for the image center (int).
             y: The y-coordinate for the image center (int).
+            clock: The frame clock that drives the animation, default is a 5 fps clock of its own (Frame_Clock).
         """
         #Stores canvas and position
         self.__canvas = canvas
@@ -127,44 +161,56 @@ class SunnyAnimation:
         self.__y = y
         #Initializes animation parameters
         self.__angle = 0
-        self.__direction = 1
-        self.__animation_speed = 200
+        self.__frames = {} #rotated images already made, keyed by angle
+        self.__fallback = None
+        #Uses the shared frame clock, or its own 5 fps clock like the old 200 ms timer
+        self.__clock = clock or Weather_Clock.Frame_Clock(canvas, fps=5)
         self.__image_item = None
         self.__tk_image = None
+        #Registers the animation so live instances can be counted
+        LIVE_ANIMATIONS.add(self)
        
         #Loads sunny weather image
         try:
-            img = Image.open("sunny.png").resize((120, 120))
+            img = Weather_Assets.get_image("sunny.png", (120, 120))
             self.__original_image = img
             self.__tk_image = ImageTk.PhotoImage(img)
             self.__image_item = canvas.create_image(x, y, image=self.__tk_image)
-            self.animate()
+            self.__clock.add_updater(self.animate)
         except:
             #Falls back to default animation
-            WeatherAnimation(canvas, x, y)
+            self.__fallback = WeatherAnimation(canvas, x, y, clock)
    
-    def animate(self):
+    def animate(self, elapsed):
         """
         Rotates the sunny image back and forth between -15 and 15 degrees.
+
+        Parameters:
+            elapsed: Seconds since the animation started (float).
         """
         #Exits if no image is loaded
         if self.__original_image is None:
             return
-           
-        #Updates rotation angle
-        self.__angle += 5 * self.__direction
-        #Reverses direction at angle limits
-        if self.__angle >= 15:
-            self.__direction = -1
-        elif self.__angle <= -15:
-            self.__direction = 1
-           
-        #Applies rotation and updates canvas
-        rotated_img = self.__original_image.rotate(self.__angle)
-        self.__tk_image = ImageTk.PhotoImage(rotated_img)
+        #Works out the angle from the elapsed time and skips frames where it did not change
+        angle = swing_angle(elapsed)
+        if angle == self.__angle:
+            return
+        self.__angle = angle
+
+        #Applies rotation, reusing images already rotated to this angle, and updates canvas
+        if angle not in self.__frames:
+            self.__frames[angle] = ImageTk.PhotoImage(self.__original_image.rotate(angle))
+        self.__tk_image = self.__frames[angle]
         self.__canvas.itemconfig(self.__image_item, image=self.__tk_image)
-        #Schedules next animation frame
-        self.__canvas.after(self.__animation_speed, self.animate)
+        ANIMATION_STATS["frames"] += 1
+
+    def stop(self):
+        """
+        Stops the animation so the frame clock no longer draws it.
+        """
+        self.__clock.remove_updater(self.animate)
+        if self.__fallback is not None:
+            self.__fallback.stop()
 
     def get_canvas(self):
         """
@@ -207,7 +253,7 @@ class RainyAnimation:
     """
     Creates an animation for rainy weather with a rotating image on a Tkinter canvas.
     """
-    def __init__(self, canvas, x, y):
+    def __init__(self, canvas, x, y, clock=None):
         """
         Initializes the RainyAnimation with a canvas and position.
 
@@ -215,6 +261,7 @@ class RainyAnimation:
             canvas: The Tkinter canvas to display the animation (tk.Canvas).
             x: The x-coordinate for the image center (int).
             y: The y-coordinate for the image center (int).
+            clock: The frame clock that drives the animation, default is a 5 fps clock of its own (Frame_Clock).
         """
         #Stores canvas and position
         self.__canvas = canvas
@@ -222,44 +269,56 @@ class RainyAnimation:
         self.__y = y
         #Initializes animation parameters
         self.__angle = 0
-        self.__direction = 1
-        self.__animation_speed = 200
+        self.__frames = {} #rotated images already made, keyed by angle
+        self.__fallback = None
+        #Uses the shared frame clock, or its own 5 fps clock like the old 200 ms timer
+        self.__clock = clock or Weather_Clock.Frame_Clock(canvas, fps=5)
         self.__image_item = None
         self.__tk_image = None
+        #Registers the animation so live instances can be counted
+        LIVE_ANIMATIONS.add(self)
        
         #Loads rainy weather image
         try:
-            img = Image.open("rainy.png").resize((120, 120))
+            img = Weather_Assets.get_image("rainy.png", (120, 120))
             self.__original_image = img
             self.__tk_image = ImageTk.PhotoImage(img)
             self.__image_item = canvas.create_image(x, y, image=self.__tk_image)
-            self.animate()
+            self.__clock.add_updater(self.animate)
         except:
             #Falls back to default animation
-            WeatherAnimation(canvas, x, y)
+            self.__fallback = WeatherAnimation(canvas, x, y, clock)
    
-    def animate(self):
+    def animate(self, elapsed):
         """
         Rotates the rainy image back and forth between -15 and 15 degrees.
+
+        Parameters:
+            elapsed: Seconds since the animation started (float).
         """
         #Exits if no image is loaded
         if self.__original_image is None:
             return
-           
-        #Updates rotation angle
-        self.__angle += 5 * self.__direction
-        #Reverses direction at angle limits
-        if self.__angle >= 15:
-            self.__direction = -1
-        elif self.__angle <= -15:
-            self.__direction = 1
-           
-        #Applies rotation and updates canvas
-        rotated_img = self.__original_image.rotate(self.__angle)
-        self.__tk_image = ImageTk.PhotoImage(rotated_img)
+        #Works out the angle from the elapsed time and skips frames where it did not change
+        angle = swing_angle(elapsed)
+        if angle == self.__angle:
+            return
+        self.__angle = angle
+
+        #Applies rotation, reusing images already rotated to this angle, and updates canvas
+        if angle not in self.__frames:
+            self.__frames[angle] = ImageTk.PhotoImage(self.__original_image.rotate(angle))
+        self.__tk_image = self.__frames[angle]
         self.__canvas.itemconfig(self.__image_item, image=self.__tk_image)
-        #Schedules next animation frame
-        self.__canvas.after(self.__animation_speed, self.animate)
+        ANIMATION_STATS["frames"] += 1
+
+    def stop(self):
+        """
+        Stops the animation so the frame clock no longer draws it.
+        """
+        self.__clock.remove_updater(self.animate)
+        if self.__fallback is not None:
+            self.__fallback.stop()
 
     def get_canvas(self):
         """
@@ -302,7 +361,7 @@ class SnowyAnimation:
     """
     Creates an animation for snowy weather with a rotating image on a Tkinter canvas.
     """
-    def __init__(self, canvas, x, y):
+    def __init__(self, canvas, x, y, clock=None):
         """
         Initializes the SnowyAnimation with a canvas and position.
 
@@ -310,6 +369,7 @@ class SnowyAnimation:
             canvas: The Tkinter canvas to display the animation (tk.Canvas).
             x: The x-coordinate for the image center (int).
             y: The y-coordinate for the image center (int).
+            clock: The frame clock that drives the animation, default is a 5 fps clock of its own (Frame_Clock).
         """
         #Stores canvas and position
         self.__canvas = canvas
@@ -317,44 +377,56 @@ class SnowyAnimation:
         self.__y = y
         #Initializes animation parameters
         self.__angle = 0
-        self.__direction = 1
-        self.__animation_speed = 200
+        self.__frames = {} #rotated images already made, keyed by angle
+        self.__fallback = None
+        #Uses the shared frame clock, or its own 5 fps clock like the old 200 ms timer
+        self.__clock = clock or Weather_Clock.Frame_Clock(canvas, fps=5)
         self.__image_item = None
         self.__tk_image = None
+        #Registers the animation so live instances can be counted
+        LIVE_ANIMATIONS.add(self)
        
         #Loads snowy weather image
         try:
-            img = Image.open("snowy.png").resize((120, 120))
+            img = Weather_Assets.get_image("snowy.png", (120, 120))
             self.__original_image = img
             self.__tk_image = ImageTk.PhotoImage(img)
             self.__image_item = canvas.create_image(x, y, image=self.__tk_image)
-            self.animate()
+            self.__clock.add_updater(self.animate)
         except:
             #Falls back to default animation
-            WeatherAnimation(canvas, x, y)
+            self.__fallback = WeatherAnimation(canvas, x, y, clock)
    
-    def animate(self):
+    def animate(self, elapsed):
         """
         Rotates the snowy image back and forth between -15 and 15 degrees.
+
+        Parameters:
+            elapsed: Seconds since the animation started (float).
         """
         #Exits if no image is loaded
         if self.__original_image is None:
             return
-           
-        #Updates rotation angle
-        self.__angle += 5 * self.__direction
-        #Reverses direction at angle limits
-        if self.__angle >= 15:
-            self.__direction = -1
-        elif self.__angle <= -15:
-            self.__direction = 1
-           
-        #Applies rotation and updates canvas
-        rotated_img = self.__original_image.rotate(self.__angle)
-        self.__tk_image = ImageTk.PhotoImage(rotated_img)
+        #Works out the angle from the elapsed time and skips frames where it did not change
+        angle = swing_angle(elapsed)
+        if angle == self.__angle:
+            return
+        self.__angle = angle
+
+        #Applies rotation, reusing images already rotated to this angle, and updates canvas
+        if angle not in self.__frames:
+            self.__frames[angle] = ImageTk.PhotoImage(self.__original_image.rotate(angle))
+        self.__tk_image = self.__frames[angle]
         self.__canvas.itemconfig(self.__image_item, image=self.__tk_image)
-        #Schedules next animation frame
-        self.__canvas.after(self.__animation_speed, self.animate)
+        ANIMATION_STATS["frames"] += 1
+
+    def stop(self):
+        """
+        Stops the animation so the frame clock no longer draws it.
+        """
+        self.__clock.remove_updater(self.animate)
+        if self.__fallback is not None:
+            self.__fallback.stop()
 
     def get_canvas(self):
         """
@@ -397,7 +469,7 @@ class WindyAnimation:
     """
     Creates an animation for windy weather with a rotating image on a Tkinter canvas.
     """
-    def __init__(self, canvas, x, y):
+    def __init__(self, canvas, x, y, clock=None):
         """
         Initializes the WindyAnimation with a canvas and position.
 
@@ -405,6 +477,7 @@ class WindyAnimation:
             canvas: The Tkinter canvas to display the animation (tk.Canvas).
             x: The x-coordinate for the image center (int).
             y: The y-coordinate for the image center (int).
+            clock: The frame clock that drives the animation, default is a 5 fps clock of its own (Frame_Clock).
         """
         #Stores canvas and position
         self.__canvas = canvas
@@ -412,44 +485,56 @@ class WindyAnimation:
         self.__y = y
         #Initializes animation parameters
         self.__angle = 0
-        self.__direction = 1
-        self.__animation_speed = 200
+        self.__frames = {} #rotated images already made, keyed by angle
+        self.__fallback = None
+        #Uses the shared frame clock, or its own 5 fps clock like the old 200 ms timer
+        self.__clock = clock or Weather_Clock.Frame_Clock(canvas, fps=5)
         self.__image_item = None
         self.__tk_image = None
+        #Registers the animation so live instances can be counted
+        LIVE_ANIMATIONS.add(self)
        
         #Loads windy weather image
         try:
-            img = Image.open("windy.png").resize((120, 120))
+            img = Weather_Assets.get_image("windy.png", (120, 120))
             self.__original_image = img
             self.__tk_image = ImageTk.PhotoImage(img)
             self.__image_item = canvas.create_image(x, y, image=self.__tk_image)
-            self.animate()
+            self.__clock.add_updater(self.animate)
         except:
             #Falls back to default animation
-            WeatherAnimation(canvas, x, y)
+            self.__fallback = WeatherAnimation(canvas, x, y, clock)
    
-    def animate(self):
+    def animate(self, elapsed):
         """
         Rotates the windy image back and forth between -15 and 15 degrees.
+
+        Parameters:
+            elapsed: Seconds since the animation started (float).
         """
         #Exits if no image is loaded
         if self.__original_image is None:
             return
-           
-        #Updates rotation angle
-        self.__angle += 5 * self.__direction
-        #Reverses direction at angle limits
-        if self.__angle >= 15:
-            self.__direction = -1
-        elif self.__angle <= -15:
-            self.__direction = 1
-           
-        #Applies rotation and updates canvas
-        rotated_img = self.__original_image.rotate(self.__angle)
-        self.__tk_image = ImageTk.PhotoImage(rotated_img)
+        #Works out the angle from the elapsed time and skips frames where it did not change
+        angle = swing_angle(elapsed)
+        if angle == self.__angle:
+            return
+        self.__angle = angle
+
+        #Applies rotation, reusing images already rotated to this angle, and updates canvas
+        if angle not in self.__frames:
+            self.__frames[angle] = ImageTk.PhotoImage(self.__original_image.rotate(angle))
+        self.__tk_image = self.__frames[angle]
         self.__canvas.itemconfig(self.__image_item, image=self.__tk_image)
-        #Schedules next animation frame
-        self.__canvas.after(self.__animation_speed, self.animate)
+        ANIMATION_STATS["frames"] += 1
+
+    def stop(self):
+        """
+        Stops the animation so the frame clock no longer draws it.
+        """
+        self.__clock.remove_updater(self.animate)
+        if self.__fallback is not None:
+            self.__fallback.stop()
 
     def get_canvas(self):
         """
@@ -492,7 +577,7 @@ class StormyAnimation:
     """
     Creates an animation for stormy weather with a rotating image on a Tkinter canvas.
     """
-    def __init__(self, canvas, x, y):
+    def __init__(self, canvas, x, y, clock=None):
         """
         Initializes the StormyAnimation with a canvas and position.
 
@@ -500,6 +585,7 @@ class StormyAnimation:
             canvas: The Tkinter canvas to display the animation (tk.Canvas).
             x: The x-coordinate for the image center (int).
             y: The y-coordinate for the image center (int).
+            clock: The frame clock that drives the animation, default is a 5 fps clock of its own (Frame_Clock).
         """
         #Stores canvas and position
         self.__canvas = canvas
@@ -507,44 +593,56 @@ class StormyAnimation:
         self.__y = y
         #Initializes animation parameters
         self.__angle = 0
-        self.__direction = 1
-        self.__animation_speed = 200
+        self.__frames = {} #rotated images already made, keyed by angle
+        self.__fallback = None
+        #Uses the shared frame clock, or its own 5 fps clock like the old 200 ms timer
+        self.__clock = clock or Weather_Clock.Frame_Clock(canvas, fps=5)
         self.__image_item = None
         self.__tk_image = None
+        #Registers the animation so live instances can be counted
+        LIVE_ANIMATIONS.add(self)
        
         #Loads stormy weather image
         try:
-            img = Image.open("stormy.png").resize((120, 120))
+            img = Weather_Assets.get_image("stormy.png", (120, 120))
             self.__original_image = img
             self.__tk_image = ImageTk.PhotoImage(img)
             self.__image_item = canvas.create_image(x, y, image=self.__tk_image)
-            self.animate()
+            self.__clock.add_updater(self.animate)
         except:
             #Falls back to default animation
-            WeatherAnimation(canvas, x, y)
+            self.__fallback = WeatherAnimation(canvas, x, y, clock)
    
-    def animate(self):
+    def animate(self, elapsed):
         """
         Rotates the stormy image back and forth between -15 and 15 degrees.
+
+        Parameters:
+            elapsed: Seconds since the animation started (float).
         """
         #Exits if no image is loaded
         if self.__original_image is None:
             return
-           
-        #Updates rotation angle
-        self.__angle += 5 * self.__direction
-        #Reverses direction at angle limits
-        if self.__angle >= 15:
-            self.__direction = -1
-        elif self.__angle <= -15:
-            self.__direction = 1
-           
-        #Applies rotation and updates canvas
-        rotated_img = self.__original_image.rotate(self.__angle)
-        self.__tk_image = ImageTk.PhotoImage(rotated_img)
+        #Works out the angle from the elapsed time and skips frames where it did not change
+        angle = swing_angle(elapsed)
+        if angle == self.__angle:
+            return
+        self.__angle = angle
+
+        #Applies rotation, reusing images already rotated to this angle, and updates canvas
+        if angle not in self.__frames:
+            self.__frames[angle] = ImageTk.PhotoImage(self.__original_image.rotate(angle))
+        self.__tk_image = self.__frames[angle]
         self.__canvas.itemconfig(self.__image_item, image=self.__tk_image)
-        #Schedules next animation frame
-        self.__canvas.after(self.__animation_speed, self.animate)
+        ANIMATION_STATS["frames"] += 1
+
+    def stop(self):
+        """
+        Stops the animation so the frame clock no longer draws it.
+        """
+        self.__clock.remove_updater(self.animate)
+        if self.__fallback is not None:
+            self.__fallback.stop()
 
     def get_canvas(self):
         """
@@ -587,7 +685,7 @@ class TornadoAnimation:
     """
     Creates an animation for tornado weather with a rotating image on a Tkinter canvas.
     """
-    def __init__(self, canvas, x, y):
+    def __init__(self, canvas, x, y, clock=None):
         """
         Initializes the TornadoAnimation with a canvas and position.
 
@@ -595,6 +693,7 @@ class TornadoAnimation:
             canvas: The Tkinter canvas to display the animation (tk.Canvas).
             x: The x-coordinate for the image center (int).
             y: The y-coordinate for the image center (int).
+            clock: The frame clock that drives the animation, default is a 5 fps clock of its own (Frame_Clock).
         """
         #Stores canvas and position
         self.__canvas = canvas
@@ -602,44 +701,56 @@ class TornadoAnimation:
         self.__y = y
         #Initializes animation parameters
         self.__angle = 0
-        self.__direction = 1
-        self.__animation_speed = 200
+        self.__frames = {} #rotated images already made, keyed by angle
+        self.__fallback = None
+        #Uses the shared frame clock, or its own 5 fps clock like the old 200 ms timer
+        self.__clock = clock or Weather_Clock.Frame_Clock(canvas, fps=5)
         self.__image_item = None
         self.__tk_image = None
+        #Registers the animation so live instances can be counted
+        LIVE_ANIMATIONS.add(self)
        
         #Loads tornado weather image
         try:
-            img = Image.open("tornado.png").resize((120, 120))
+            img = Weather_Assets.get_image("tornado.png", (120, 120))
             self.__original_image = img
             self.__tk_image = ImageTk.PhotoImage(img)
             self.__image_item = canvas.create_image(x, y, image=self.__tk_image)
-            self.animate()
+            self.__clock.add_updater(self.animate)
         except:
             #Falls back to default animation
-            WeatherAnimation(canvas, x, y)
+            self.__fallback = WeatherAnimation(canvas, x, y, clock)
    
-    def animate(self):
+    def animate(self, elapsed):
         """
         Rotates the tornado image back and forth between -15 and 15 degrees.
+
+        Parameters:
+            elapsed: Seconds since the animation started (float).
         """
         #Exits if no image is loaded
         if self.__original_image is None:
             return
-           
-        #Updates rotation angle
-        self.__angle += 5 * self.__direction
-        #Reverses direction at angle limits
-        if self.__angle >= 15:
-            self.__direction = -1
-        elif self.__angle <= -15:
-            self.__direction = 1
-           
-        #Applies rotation and updates canvas
-        rotated_img = self.__original_image.rotate(self.__angle)
-        self.__tk_image = ImageTk.PhotoImage(rotated_img)
+        #Works out the angle from the elapsed time and skips frames where it did not change
+        angle = swing_angle(elapsed)
+        if angle == self.__angle:
+            return
+        self.__angle = angle
+
+        #Applies rotation, reusing images already rotated to this angle, and updates canvas
+        if angle not in self.__frames:
+            self.__frames[angle] = ImageTk.PhotoImage(self.__original_image.rotate(angle))
+        self.__tk_image = self.__frames[angle]
         self.__canvas.itemconfig(self.__image_item, image=self.__tk_image)
-        #Schedules next animation frame
-        self.__canvas.after(self.__animation_speed, self.animate)
+        ANIMATION_STATS["frames"] += 1
+
+    def stop(self):
+        """
+        Stops the animation so the frame clock no longer draws it.
+        """
+        self.__clock.remove_updater(self.animate)
+        if self.__fallback is not None:
+            self.__fallback.stop()
 
     def get_canvas(self):
         """
@@ -682,7 +793,7 @@ class SevereWindstormAnimation:
     """
     Creates an animation for severe windstorm weather with a rotating image on a Tkinter canvas.
     """
-    def __init__(self, canvas, x, y):
+    def __init__(self, canvas, x, y, clock=None):
         """
         Initializes the SevereWindstormAnimation with a canvas and position.
 
@@ -690,6 +801,7 @@ class SevereWindstormAnimation:
             canvas: The Tkinter canvas to display the animation (tk.Canvas).
             x: The x-coordinate for the image center (int).
             y: The y-coordinate for the image center (int).
+            clock: The frame clock that drives the animation, default is a 5 fps clock of its own (Frame_Clock).
         """
         #Stores canvas and position
         self.__canvas = canvas
@@ -697,44 +809,56 @@ class SevereWindstormAnimation:
         self.__y = y
         #Initializes animation parameters
         self.__angle = 0
-        self.__direction = 1
-        self.__animation_speed = 200
+        self.__frames = {} #rotated images already made, keyed by angle
+        self.__fallback = None
+        #Uses the shared frame clock, or its own 5 fps clock like the old 200 ms timer
+        self.__clock = clock or Weather_Clock.Frame_Clock(canvas, fps=5)
         self.__image_item = None
         self.__tk_image = None
+        #Registers the animation so live instances can be counted
+        LIVE_ANIMATIONS.add(self)
        
         #Loads severe windstorm image
         try:
-            img = Image.open("severe_windstorm.png").resize((120, 120))
+            img = Weather_Assets.get_image("severe_windstorm.png", (120, 120))
             self.__original_image = img
             self.__tk_image = ImageTk.PhotoImage(img)
             self.__image_item = canvas.create_image(x, y, image=self.__tk_image)
-            self.animate()
+            self.__clock.add_updater(self.animate)
         except:
             #Falls back to default animation
-            WeatherAnimation(canvas, x, y)
+            self.__fallback = WeatherAnimation(canvas, x, y, clock)
    
-    def animate(self):
+    def animate(self, elapsed):
         """
         Rotates the severe windstorm image back and forth between -15 and 15 degrees.
+
+        Parameters:
+            elapsed: Seconds since the animation started (float).
         """
         #Exits if no image is loaded
         if self.__original_image is None:
             return
-           
-        #Updates rotation angle
-        self.__angle += 5 * self.__direction
-        #Reverses direction at angle limits
-        if self.__angle >= 15:
-            self.__direction = -1
-        elif self.__angle <= -15:
-            self.__direction = 1
-           
-        #Applies rotation and updates canvas
-        rotated_img = self.__original_image.rotate(self.__angle)
-        self.__tk_image = ImageTk.PhotoImage(rotated_img)
+        #Works out the angle from the elapsed time and skips frames where it did not change
+        angle = swing_angle(elapsed)
+        if angle == self.__angle:
+            return
+        self.__angle = angle
+
+        #Applies rotation, reusing images already rotated to this angle, and updates canvas
+        if angle not in self.__frames:
+            self.__frames[angle] = ImageTk.PhotoImage(self.__original_image.rotate(angle))
+        self.__tk_image = self.__frames[angle]
         self.__canvas.itemconfig(self.__image_item, image=self.__tk_image)
-        #Schedules next animation frame
-        self.__canvas.after(self.__animation_speed, self.animate)
+        ANIMATION_STATS["frames"] += 1
+
+    def stop(self):
+        """
+        Stops the animation so the frame clock no longer draws it.
+        """
+        self.__clock.remove_updater(self.animate)
+        if self.__fallback is not None:
+            self.__fallback.stop()
 
     def get_canvas(self):
         """
@@ -777,7 +901,7 @@ class HurricaneAnimation:
     """
     Creates an animation for hurricane weather with a rotating image on a Tkinter canvas.
     """
-    def __init__(self, canvas, x, y):
+    def __init__(self, canvas, x, y, clock=None):
         """
         Initializes the HurricaneAnimation with a canvas and position.
 
@@ -785,6 +909,7 @@ class HurricaneAnimation:
             canvas: The Tkinter canvas to display the animation (tk.Canvas).
             x: The x-coordinate for the image center (int).
             y: The y-coordinate for the image center (int).
+            clock: The frame clock that drives the animation, default is a 5 fps clock of its own (Frame_Clock).
         """
         #Stores canvas and position
         self.__canvas = canvas
@@ -792,44 +917,56 @@ class HurricaneAnimation:
         self.__y = y
         #Initializes animation parameters
         self.__angle = 0
-        self.__direction = 1
-        self.__animation_speed = 200
+        self.__frames = {} #rotated images already made, keyed by angle
+        self.__fallback = None
+        #Uses the shared frame clock, or its own 5 fps clock like the old 200 ms timer
+        self.__clock = clock or Weather_Clock.Frame_Clock(canvas, fps=5)
         self.__image_item = None
         self.__tk_image = None
+        #Registers the animation so live instances can be counted
+        LIVE_ANIMATIONS.add(self)
        
         #Loads hurricane weather image
         try:
-            img = Image.open("hurricane.png").resize((120, 120))
+            img = Weather_Assets.get_image("hurricane.png", (120, 120))
             self.__original_image = img
             self.__tk_image = ImageTk.PhotoImage(img)
             self.__image_item = canvas.create_image(x, y, image=self.__tk_image)
-            self.animate()
+            self.__clock.add_updater(self.animate)
         except:
             #Falls back to default animation
-            WeatherAnimation(canvas, x, y)
+            self.__fallback = WeatherAnimation(canvas, x, y, clock)
    
-    def animate(self):
+    def animate(self, elapsed):
         """
         Rotates the hurricane image back and forth between -15 and 15 degrees.
+
+        Parameters:
+            elapsed: Seconds since the animation started (float).
         """
         #Exits if no image is loaded
         if self.__original_image is None:
             return
-           
-        #Updates rotation angle
-        self.__angle += 5 * self.__direction
-        #Reverses direction at angle limits
-        if self.__angle >= 15:
-            self.__direction = -1
-        elif self.__angle <= -15:
-            self.__direction = 1
-           
-        #Applies rotation and updates canvas
-        rotated_img = self.__original_image.rotate(self.__angle)
-        self.__tk_image = ImageTk.PhotoImage(rotated_img)
+        #Works out the angle from the elapsed time and skips frames where it did not change
+        angle = swing_angle(elapsed)
+        if angle == self.__angle:
+            return
+        self.__angle = angle
+
+        #Applies rotation, reusing images already rotated to this angle, and updates canvas
+        if angle not in self.__frames:
+            self.__frames[angle] = ImageTk.PhotoImage(self.__original_image.rotate(angle))
+        self.__tk_image = self.__frames[angle]
         self.__canvas.itemconfig(self.__image_item, image=self.__tk_image)
-        #Schedules next animation frame
-        self.__canvas.after(self.__animation_speed, self.animate)
+        ANIMATION_STATS["frames"] += 1
+
+    def stop(self):
+        """
+        Stops the animation so the frame clock no longer draws it.
+        """
+        self.__clock.remove_updater(self.animate)
+        if self.__fallback is not None:
+            self.__fallback.stop()
 
     def get_canvas(self):
         """
@@ -872,7 +1009,7 @@ class ExtremeColdAnimation:
     """
     Creates an animation for extreme cold weather with a rotating image on a Tkinter canvas.
     """
-    def __init__(self, canvas, x, y):
+    def __init__(self, canvas, x, y, clock=None):
         """
         Initializes the ExtremeColdAnimation with a canvas and position.
 
@@ -880,6 +1017,7 @@ class ExtremeColdAnimation:
             canvas: The Tkinter canvas to display the animation (tk.Canvas).
             x: The x-coordinate for the image center (int).
             y: The y-coordinate for the image center (int).
+            clock: The frame clock that drives the animation, default is a 5 fps clock of its own (Frame_Clock).
         """
         #Stores canvas and position
         self.__canvas = canvas
@@ -887,43 +1025,56 @@ class ExtremeColdAnimation:
         self.__y = y
         #Initializes animation parameters
         self.__angle = 0
-        self.__direction = 1
-        self.__animation_speed = 200
+        self.__frames = {} #rotated images already made, keyed by angle
+        self.__fallback = None
+        #Uses the shared frame clock, or its own 5 fps clock like the old 200 ms timer
+        self.__clock = clock or Weather_Clock.Frame_Clock(canvas, fps=5)
         self.__image_item = None
         self.__tk_image = None
+        #Registers the animation so live instances can be counted
+        LIVE_ANIMATIONS.add(self)
        
         #Loads extreme cold image
         try:
-            img = Image.open("extreme_cold.png").resize((120, 120))
+            img = Weather_Assets.get_image("extreme_cold.png", (120, 120))
             self.__original_image = img
             self.__tk_image = ImageTk.PhotoImage(img)
             self.__image_item = canvas.create_image(x, y, image=self.__tk_image)
-            self.animate()
+            self.__clock.add_updater(self.animate)
         except:
             #Falls back to default animation
-            WeatherAnimation(canvas, x, y)
+            self.__fallback = WeatherAnimation(canvas, x, y, clock)
    
-    def animate(self):
+    def animate(self, elapsed):
         """
         Rotates the extreme cold image back and forth between -15 and 15 degrees.
+
+        Parameters:
+            elapsed: Seconds since the animation started (float).
         """
         #Exits if no image is loaded
         if self.__original_image is None:
             return
-        #Updates rotation angle
-        self.__angle += 5 * self.__direction
-        #Reverses direction at angle limits
-        if self.__angle >= 15:
-            self.__direction = -1
-        elif self.__angle <= -15:
-            self.__direction = 1
-           
-        #Applies rotation and updates canvas
-        rotated_img = self.__original_image.rotate(self.__angle)
-        self.__tk_image = ImageTk.PhotoImage(rotated_img)
+        #Works out the angle from the elapsed time and skips frames where it did not change
+        angle = swing_angle(elapsed)
+        if angle == self.__angle:
+            return
+        self.__angle = angle
+
+        #Applies rotation, reusing images already rotated to this angle, and updates canvas
+        if angle not in self.__frames:
+            self.__frames[angle] = ImageTk.PhotoImage(self.__original_image.rotate(angle))
+        self.__tk_image = self.__frames[angle]
         self.__canvas.itemconfig(self.__image_item, image=self.__tk_image)
-        #Schedules next animation frame
-        self.__canvas.after(self.__animation_speed, self.animate)
+        ANIMATION_STATS["frames"] += 1
+
+    def stop(self):
+        """
+        Stops the animation so the frame clock no longer draws it.
+        """
+        self.__clock.remove_updater(self.animate)
+        if self.__fallback is not None:
+            self.__fallback.stop()
 
     def get_canvas(self):
         """
@@ -966,7 +1117,7 @@ class ExtremeHeatAnimation:
     """
     Creates an animation for extreme heat weather with a rotating image on a Tkinter canvas.
     """
-    def __init__(self, canvas, x, y):
+    def __init__(self, canvas, x, y, clock=None):
         """
         Initializes the ExtremeHeatAnimation with a canvas and position.
 
@@ -974,6 +1125,7 @@ class ExtremeHeatAnimation:
             canvas: The Tkinter canvas to display the animation (tk.Canvas).
             x: The x-coordinate for the image center (int).
             y: The y-coordinate for the image center (int).
+            clock: The frame clock that drives the animation, default is a 5 fps clock of its own (Frame_Clock).
         """
         #Stores canvas and position
         self.__canvas = canvas
@@ -981,44 +1133,56 @@ class ExtremeHeatAnimation:
         self.__y = y
         #Initializes animation parameters
         self.__angle = 0
-        self.__direction = 1
-        self.__animation_speed = 200
+        self.__frames = {} #rotated images already made, keyed by angle
+        self.__fallback = None
+        #Uses the shared frame clock, or its own 5 fps clock like the old 200 ms timer
+        self.__clock = clock or Weather_Clock.Frame_Clock(canvas, fps=5)
         self.__image_item = None
         self.__tk_image = None
+        #Registers the animation so live instances can be counted
+        LIVE_ANIMATIONS.add(self)
        
         #Loads extreme heat image
         try:
-            img = Image.open("extreme_heat.png").resize((120, 120))
+            img = Weather_Assets.get_image("extreme_heat.png", (120, 120))
             self.__original_image = img
             self.__tk_image = ImageTk.PhotoImage(img)
             self.__image_item = canvas.create_image(x, y, image=self.__tk_image)
-            self.animate()
+            self.__clock.add_updater(self.animate)
         except:
             #Falls back to default animation
-            WeatherAnimation(canvas, x, y)
+            self.__fallback = WeatherAnimation(canvas, x, y, clock)
    
-    def animate(self):
+    def animate(self, elapsed):
         """
         Rotates the extreme heat image back and forth between -15 and 15 degrees.
+
+        Parameters:
+            elapsed: Seconds since the animation started (float).
         """
         #Exits if no image is loaded
         if self.__original_image is None:
             return
-           
-        #Updates rotation angle
-        self.__angle += 5 * self.__direction
-        #Reverses direction at angle limits
-        if self.__angle >= 15:
-            self.__direction = -1
-        elif self.__angle <= -15:
-            self.__direction = 1
-           
-        #Applies rotation and updates canvas
-        rotated_img = self.__original_image.rotate(self.__angle)
-        self.__tk_image = ImageTk.PhotoImage(rotated_img)
+        #Works out the angle from the elapsed time and skips frames where it did not change
+        angle = swing_angle(elapsed)
+        if angle == self.__angle:
+            return
+        self.__angle = angle
+
+        #Applies rotation, reusing images already rotated to this angle, and updates canvas
+        if angle not in self.__frames:
+            self.__frames[angle] = ImageTk.PhotoImage(self.__original_image.rotate(angle))
+        self.__tk_image = self.__frames[angle]
         self.__canvas.itemconfig(self.__image_item, image=self.__tk_image)
-        #Schedules next animation frame
-        self.__canvas.after(self.__animation_speed, self.animate)
+        ANIMATION_STATS["frames"] += 1
+
+    def stop(self):
+        """
+        Stops the animation so the frame clock no longer draws it.
+        """
+        self.__clock.remove_updater(self.animate)
+        if self.__fallback is not None:
+            self.__fallback.stop()
 
     def get_canvas(self):
         """
@@ -1061,7 +1225,7 @@ class ExtremelyHumidAnimation:
     """
     Creates an animation for extremely humid weather with a rotating image on a Tkinter canvas.
     """
-    def __init__(self, canvas, x, y):
+    def __init__(self, canvas, x, y, clock=None):
         """
         Initializes the ExtremelyHumidAnimation with a canvas and position.
 
@@ -1069,6 +1233,7 @@ class ExtremelyHumidAnimation:
             canvas: The Tkinter canvas to display the animation (tk.Canvas).
             x: The x-coordinate for the image center (int).
             y: The y-coordinate for the image center (int).
+            clock: The frame clock that drives the animation, default is a 5 fps clock of its own (Frame_Clock).
         """
         #Stores canvas and position
         self.__canvas = canvas
@@ -1076,44 +1241,56 @@ class ExtremelyHumidAnimation:
         self.__y = y
         #Initializes animation parameters
         self.__angle = 0
-        self.__direction = 1
-        self.__animation_speed = 200
+        self.__frames = {} #rotated images already made, keyed by angle
+        self.__fallback = None
+        #Uses the shared frame clock, or its own 5 fps clock like the old 200 ms timer
+        self.__clock = clock or Weather_Clock.Frame_Clock(canvas, fps=5)
         self.__image_item = None
         self.__tk_image = None
+        #Registers the animation so live instances can be counted
+        LIVE_ANIMATIONS.add(self)
        
         #Loads extremely humid image
         try:
-            img = Image.open("extremely_humid.png").resize((120, 120))
+            img = Weather_Assets.get_image("extremely_humid.png", (120, 120))
             self.__original_image = img
             self.__tk_image = ImageTk.PhotoImage(img)
             self.__image_item = canvas.create_image(x, y, image=self.__tk_image)
-            self.animate()
+            self.__clock.add_updater(self.animate)
         except:
             #Falls back to default animation
-            WeatherAnimation(canvas, x, y)
+            self.__fallback = WeatherAnimation(canvas, x, y, clock)
    
-    def animate(self):
+    def animate(self, elapsed):
         """
         Rotates the extremely humid image back and forth between -15 and 15 degrees.
+
+        Parameters:
+            elapsed: Seconds since the animation started (float).
         """
         #Exits if no image is loaded
         if self.__original_image is None:
             return
-           
-        #Updates rotation angle
-        self.__angle += 5 * self.__direction
-        #Reverses direction at angle limits
-        if self.__angle >= 15:
-            self.__direction = -1
-        elif self.__angle <= -15:
-            self.__direction = 1
-           
-        #Applies rotation and updates canvas
-        rotated_img = self.__original_image.rotate(self.__angle)
-        self.__tk_image = ImageTk.PhotoImage(rotated_img)
+        #Works out the angle from the elapsed time and skips frames where it did not change
+        angle = swing_angle(elapsed)
+        if angle == self.__angle:
+            return
+        self.__angle = angle
+
+        #Applies rotation, reusing images already rotated to this angle, and updates canvas
+        if angle not in self.__frames:
+            self.__frames[angle] = ImageTk.PhotoImage(self.__original_image.rotate(angle))
+        self.__tk_image = self.__frames[angle]
         self.__canvas.itemconfig(self.__image_item, image=self.__tk_image)
-        #Schedules next animation frame
-        self.__canvas.after(self.__animation_speed, self.animate)
+        ANIMATION_STATS["frames"] += 1
+
+    def stop(self):
+        """
+        Stops the animation so the frame clock no longer draws it.
+        """
+        self.__clock.remove_updater(self.animate)
+        if self.__fallback is not None:
+            self.__fallback.stop()
 
     def get_canvas(self):
         """
@@ -1152,7 +1329,7 @@ class ExtremelyHumidAnimation:
         return self.__image_item
 
 
-def create_weather_animation(condition, canvas, x=150, y=250):
+def create_weather_animation(condition, canvas, x=150, y=250, clock=None):
     """
     Creates an animation object based on the specified weather condition.
 
@@ -1161,6 +1338,7 @@ def create_weather_animation(condition, canvas, x=150, y=250):
         canvas: The Tkinter canvas to display the animation (tk.Canvas).
         x: The x-coordinate for the image center, default is 150 (int).
         y: The y-coordinate for the image center, default is 250 (int).
+        clock: The frame clock that drives the animation, default is None for a clock of its own (Frame_Clock).
 
     Returns:
         animation: An instance of the appropriate animation class (object).
@@ -1169,27 +1347,27 @@ def create_weather_animation(condition, canvas, x=150, y=250):
     print("Animation condition:", condition)
     #Selects animation based on condition
     if "Sunny!" in condition:
-        return SunnyAnimation(canvas, x, y)
+        return SunnyAnimation(canvas, x, y, clock)
     elif "Rainy!" in condition:
-        return RainyAnimation(canvas, x, y)
+        return RainyAnimation(canvas, x, y, clock)
     elif "Snowy!" in condition:
-        return SnowyAnimation(canvas, x, y)
+        return SnowyAnimation(canvas, x, y, clock)
     elif "Windy!" in condition:
-        return WindyAnimation(canvas, x, y)
+        return WindyAnimation(canvas, x, y, clock)
     elif "Stormy!" in condition:
-        return StormyAnimation(canvas, x, y)
+        return StormyAnimation(canvas, x, y, clock)
     elif "Tornado!" in condition:
-        return TornadoAnimation(canvas, x, y)
+        return TornadoAnimation(canvas, x, y, clock)
     elif "Severe Windstorm!" in condition:
-        return SevereWindstormAnimation(canvas, x, y)
+        return SevereWindstormAnimation(canvas, x, y, clock)
     elif "Hurricane!" in condition:
-        return HurricaneAnimation(canvas, x, y)
+        return HurricaneAnimation(canvas, x, y, clock)
     elif "Extreme Cold!" in condition:
-        return ExtremeColdAnimation(canvas, x, y)
+        return ExtremeColdAnimation(canvas, x, y, clock)
     elif "Extreme Heat!" in condition:
-        return ExtremeHeatAnimation(canvas, x, y)
+        return ExtremeHeatAnimation(canvas, x, y, clock)
     elif "Dew Point!" in condition:
-        return ExtremelyHumidAnimation(canvas, x, y)
+        return ExtremelyHumidAnimation(canvas, x, y, clock)
     else:
         #Falls back to default animation
-        return WeatherAnimation(canvas, x, y)
\ No newline at end of file
+        return WeatherAnimation(canvas, x, y, clock)
\ No newline at end of file
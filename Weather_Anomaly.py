@@ -0,0 +1,203 @@
+'''
+Name: Eric and Sanvi
+Last modified: May 21, 2025
+Program details: An application that provides weather monitoring with a GUI from tkinter package.
+                 It will read weather data from a file, automatically updates conditions at set intervals, and
+                 dynamically display weather conditions (e.g., Sunny, Rainy, or Snowy).
+
+Flags days whose values are far from what is normal for the station on that calendar day.
+'''
+import collections
+import math
+import Weather_App_Data
+
+#Fields that are checked, measured and derived
+ANOMALY_FIELDS = Weather_App_Data.NUMERIC_FIELDS + Weather_App_Data.DERIVED_FIELDS
+
+class Welford():
+    """
+    Running mean and variance with Welford's method, which stays accurate over long
+    streams. A value can also be taken out again when a day is corrected.
+    """
+    __slots__ = ("count", "mean", "m2")
+
+    def __init__(self):
+        """
+        Initializes an empty Welford.
+        """
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0 #sum of squared differences from the mean
+
+    def add(self, value):
+        """
+        Adds a value.
+
+        Parameters:
+            value: the value (float)
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def remove(self, value):
+        """
+        Takes out a value that was added before.
+
+        Parameters:
+            value: the value (float)
+        """
+        if self.count <= 1:
+            self.count = 0
+            self.mean = 0.0
+            self.m2 = 0.0
+            return
+        delta = value - self.mean
+        self.count -= 1
+        self.mean -= delta / self.count
+        self.m2 = max(0.0, self.m2 - delta * (value - self.mean))
+
+    def get_std(self):
+        """
+        Returns the sample standard deviation.
+        Returns:
+            standard deviation (float), 0 with fewer than two values
+        """
+        if self.count < 2:
+            return 0.0
+        return math.sqrt(self.m2 / (self.count - 1))
+
+class Anomaly_Detector():
+    """
+    Keeps a Welford per station, calendar day and field and checks every new or changed
+    day against it in constant time as the day is ingested. A value is an anomaly when
+    its z-score against the earlier years passes the threshold. A removed day's values
+    are taken back out of the history.
+    """
+    def __init__(self, threshold=3.0, min_count=5, history=100):
+        """
+        Initializes the Anomaly_Detector with no history.
+
+        Parameters:
+            threshold: z-score at which a value is flagged, default is 3.0 (float)
+            min_count: years of history needed before a calendar day is checked, default is 5 (int)
+            history: number of recent anomalies kept, default is 100 (int)
+        """
+        self.__threshold = threshold
+        self.__min_count = min_count
+        self.__stats = {} #maps (station, mm-dd, field) to a Welford
+        self.__anomalies = {} #maps (station, yyyy-mm-dd) to the day's anomalies
+        self.__recent = collections.deque(maxlen=history)
+        self.__checked = 0
+
+    def attach(self, weather_data):
+        """
+        Checks the days already stored, oldest first, and then every day the data ingests.
+
+        Parameters:
+            weather_data: the station's data (Weather_App_Data)
+        """
+        for date_key, record in zip(weather_data.get_day_keys(), weather_data.get_list()):
+            self.check(weather_data, date_key, record, None)
+        weather_data.add_ingest_listener(self.check)
+
+    def check(self, weather_data, date_key, record, old_record):
+        """
+        Checks one day against the history of its calendar day and adds it to that history.
+        Has the signature of an ingest listener.
+
+        Parameters:
+            weather_data: the station's data (Weather_App_Data)
+            date_key: the day in yyyy-mm-dd format (str)
+            record: the day's weather data, or None if the day was removed (dict)
+            old_record: the day's earlier data if it was corrected or removed, or None (dict)
+        Returns:
+            anomalies: (field, value, z-score, normal mean) for each flagged field (list)
+        """
+        station = weather_data.get_station()
+        day = date_key[5:]
+        if record is None:
+            self.remove(station, date_key, old_record)
+            return []
+        values = Weather_App_Data.derived_values(record)
+        old_values = Weather_App_Data.derived_values(old_record) if old_record is not None else None
+        anomalies = []
+        for field in ANOMALY_FIELDS:
+            value = record[field] if field in record else values[field]
+            key = (station, day, field)
+            stats = self.__stats.get(key)
+            if stats is None:
+                stats = self.__stats[key] = Welford()
+            #takes a corrected day's earlier value out of the history first
+            if old_record is not None:
+                stats.remove(old_record[field] if field in old_record else old_values[field])
+            std = stats.get_std()
+            if stats.count >= self.__min_count and std > 0:
+                z_score = (value - stats.mean) / std
+                if abs(z_score) >= self.__threshold:
+                    anomalies.append((field, value, z_score, stats.mean))
+            stats.add(value)
+        self.__checked += 1
+        if anomalies:
+            self.__anomalies[(station, date_key)] = anomalies
+            self.__recent.append((station, date_key, anomalies))
+        else:
+            self.__anomalies.pop((station, date_key), None)
+        return anomalies
+
+    def remove(self, station, date_key, old_record):
+        """
+        Takes a removed day out of the history of its calendar day and forgets its anomalies.
+
+        Parameters:
+            station: station name (str)
+            date_key: the day in yyyy-mm-dd format (str)
+            old_record: the removed day's data (dict)
+        """
+        old_values = Weather_App_Data.derived_values(old_record)
+        for field in ANOMALY_FIELDS:
+            stats = self.__stats.get((station, date_key[5:], field))
+            if stats is not None:
+                stats.remove(old_record[field] if field in old_record else old_values[field])
+        self.__anomalies.pop((station, date_key), None)
+
+    def get_anomalies(self, station, date_key):
+        """
+        Returns the anomalies found for a day.
+
+        Parameters:
+            station: station name (str)
+            date_key: the day in yyyy-mm-dd format (str)
+        Returns:
+            (field, value, z-score, normal mean) for each flagged field, empty if none (list)
+        """
+        return self.__anomalies.get((station, date_key), [])
+
+    def get_recent(self):
+        """
+        Returns the most recently flagged days.
+        Returns:
+            (station, date, anomalies) tuples, oldest first (list)
+        """
+        return list(self.__recent)
+
+    def get_checked(self):
+        """
+        Returns how many days have been checked.
+        Returns:
+            self.__checked: number of days (int)
+        """
+        return self.__checked
+
+def describe(anomaly):
+    """
+    Writes an anomaly as a short sentence for the warning bar.
+
+    Parameters:
+        anomaly: (field, value, z-score, normal mean) (tuple)
+    Returns:
+        text, e.g. "Max Temperature 3.4σ above normal" (str)
+    """
+    field, _, z_score, _ = anomaly
+    return "%s %.1fσ %s normal" % (field, abs(z_score), "above" if z_score > 0 else "below")
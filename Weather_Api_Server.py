@@ -0,0 +1,419 @@
+'''
+Name: Eric and Sanvi
+Last modified: May 21, 2025
+Program details: An application that provides weather monitoring with a GUI from tkinter package.
+                 It will read weather data from a file, automatically updates conditions at set intervals, and
+                 dynamically display weather conditions (e.g., Sunny, Rainy, or Snowy).
+
+Serves the forecasts the GUI shows as JSON over HTTP, for other systems to poll.
+
+    python Weather_Api_Server.py data.txt other_station.csv --port 8080
+
+    GET /stations                       every station with its number of days and date range
+    GET /stations/<station>             every day of a station
+    GET /stations/<station>/<yyyy-mm-dd>  one day
+    GET /events?station=<station>       server-sent events with the change-set of each refresh
+'''
+import argparse
+import asyncio
+import json
+import os
+import time
+import zlib
+from urllib.parse import parse_qs, unquote
+import Weather_App_Data
+import Weather_Events
+import Weather_Observation_Log
+import Weather_Readers
+import Weather_Rules
+
+#Reason phrases of the statuses the server sends
+REASONS = {200: "OK", 304: "Not Modified", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed"}
+#Most cached responses kept before the cache is emptied
+MAX_CACHED = 10000
+#Largest request body that is read and dropped to keep the connection open
+MAX_DRAINED = 1 << 16
+
+class Weather_Api_Server():
+    """
+    An asyncio HTTP/1.1 server over one or more stations' data. Every response is
+    serialised once per data version and cached with its ETag, so a repeated poll
+    costs one dict lookup and a version check, and a poll with a matching
+    If-None-Match gets a 304 without a body.
+    """
+    def __init__(self, stations, rules=None, refresh_seconds=None, max_cached=MAX_CACHED, log_dir=None):
+        """
+        Initializes the Weather_Api_Server without starting it.
+
+        Parameters:
+            stations: the data to serve, one object per station (list of Weather_App_Data)
+            rules: the compiled condition rules, default is the rules in conditions.json (Rule_Table)
+            refresh_seconds: seconds between re-reading every station's file, default is never (float)
+            max_cached: most responses kept in the cache, default is MAX_CACHED (int)
+            log_dir: folder of one <station>.wlog observation log per station that the
+                     changed days are appended to, default is no logs (str)
+        """
+        self.__stations = {weather_data.get_station(): weather_data for weather_data in stations}
+        self.__rules = rules or Weather_Rules.get_rule_table()
+        self.__refresh_seconds = refresh_seconds
+        self.__max_cached = max_cached
+        self.__cache = {} #maps paths to (data version, ETag, response bytes)
+        self.__days = {} #maps stations to (data version, list of days, dict of days by date)
+        self.__server = None
+        self.__connections = {} #maps open connections' writers to their tasks, closed when the server stops
+        self.__refresh_task = None
+        self.__metrics = {"requests": 0, "cache_hits": 0, "cache_misses": 0, "not_modified": 0,
+                          "errors": 0, "connections": 0, "refreshes": 0}
+        #Pushes the days each ingest changes to /events subscribers
+        self.__events = Weather_Events.Event_Hub()
+        for weather_data in stations:
+            self.__events.attach(weather_data)
+        #Appends the days each ingest changes to the stations' observation logs
+        self.__logs = []
+        if log_dir is not None:
+            for weather_data in stations:
+                file_name = os.path.join(log_dir, weather_data.get_station() + ".wlog")
+                if os.path.abspath(file_name) == os.path.abspath(weather_data.get_file_name()):
+                    continue #the station is read from this log
+                log = Weather_Observation_Log.Observation_Log(file_name)
+                log.attach(weather_data)
+                self.__logs.append(log)
+
+    async def start(self, host="127.0.0.1", port=8080):
+        """
+        Starts listening, and refreshing the stations if a refresh interval was given.
+
+        Parameters:
+            host: address to bind, default is "127.0.0.1" (str)
+            port: port to listen on, 0 picks a free one, default is 8080 (int)
+        Returns:
+            port: the port that is being listened on (int)
+        """
+        self.__server = await asyncio.start_server(self.handle, host, port)
+        for log in self.__logs:
+            log.start_timer()
+        if self.__refresh_seconds:
+            self.__refresh_task = asyncio.ensure_future(self.refresh_forever())
+        return self.__server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self, host="127.0.0.1", port=8080):
+        """
+        Starts the server and serves until the task is cancelled.
+
+        Parameters:
+            host: address to bind, default is "127.0.0.1" (str)
+            port: port to listen on, default is 8080 (int)
+        """
+        await self.start(host, port)
+        try:
+            await self.__server.serve_forever()
+        finally:
+            await self.stop()
+
+    async def stop(self):
+        """
+        Stops listening and refreshing, and closes the open connections and observation logs.
+        """
+        if self.__refresh_task is not None:
+            self.__refresh_task.cancel()
+            self.__refresh_task = None
+        if self.__server is not None:
+            self.__server.close()
+            self.__events.close()
+            for writer in self.__connections:
+                writer.close()
+            #lets every connection see the end of its stream and finish
+            await asyncio.gather(*self.__connections.values(), return_exceptions=True)
+            await self.__server.wait_closed()
+            self.__server = None
+        for log in self.__logs:
+            log.close()
+
+    async def refresh_forever(self):
+        """
+        Re-reads every station's file, then waits, until the task is cancelled.
+        """
+        while True:
+            await asyncio.sleep(self.__refresh_seconds)
+            self.refresh()
+
+    def refresh(self):
+        """
+        Re-reads every station's file. Cached responses of a station that changed
+        are replaced the next time they are asked for.
+        """
+        for weather_data in self.__stations.values():
+            if isinstance(weather_data, Weather_App_Data.Weather_Calculations):
+                weather_data.refresh()
+            else:
+                weather_data.read_data()
+        self.__metrics["refreshes"] += 1
+
+    async def handle(self, reader, writer):
+        """
+        Answers the requests of one connection until the client closes it or asks to.
+
+        Parameters:
+            reader: the asyncio stream reader (asyncio.StreamReader)
+            writer: the asyncio stream writer (asyncio.StreamWriter)
+        """
+        self.__metrics["connections"] += 1
+        self.__connections[writer] = asyncio.current_task()
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                parts = request_line.decode("latin-1").split()
+                keep_alive = len(parts) == 3 and parts[2] == "HTTP/1.1" and \
+                    headers.get("connection", "").lower() != "close"
+                if len(parts) != 3:
+                    writer.write(self.error_response(400, False))
+                    break
+                #no endpoint takes a body, but it is read so it is not parsed as the next request
+                length = headers.get("content-length", "0")
+                if not length.isdigit():
+                    writer.write(self.error_response(400, False))
+                    break
+                if "transfer-encoding" in headers or int(length) > MAX_DRAINED:
+                    keep_alive = False #closing is cheaper than reading the body
+                elif int(length):
+                    await reader.readexactly(int(length))
+                if parts[0] == "GET" and parts[1].split("?")[0] == "/events":
+                    await self.stream_events(writer, parts[1], headers)
+                    break
+                writer.write(self.respond(parts[0], parts[1], headers, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.__connections.pop(writer, None)
+            writer.close()
+
+    async def stream_events(self, writer, target, headers):
+        """
+        Answers GET /events with an event stream that stays open until the client leaves.
+
+        Parameters:
+            writer: the asyncio stream writer (asyncio.StreamWriter)
+            target: the request path with its query string (str)
+            headers: request headers with lower case names (dict)
+        """
+        self.__metrics["requests"] += 1
+        query = parse_qs(target.partition("?")[2])
+        station = query.get("station", [None])[0]
+        if station is not None and station not in self.__stations:
+            writer.write(self.error_response(404, False))
+            return
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\n"
+                     b"Cache-Control: no-cache\r\nConnection: keep-alive\r\n\r\n")
+        await self.__events.stream(writer, station, headers.get("last-event-id"))
+
+    def respond(self, method, target, headers, keep_alive=True):
+        """
+        Builds the response to one request, from the cache when the data has not changed.
+
+        Parameters:
+            method: the request method (str)
+            target: the request path, with any query string (str)
+            headers: request headers with lower case names (dict)
+            keep_alive: False to tell the client the connection will close (bool)
+        Returns:
+            the full response, status line to body (bytes)
+        """
+        self.__metrics["requests"] += 1
+        if method not in ("GET", "HEAD"):
+            return self.error_response(405, keep_alive)
+        path = target.split("?")[0]
+        version = self.get_version(path)
+        if version is None:
+            return self.error_response(404, keep_alive)
+        entry = self.__cache.get(path)
+        if entry is not None and entry[0] == version:
+            self.__metrics["cache_hits"] += 1
+        else:
+            self.__metrics["cache_misses"] += 1
+            body = self.render(path)
+            if body is None:
+                return self.error_response(404, keep_alive)
+            if len(self.__cache) >= self.__max_cached:
+                self.__cache.clear()
+            entry = self.__cache[path] = (version, '"%08x"' % zlib.crc32(body), body)
+        _, etag, body = entry
+        if headers.get("if-none-match") == etag:
+            self.__metrics["not_modified"] += 1
+            return self.head(304, etag, None, keep_alive)
+        if method == "HEAD":
+            return self.head(200, etag, len(body), keep_alive)
+        return self.head(200, etag, len(body), keep_alive) + body
+
+    def head(self, status, etag, length, keep_alive):
+        """
+        Builds a status line and headers.
+
+        Parameters:
+            status: HTTP status code (int)
+            etag: the ETag of the body, or None (str)
+            length: the body length, or None when there is no body (int)
+            keep_alive: False to tell the client the connection will close (bool)
+        Returns:
+            the status line and headers, ending in a blank line (bytes)
+        """
+        lines = ["HTTP/1.1 %d %s" % (status, REASONS[status])]
+        if length is not None:
+            lines.append("Content-Type: application/json; charset=utf-8")
+            lines.append("Content-Length: %d" % length)
+        if etag is not None:
+            lines.append("ETag: " + etag)
+            lines.append("Cache-Control: no-cache")
+        lines.append("Connection: " + ("keep-alive" if keep_alive else "close"))
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+    def error_response(self, status, keep_alive):
+        """
+        Builds an error response with a short JSON body.
+
+        Parameters:
+            status: HTTP status code (int)
+            keep_alive: False to tell the client the connection will close (bool)
+        Returns:
+            the full response (bytes)
+        """
+        self.__metrics["errors"] += 1
+        body = json.dumps({"error": REASONS[status]}).encode("utf-8")
+        return self.head(status, None, len(body), keep_alive) + body
+
+    def get_version(self, path):
+        """
+        Returns the data version a path's response depends on, so a cached response
+        can be checked without building anything.
+
+        Parameters:
+            path: the request path without the query string (str)
+        Returns:
+            the version (int or tuple), or None if the path does not exist
+        """
+        if path == "/stations":
+            return tuple(weather_data.get_data_version() for weather_data in self.__stations.values())
+        parts = path.split("/")
+        if len(parts) in (3, 4) and parts[1] == "stations":
+            weather_data = self.__stations.get(unquote(parts[2]))
+            if weather_data is not None:
+                return weather_data.get_data_version()
+        return None
+
+    def render(self, path):
+        """
+        Serialises the response body of a path.
+
+        Parameters:
+            path: the request path without the query string (str)
+        Returns:
+            the JSON body (bytes), or None if the day does not exist
+        """
+        if path == "/stations":
+            payload = []
+            for station, weather_data in self.__stations.items():
+                day_keys = weather_data.get_day_keys()
+                payload.append({"station": station, "days": len(day_keys),
+                                "first": day_keys[0] if day_keys else None,
+                                "last": day_keys[-1] if day_keys else None,
+                                "version": weather_data.get_data_version()})
+        else:
+            parts = path.split("/")
+            station = unquote(parts[2])
+            days, by_date = self.get_days(station)
+            if len(parts) == 3:
+                payload = {"station": station, "version": self.__stations[station].get_data_version(), "days": days}
+            else:
+                payload = by_date.get(parts[3])
+                if payload is None:
+                    return None
+        return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+    def get_days(self, station):
+        """
+        Returns every day of a station as it is served, built once per data version.
+
+        Parameters:
+            station: station name (str)
+        Returns:
+            days: one dictionary per day, oldest first (list)
+            by_date: the same dictionaries by yyyy-mm-dd date (dict)
+        """
+        weather_data = self.__stations[station]
+        version = weather_data.get_data_version()
+        built = self.__days.get(station)
+        if built is None or built[0] != version:
+            days = [self.describe_day(date_key, record)
+                    for date_key, record in zip(weather_data.get_day_keys(), weather_data.get_list())]
+            built = self.__days[station] = (version, days, {day["date"]: day for day in days})
+        return built[1], built[2]
+
+    def describe_day(self, date_key, record):
+        """
+        Builds the served form of one day: its fields, derived values and condition.
+
+        Parameters:
+            date_key: the day in yyyy-mm-dd format (str)
+            record: the day's weather data (dict)
+        Returns:
+            day: the day as JSON-ready data (dict)
+        """
+        values = Weather_App_Data.derived_values(record)
+        day = {"date": date_key}
+        for field in Weather_Readers.FIELDS:
+            day[field] = record[field]
+        day.update(values)
+        values.update(record)
+        day["Condition"], day["Description"] = self.__rules.evaluate(values)
+        return day
+
+    def get_metrics(self):
+        """
+        Returns request, cache and connection counts.
+        Returns:
+            metrics: dictionary of metric names and values (dict)
+        """
+        metrics = dict(self.__metrics)
+        metrics["cached"] = len(self.__cache)
+        for name, value in self.__events.get_metrics().items():
+            metrics["events_" + name] = value
+        return metrics
+
+def main(arguments=None):
+    """
+    Serves station files from the command line.
+
+    Parameters:
+        arguments: command line arguments, default is sys.argv (list)
+    """
+    parser = argparse.ArgumentParser(description="Serves weather forecasts as JSON over HTTP.")
+    parser.add_argument("files", nargs="*", default=["data.txt"], help="station files, default is data.txt")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=int(os.environ.get("WEATHER_API_PORT", "8080")))
+    parser.add_argument("--refresh", type=float, default=60.0, help="seconds between re-reading the files, 0 for never")
+    parser.add_argument("--log-dir", help="folder to append each station's changed days to, as <station>.wlog")
+    options = parser.parse_args(arguments)
+
+    start_time = time.perf_counter()
+    stations = [Weather_App_Data.Weather_Calculations(file_name) for file_name in options.files]
+    server = Weather_Api_Server(stations, refresh_seconds=options.refresh or None, log_dir=options.log_dir)
+    print("loaded %d stations in %.2f s, serving on http://%s:%d" % (
+        len(stations), time.perf_counter() - start_time, options.host, options.port), flush=True)
+    try:
+        asyncio.run(server.serve_forever(options.host, options.port))
+    except KeyboardInterrupt:
+        print(server.get_metrics())
+
+if __name__ == "__main__":
+    main()
@@ -5,18 +5,107 @@ Program details: An application that provides weather monitoring with a GUI from
                  It will read weather data from a file, automatically updates conditions at set intervals, and
                  dynamically display weather conditions (e.g., Sunny, Rainy, or Snowy).
 '''
+import bisect
+import collections
+import datetime
+import itertools
+import os
+import time
+import Weather_Observation_Log
+import Weather_Readers
+import Weather_Rules
+
+#fields that hold numbers, in the order get_columns returns them
+NUMERIC_FIELDS = ("Min Temperature", "Max Temperature", "Humidity", "Wind Speed")
+#values Weather_Calculations works out from each day
+DERIVED_FIELDS = ("Heat Index", "Wind Chill", "Dew Point")
+
+def calc_heat_index(max_temp, humid, speed):
+    """
+    Calculates the heat index of one day.
+
+    Parameters:
+        max_temp: maximum temperature in °C (float)
+        humid: humidity in % (float)
+        speed: wind speed in km/h (float)
+    Returns:
+        heat index in °C (float)
+    """
+    return max_temp + (0.33*humid) - (0.7*speed*(5/18))
+
+def calc_wind_chill(min_temp, speed):
+    """
+    Calculates the wind chill of one day.
+
+    Parameters:
+        min_temp: minimum temperature in °C (float)
+        speed: wind speed in km/h (float)
+    Returns:
+        wind chill in °C (float)
+    """
+    return 13.12 + (0.6215*min_temp) - ((speed*(5/18))**0.16)*(11.37-min_temp)
+
+def calc_dew_point(min_temp, max_temp, humid):
+    """
+    Calculates the dew point of one day.
+
+    Parameters:
+        min_temp: minimum temperature in °C (float)
+        max_temp: maximum temperature in °C (float)
+        humid: humidity in % (float)
+    Returns:
+        dew point in °C (float)
+    """
+    return (min_temp+max_temp)/2 - ((100-humid)/5)
+
+def derived_values(record):
+    """
+    Calculates the heat index, wind chill and dew point of one day.
+
+    Parameters:
+        record: the day's weather data (dict)
+    Returns:
+        dictionary mapping each of DERIVED_FIELDS to its value (dict)
+    """
+    return {
+        "Heat Index": calc_heat_index(record["Max Temperature"], record["Humidity"], record["Wind Speed"]),
+        "Wind Chill": calc_wind_chill(record["Min Temperature"], record["Wind Speed"]),
+        "Dew Point": calc_dew_point(record["Min Temperature"], record["Max Temperature"], record["Humidity"])
+    }
+
 class Weather_App_Data():
     """
     Retrieves and validates data from a text file so that it can be used 
     and displayed inside of the weather app.
     """
-    def __init__(self):
+    def __init__(self, file_name="data.txt", duplicate_policy="last", station=None):
         """
         Initalizes the Weather_Animation by creating a list and defining the order 
         of certain methods.
-        Does not accept any parameters (other than self) and does not return anything.
+
+        Parameters:
+            file_name: name of the data file to read, default is "data.txt" (str)
+            duplicate_policy: "last" keeps the last record for a date, "first" keeps the first,
+                              or a function(old_record, new_record) returns the record to keep (str or function)
+            station: name of the station the data is from, default is the file name
+                     without folders and extensions (str)
         """
+        if duplicate_policy not in ("last", "first") and not callable(duplicate_policy):
+            raise ValueError("duplicate_policy must be 'last', 'first' or a function")
+        self.__file_name = file_name
+        if station is None:
+            station = os.path.basename(file_name).split(".")[0]
+        self.__station = station
+        self.__duplicate_policy = duplicate_policy
+        self.__load_stats = {}
+        self.__ingest_stats = {"records": 0, "rejected": 0} #running totals over every ingest
         self.__list_info = [] #creates list where the data will be stored
+        self.__day_keys = [] #yyyy-mm-dd date of each stored day, in the same order
+        self.__day_index = {} #maps yyyy-mm-dd dates to their position in the list
+        self.__columns = None #column copy of the list, built on first use
+        self.__listeners = [] #functions told about every new or changed day
+        self.__data_version = 0 #goes up every time the stored days change
+        self.__change_log = Change_Log() #what each ingest inserted, updated and removed
         #tells the computer the order in which to access the methods
         self.set_default_data()
         self.read_data()
@@ -27,53 +116,212 @@ class Weather_App_Data():
          in case all of the data in the file is bad.
          Does not accept any parameters (other than self) and does not return anything.
          """
+         defaults = {}
          for i in range(5): #hardcodes 5 default data for 5 days
             day = str(i+1) 
             date_str = "May " + day + ", 2025" #Writes dates in specific format
-            self.__list_info.append({
+            defaults["2025-05-0" + day] = {
                 "Date": date_str,
                 "Min Temperature": 12.0,
                 "Max Temperature": 18.0,
                 "Humidity": 50.0,
                 "Wind Speed": 10.0,
                 "Wind Direction": "N"
-        })
+            }
+         self.store_days(defaults)
     
     def read_data(self):
         """
-        Reads and processes lines from 'data.txt', validating each data set using 
+        Reads and processes records from the data file, validating each data set using 
         helper functions and replacing default data with valid values.
+        The reader is picked by the file extension (.txt, .csv, .jsonl) or by sniffing the file,
+        and .gz, .bz2 and .xz files are decompressed while they are read.
+        Observation logs (.wlog) are read with read_observation_log instead.
         Does not accept any parameters (other than self) and does not return anything.
         """
-        data = open("data.txt", 'r') #opens the file in read mode
-        #initalisizes local variables to be used in loop
-        record_item = 0
-        record = {}
-        validSet = True #flag to be used
-        day = 0
-        
-        for info in data:
-            result = self.parse_line(info) #uses helper function parse line
-            if result is None:
-                continue #skips over line
-            key, value = result #get key and value info
-            stats = self.check_weather_type(key, value) #completes validation sorting
-            
-            if(stats == None):
-                validSet = False #changes flag state
-            record[key] = stats
-            record_item += 1
-
-            if record_item == 6: #checks if 6 items are in record
-                if(validSet == True):
-                    self.__list_info[day] = record #replaces default if all data is valid
-                #resets values to be used again in loop
-                record = {}
-                record_item = 0
-                validSet = True
-                day += 1
-                    
-        data.close()
+        if Weather_Observation_Log.is_log_file(self.__file_name):
+            self.read_observation_log()
+            return
+        start = time.perf_counter()
+        data, reader, timer = Weather_Readers.open_data_file(self.__file_name) #opens the file in read mode
+        try:
+            self.ingest_records(reader.read_records(data))
+        finally:
+            data.close()
+        total = time.perf_counter() - start
+        #stores how long reading/decompressing and parsing took
+        self.__load_stats = {
+            "decompress_seconds": timer.get_seconds(),
+            "parse_seconds": total - timer.get_seconds(),
+            "total_seconds": total
+        }
+
+    def ingest_records(self, records, replace=True):
+        """
+        Validates records coming from any reader and stores the valid ones, keyed by date.
+        Records for a date that was already seen are resolved by the duplicate policy.
+        If no record is valid the data that is already stored is kept.
+        What the ingest inserted, updated and removed is added to the change log; an ingest
+        that changes nothing leaves the stored days and the data version as they are.
+
+        Parameters:
+            records: iterable of records, each a list of (key, value) pairs (iterable)
+            replace: True to replace all stored days, False to merge into them (bool)
+        """
+        if replace:
+            days = {}
+        else:
+            days = dict(zip(self.__day_keys, self.__list_info)) #starts from the stored days
+        for pairs in records:
+            record = {}
+            validSet = True #flag to be used
+            date_key = None
+            for key, value in pairs:
+                stats = self.check_weather_type(key, value) #completes validation sorting
+                if(stats == None):
+                    validSet = False #changes flag state
+                elif key == "Date":
+                    date_key = value #keeps yyyy-mm-dd for sorting and lookups
+                record[key] = stats
+            if record.keys() != Weather_Readers.FIELD_SET:
+                validSet = False #a field is missing or unknown
+
+            if(validSet == True):
+                self.__ingest_stats["records"] += 1
+                if date_key in days:
+                    days[date_key] = self.resolve_duplicate(days[date_key], record)
+                else:
+                    days[date_key] = record
+            else:
+                self.__ingest_stats["rejected"] += 1
+        self.apply_days(days, replace)
+
+    def read_observation_log(self):
+        """
+        Rebuilds the stored days from an observation log and its sidecar. The
+        observations were validated before they were logged, so they are stored as they
+        are read; a later observation of a day replaces an earlier one.
+        Does not accept any parameters (other than self) and does not return anything.
+        """
+        start = time.perf_counter()
+        observations = Weather_Observation_Log.read_observations(self.__file_name)
+        read_seconds = time.perf_counter() - start
+        days = {}
+        labels = {} #maps mm-dd to e.g. "May 2", worked out once per calendar day
+        for date_key, min_temp, max_temp, humid, speed, direction in observations:
+            label = labels.get(date_key[5:])
+            if label is None:
+                label = labels[date_key[5:]] = self.convert_date(date_key)[:-6] #drops ", yyyy"
+            days[date_key] = {"Date": label + ", " + date_key[:4], "Min Temperature": min_temp,
+                              "Max Temperature": max_temp, "Humidity": humid,
+                              "Wind Speed": speed, "Wind Direction": direction}
+        self.__ingest_stats["records"] += len(observations)
+        self.apply_days(days, True)
+        total = time.perf_counter() - start
+        self.__load_stats = {
+            "decompress_seconds": read_seconds,
+            "parse_seconds": total - read_seconds,
+            "total_seconds": total
+        }
+
+    def apply_days(self, days, replace=True):
+        """
+        Stores validated days, logs what changed and tells the ingest listeners.
+        If there are no days the data that is already stored is kept.
+
+        Parameters:
+            days: dictionary mapping yyyy-mm-dd dates to records (dict)
+            replace: True if the days replace all stored days, False if they already
+                     include the stored days they keep (bool)
+        """
+        if not days:
+            return
+        #finds the days that are new or whose values differ from the stored ones
+        changes = [] #(date, record, old record, changed fields), only kept while the change log needs them
+        keep = self.__change_log.get_max_days() + 1
+        inserted = updated = 0
+        for date_key, record in days.items():
+            old_record = self.get_day(date_key)
+            if old_record is record:
+                continue #kept from before by a merge
+            if old_record is None:
+                inserted += 1
+                fields = Weather_Readers.FIELDS
+            else:
+                fields = [field for field in Weather_Readers.FIELDS if old_record[field] != record[field]]
+                if not fields:
+                    days[date_key] = old_record #keeps the stored object, so the day reads as unchanged
+                    continue
+                updated += 1
+            if self.__listeners or len(changes) < keep:
+                changes.append((date_key, record, old_record, fields))
+        removed = []
+        if replace:
+            removed = [date_key for date_key in self.__day_keys if date_key not in days]
+        if not (inserted or updated or removed):
+            return #the stored days, and so the data version, stay as they are
+        removed_records = [(date_key, self.get_day(date_key)) for date_key in removed] if self.__listeners else []
+        self.store_days(days)
+        #oldest first, so listeners that follow the latest day see the days in order
+        changes.sort(key=lambda change: change[0])
+        self.__change_log.record(self, changes, inserted, updated, removed)
+        if self.__listeners:
+            for date_key, record, old_record, _ in changes:
+                for listener in self.__listeners:
+                    listener(self, date_key, record, old_record)
+            for date_key, old_record in removed_records:
+                for listener in self.__listeners:
+                    listener(self, date_key, None, old_record)
+
+    def add_ingest_listener(self, listener):
+        """
+        Calls a function for every day that an ingest adds, changes or removes, after the days are stored.
+
+        Parameters:
+            listener: function(weather_data, date_key, record, old_record), old_record is None
+                      for a new day and record is None for a removed one (function)
+        """
+        self.__listeners.append(listener)
+
+    def remove_ingest_listener(self, listener):
+        """
+        Stops calling a function given to add_ingest_listener.
+
+        Parameters:
+            listener: the function (function)
+        """
+        self.__listeners.remove(listener)
+
+    def resolve_duplicate(self, old_record, new_record):
+        """
+        Picks the record to keep when two records have the same date.
+
+        Parameters:
+            old_record: the record that was stored first (dict)
+            new_record: the record that was read later (dict)
+        Returns:
+            the record to keep (dict)
+        """
+        if self.__duplicate_policy == "last":
+            return new_record
+        elif self.__duplicate_policy == "first":
+            return old_record
+        else:
+            return self.__duplicate_policy(old_record, new_record)
+
+    def store_days(self, days):
+        """
+        Stores days sorted by date and rebuilds the date index.
+
+        Parameters:
+            days: dictionary mapping yyyy-mm-dd dates to records (dict)
+        """
+        self.__day_keys = sorted(days)
+        #keeps the same list object so references to get_list stay valid
+        self.__list_info[:] = [days[date_key] for date_key in self.__day_keys]
+        self.__day_index = {date_key: slot for slot, date_key in enumerate(self.__day_keys)}
+        self.__columns = None #rebuilt the next time it is asked for
+        self.__data_version += 1
 
     def parse_line(self, info):
         """
@@ -86,15 +334,7 @@ class Weather_App_Data():
             value: contains the actual information. Will be refereneced in the dic's key-value pair (str)
             None: returned if the line is empty/has no colon (nonetype)
         """
-        line =  info.strip()
-               
-        if not line or ':' not in line:
-            return None
-
-        index_colon = line.find(":")
-        key = line[:index_colon] #strips colon
-        value = line[index_colon + 1:].strip('Â°C%km/h').strip() #strips extra special characters
-        return key, value
+        return Weather_Readers.Text_Reader().parse_line(info)
 
     def check_weather_type(self, key, value):
         """
@@ -178,7 +418,8 @@ class Weather_App_Data():
     
     def validate_date(self, value):
         """
-        Validates that a date is in the correct format and converts it if valid.
+        Validates that a date is in the correct format and is a real calendar day
+        (e.g. not 2025-02-30), and converts it if valid.
     
         Parameters:
             value: date string (str)
@@ -188,7 +429,13 @@ class Weather_App_Data():
         #checks if date in file is in yyyy-mm-dd
         if len(value) == 10 and (
             (value [4] == "-" and value[7] == "-") and(
-                value[:4].isdigit() and value[5:7].isdigit() and value[8:].isdigit())):
+                value[:4].isdigit() and value[5:7].isdigit() and value[8:].isdigit()) and
+                "01" <= value[5:7] <= "12"):
+            #checks that the day exists, so every stored date can be parsed by datetime
+            try:
+                datetime.date(int(value[:4]), int(value[5:7]), int(value[8:]))
+            except ValueError:
+                return None
             date = self.convert_date(value) #uses helper method to reformat
             return date
         else:
@@ -223,27 +470,216 @@ class Weather_App_Data():
             self.__list_info: List of dictionaries containing weather data (list)
         """
         return self.__list_info
+
+    def get_day_index(self, date_key):
+        """
+        Finds the position of a day in the list without scanning it.
+
+        Parameters:
+            date_key: date in yyyy-mm-dd format (str)
+        Returns:
+            position of the day in the list (int) or None if the date is not stored
+        """
+        return self.__day_index.get(date_key)
+
+    def get_day(self, date_key):
+        """
+        Finds the weather data for a date without scanning the list.
+
+        Parameters:
+            date_key: date in yyyy-mm-dd format (str)
+        Returns:
+            the day's weather data (dict) or None if the date is not stored
+        """
+        slot = self.__day_index.get(date_key)
+        if slot is None:
+            return None
+        return self.__list_info[slot]
+
+    def get_day_key(self, dic_index):
+        """
+        Returns the yyyy-mm-dd date of the day at a position in the list.
+
+        Parameters:
+            dic_index: index of the day in the list (int)
+        Returns:
+            date in yyyy-mm-dd format (str)
+        """
+        return self.__day_keys[dic_index]
+
+    def get_day_keys(self):
+        """
+        Returns the yyyy-mm-dd dates of all stored days, in list order.
+        Does not accept any parameters (other than self)
+        Returns:
+            self.__day_keys: sorted list of dates (list)
+        """
+        return self.__day_keys
+
+    def get_columns(self):
+        """
+        Returns the stored days as columns, one list per field, for charts and
+        other code that works on a whole field at a time.
+        The columns are built once per change to the data and shared, so they should not be modified.
+        Does not accept any parameters (other than self)
+        Returns:
+            dictionary with "Date" (yyyy-mm-dd strings) and each numeric field (lists of float) (dict)
+        """
+        if self.__columns is None:
+            columns = {"Date": list(self.__day_keys)}
+            for field in NUMERIC_FIELDS:
+                columns[field] = [dic[field] for dic in self.__list_info]
+            self.__columns = columns
+        return self.__columns
+
+    def get_change_log(self):
+        """
+        Returns the log of what recent ingests inserted, updated and removed.
+        Does not accept any parameters (other than self)
+        Returns:
+            self.__change_log: the change log (Change_Log)
+        """
+        return self.__change_log
+
+    def get_data_version(self):
+        """
+        Returns a number that goes up every time the stored days change, so anything
+        built from the days can tell whether it is still current.
+        Does not accept any parameters (other than self)
+        Returns:
+            self.__data_version: the version (int)
+        """
+        return self.__data_version
+
+    def get_station(self):
+        """
+        Returns the name of the station the data is from.
+        Does not accept any parameters (other than self)
+        Returns:
+            self.__station: station name (str)
+        """
+        return self.__station
+
+    def get_file_name(self):
+        """
+        Returns the name of the data file that is read.
+        Does not accept any parameters (other than self)
+        Returns:
+            self.__file_name: name of the data file (str)
+        """
+        return self.__file_name
+
+    def get_ingest_stats(self):
+        """
+        Returns how many valid records have been ingested and how many were rejected
+        by validation since the object was created.
+        Does not accept any parameters (other than self)
+        Returns:
+            self.__ingest_stats: dictionary with records and rejected counts (dict)
+        """
+        return self.__ingest_stats
+
+    def get_load_stats(self):
+        """
+        Returns how long the last read_data call spent reading and decompressing
+        the file and how long it spent parsing and validating it.
+        Does not accept any parameters (other than self)
+        Returns:
+            self.__load_stats: dictionary with decompress_seconds, parse_seconds and total_seconds (dict)
+        """
+        return self.__load_stats
     
 class Weather_Calculations(Weather_App_Data):
     """
     Calculates the heat index, wind chill, and wind speed so that
     future weather condition determinination can be more accurate.
     """
-    def __init__(self):
+    def __init__(self, file_name="data.txt", duplicate_policy="last", station=None):
         """
         Initializes Weather_Calculations by computing heat index, wind chill, and dew point for all days.
         Also calls necessary methods so the program is aware tasks need to be completed in them.
-        Does not accept any parameters (other than self) and does not return anything.
+
+        Parameters:
+            file_name: name of the data file to read, default is "data.txt" (str)
+            duplicate_policy: how records with the same date are resolved, see Weather_App_Data (str or function)
+            station: name of the station the data is from, see Weather_App_Data (str)
         """
-        Weather_App_Data.__init__(self) #calls the init method of superclass for inheritance
+        Weather_App_Data.__init__(self, file_name, duplicate_policy, station) #calls the init method of superclass for inheritance
         #creates lists for data to be appended and stored in once calculated
         self.__heat_index_list = []
         self.__wind_chill_list = []
         self.__dew_point_list = []
+        self.__rolling = Rolling_Aggregates()
+        self.__rolling_sequence = None #change log sequence the rolling aggregates are up to date with
+
+        self.heat_index()
+        self.wind_chill()
+        self.dew_point()
+        self.update_rolling()
+
+    def refresh(self):
+        """
+        Reads the data file again and recomputes the heat index, wind chill, and dew point.
+        Does not accept any parameters (other than self) and does not return anything.
+        """
+        self.read_data()
+        self.recalculate()
+
+    def recalculate(self):
+        """
+        Clears and recomputes the heat index, wind chill, and dew point lists after the data changed.
+        Does not accept any parameters (other than self) and does not return anything.
+        """
+        self.__heat_index_list.clear()
+        self.__wind_chill_list.clear()
+        self.__dew_point_list.clear()
 
         self.heat_index()
         self.wind_chill()
         self.dew_point()
+        self.update_rolling()
+
+    def update_rolling(self):
+        """
+        Brings the rolling aggregates up to date with the change log. When every change
+        since the last update is after the last aggregated day, just the new days are added;
+        otherwise the windows are rebuilt from the latest days, as many as the largest window
+        holds, so a correction costs the window size and not the number of days.
+        Does not accept any parameters (other than self) and does not return anything.
+        """
+        day_keys = self.get_day_keys()
+        days = self.get_list()
+        log = self.get_change_log()
+        change_sets = None
+        if self.__rolling_sequence is not None:
+            change_sets = log.since(self.__rolling_sequence)
+        self.__rolling_sequence = log.get_sequence()
+        if change_sets is not None and not any(change_set["reset"] for change_set in change_sets):
+            changed = [day["date"] for change_set in change_sets
+                       for day in change_set["inserted"] + change_set["updated"]]
+            changed += [date_key for change_set in change_sets for date_key in change_set["removed"]]
+            if not changed:
+                return
+            earliest = min(changed)
+            last_key = self.__rolling.get_last_key()
+            if last_key is not None and earliest > last_key:
+                #only days after the tail changed, so they are appended
+                for slot in range(bisect.bisect_right(day_keys, last_key), len(days)):
+                    self.__rolling.append(days[slot], day_keys[slot])
+                return
+        #the windows only cover the latest days, so those are all that is replayed
+        self.__rolling = Rolling_Aggregates()
+        for slot in range(max(0, len(days) - max(self.__rolling.get_sizes())), len(days)):
+            self.__rolling.append(days[slot], day_keys[slot])
+
+    def get_rolling(self):
+        """
+        Returns the rolling aggregates of the stored days.
+        Does not accept any parameters (other than self)
+        Returns:
+            self.__rolling: rolling means, minimums and maximums (Rolling_Aggregates)
+        """
+        return self.__rolling
 
     def convert_wind_speed(self, old_speed):
         """
@@ -265,10 +701,8 @@ class Weather_Calculations(Weather_App_Data):
         for dic in range(len(self.get_list())):
             #gets needed variables from get method
             _, max_temp, humid, speed, _,_ = self.get_weather_values(dic)
-            new_speed = self.convert_wind_speed(speed) #gets changed windspeed
             #calculates heat index and appends
-            heat = max_temp + (0.33*humid) - (0.7*new_speed)
-            self.__heat_index_list.append(heat)
+            self.__heat_index_list.append(calc_heat_index(max_temp, humid, speed))
 
     def get_heat_index(self):
         """
@@ -287,10 +721,8 @@ class Weather_Calculations(Weather_App_Data):
         for dic in range(len(self.get_list())):
             #gets needed variables from get method
             min_temp, _, _, speed, _,_ = self.get_weather_values(dic)
-            new_speed = self.convert_wind_speed(speed) #gets changed windspeed
             #calculates wind chill and appends
-            chill = 13.12 + (0.6215*min_temp) - (new_speed**0.16)*(11.37-min_temp)
-            self.__wind_chill_list.append(chill)
+            self.__wind_chill_list.append(calc_wind_chill(min_temp, speed))
 
     def get_wind_chill(self):
         """
@@ -310,9 +742,7 @@ class Weather_Calculations(Weather_App_Data):
             #gets needed variables from get method
             min_temp, max_temp, humid, _, _,_ = self.get_weather_values(dic)
             #calculates dew point and appends
-            average = (min_temp+max_temp)/2
-            dew = average - ((100-humid)/5)
-            self.__dew_point_list.append(dew)
+            self.__dew_point_list.append(calc_dew_point(min_temp, max_temp, humid))
        
     def get_dew_point(self):
         """
@@ -321,4 +751,313 @@ class Weather_Calculations(Weather_App_Data):
         Returns:
             List of dew point values (list of float)
         """
-        return self.__dew_point_list
\ No newline at end of file
+        return self.__dew_point_list
+
+class Change_Log():
+    """
+    A ring buffer of the change-sets of recent ingests, each with a sequence number, so
+    anything built from the days can catch up on what changed since it last looked
+    instead of comparing whole lists. A change-set lists the inserted and updated days
+    with their changed fields, derived values and condition, and the removed dates.
+    An ingest that changes more than max_days days is logged as a reset, without the days.
+    """
+    def __init__(self, capacity=256, max_days=1024, rules=None):
+        """
+        Initializes an empty Change_Log.
+
+        Parameters:
+            capacity: change-sets kept, default is 256 (int)
+            max_days: most days listed in one change-set before it is logged as a reset, default is 1024 (int)
+            rules: the compiled condition rules, default is the rules in conditions.json (Rule_Table)
+        """
+        self.__change_sets = collections.deque(maxlen=capacity)
+        self.__max_days = max_days
+        self.__rules = rules
+        self.__sequence = 0
+        self.__listeners = []
+
+    def record(self, weather_data, changes, inserted, updated, removed):
+        """
+        Adds the change-set of one ingest, after its days were stored.
+
+        Parameters:
+            weather_data: the data that changed (Weather_App_Data)
+            changes: (date, record, old record or None, changed fields) for each changed day (list)
+            inserted: number of new days (int)
+            updated: number of changed days (int)
+            removed: dates of the days that are gone (list)
+        Returns:
+            change_set: the logged change-set (dict)
+        """
+        self.__sequence += 1
+        change_set = {"sequence": self.__sequence, "station": weather_data.get_station(),
+                      "version": weather_data.get_data_version(),
+                      "counts": {"inserted": inserted, "updated": updated, "removed": len(removed)},
+                      "reset": inserted + updated + len(removed) > self.__max_days,
+                      "inserted": [], "updated": [], "removed": []}
+        if not change_set["reset"]:
+            rules = self.__rules or Weather_Rules.get_rule_table()
+            for date_key, record, old_record, fields in changes:
+                values = derived_values(record)
+                day = {"date": date_key, "fields": {field: record[field] for field in fields}, "derived": dict(values)}
+                values.update(record)
+                day["condition"], day["description"] = rules.evaluate(values)
+                if old_record is None:
+                    change_set["inserted"].append(day)
+                else:
+                    old_values = derived_values(old_record)
+                    old_values.update(old_record)
+                    day["old_condition"] = rules.evaluate(old_values)[0]
+                    change_set["updated"].append(day)
+            change_set["removed"] = list(removed)
+        self.__change_sets.append(change_set)
+        for listener in self.__listeners:
+            listener(weather_data, change_set)
+        return change_set
+
+    def since(self, sequence):
+        """
+        Returns the change-sets logged after a sequence number.
+
+        Parameters:
+            sequence: the last sequence number already seen, 0 for none (int)
+        Returns:
+            change-sets, oldest first (list of dict), or None if some of them have
+            already left the ring and the caller has to reload everything
+        """
+        if sequence >= self.__sequence:
+            return []
+        if not self.__change_sets or sequence < self.__change_sets[0]["sequence"] - 1:
+            return None
+        skip = len(self.__change_sets) - (self.__sequence - sequence)
+        return list(itertools.islice(self.__change_sets, skip, None))
+
+    def add_listener(self, listener):
+        """
+        Calls a function with every change-set as it is logged.
+
+        Parameters:
+            listener: function(weather_data, change_set) (function)
+        """
+        self.__listeners.append(listener)
+
+    def remove_listener(self, listener):
+        """
+        Stops calling a function given to add_listener.
+
+        Parameters:
+            listener: the function (function)
+        """
+        self.__listeners.remove(listener)
+
+    def get_sequence(self):
+        """
+        Returns the sequence number of the last change-set.
+        Returns:
+            self.__sequence: the sequence number, 0 before any change (int)
+        """
+        return self.__sequence
+
+    def get_max_days(self):
+        """
+        Returns the most days listed in one change-set before it is logged as a reset.
+        Returns:
+            self.__max_days: number of days (int)
+        """
+        return self.__max_days
+
+class Rolling_Window():
+    """
+    Mean, minimum and maximum of the last few values of a series.
+    A running sum gives the mean, and two monotonic deques keep the candidates
+    for the minimum and maximum, so each added value costs constant time on average.
+    """
+    def __init__(self, size):
+        """
+        Initializes an empty Rolling_Window.
+
+        Parameters:
+            size: number of most recent values the window covers (int)
+        """
+        self.__size = size
+        self.__values = collections.deque()
+        self.__total = 0.0
+        self.__count = 0 #values added since the start, used to age out the deques
+        self.__min_queue = collections.deque() #(position, value), values increasing
+        self.__max_queue = collections.deque() #(position, value), values decreasing
+
+    def append(self, value):
+        """
+        Adds the newest value and drops the oldest one if the window is full.
+
+        Parameters:
+            value: the new value (float)
+        """
+        self.__values.append(value)
+        self.__total += value
+        if len(self.__values) > self.__size:
+            self.__total -= self.__values.popleft()
+        position = self.__count
+        self.__count += 1
+        #drops candidates that can no longer be the minimum or maximum
+        while self.__min_queue and self.__min_queue[-1][1] >= value:
+            self.__min_queue.pop()
+        self.__min_queue.append((position, value))
+        while self.__max_queue and self.__max_queue[-1][1] <= value:
+            self.__max_queue.pop()
+        self.__max_queue.append((position, value))
+        #drops candidates that have left the window
+        oldest = self.__count - self.__size
+        if self.__min_queue[0][0] < oldest:
+            self.__min_queue.popleft()
+        if self.__max_queue[0][0] < oldest:
+            self.__max_queue.popleft()
+
+    def get_mean(self):
+        """
+        Returns the mean of the values in the window.
+        Returns:
+            mean (float) or None if the window is empty
+        """
+        if not self.__values:
+            return None
+        return self.__total / len(self.__values)
+
+    def get_min(self):
+        """
+        Returns the smallest value in the window.
+        Returns:
+            minimum (float) or None if the window is empty
+        """
+        return self.__min_queue[0][1] if self.__min_queue else None
+
+    def get_max(self):
+        """
+        Returns the largest value in the window.
+        Returns:
+            maximum (float) or None if the window is empty
+        """
+        return self.__max_queue[0][1] if self.__max_queue else None
+
+    def is_full(self):
+        """
+        Tells whether the window holds as many values as its size.
+        Returns:
+            True once size values have been added (bool)
+        """
+        return len(self.__values) == self.__size
+
+class Rolling_Aggregates():
+    """
+    Rolling windows of several sizes over the numeric fields of consecutive days,
+    e.g. the 7-day and 30-day mean, minimum and maximum temperature.
+    """
+    def __init__(self, sizes=(7, 30), fields=NUMERIC_FIELDS):
+        """
+        Initializes empty Rolling_Aggregates.
+
+        Parameters:
+            sizes: window sizes in days, default is (7, 30) (tuple of int)
+            fields: fields to aggregate, default is NUMERIC_FIELDS (tuple of str)
+        """
+        self.__sizes = tuple(sizes)
+        self.__fields = tuple(fields)
+        self.__windows = {(field, size): Rolling_Window(size) for field in self.__fields for size in self.__sizes}
+        self.__count = 0
+        self.__last_key = None
+
+    def append(self, record, date_key=None):
+        """
+        Adds the next day to every window.
+
+        Parameters:
+            record: the day's weather data (dict)
+            date_key: date of the day in yyyy-mm-dd format (str)
+        """
+        for (field, size), window in self.__windows.items():
+            window.append(record[field])
+        self.__count += 1
+        self.__last_key = date_key
+
+    def get(self, field, size):
+        """
+        Returns the mean, minimum and maximum of a field over the latest days.
+
+        Parameters:
+            field: e.g. "Max Temperature" (str)
+            size: one of the window sizes (int)
+        Returns:
+            dictionary with mean, min, max and full, True once the window has size days (dict)
+        """
+        window = self.__windows[(field, size)]
+        return {"mean": window.get_mean(), "min": window.get_min(),
+                "max": window.get_max(), "full": window.is_full()}
+
+    def get_sizes(self):
+        """
+        Returns the window sizes.
+        Returns:
+            self.__sizes: window sizes in days (tuple)
+        """
+        return self.__sizes
+
+    def get_count(self):
+        """
+        Returns how many days have been added since the windows were last rebuilt.
+        Returns:
+            self.__count: number of days (int)
+        """
+        return self.__count
+
+    def get_last_key(self):
+        """
+        Returns the date of the last day added.
+        Returns:
+            self.__last_key: date in yyyy-mm-dd format (str) or None if no day was added
+        """
+        return self.__last_key
+
+def rolling_series(values, size):
+    """
+    Computes the rolling mean, minimum and maximum at every position of a whole column,
+    for recomputing an archive in one pass. Uses numpy when it is installed and
+    falls back to itertools.accumulate and monotonic deques otherwise.
+    Positions before the window is full use the values seen so far.
+
+    Parameters:
+        values: the column, e.g. get_columns()["Max Temperature"] (list of float)
+        size: window size in days (int)
+    Returns:
+        means, mins, maxs: one value per position (tuple of lists)
+    """
+    count = len(values)
+    if count == 0:
+        return [], [], []
+    try:
+        import numpy
+    except ImportError:
+        numpy = None
+    if numpy is not None:
+        array = numpy.asarray(values, dtype=float)
+        sums = numpy.concatenate(([0.0], numpy.cumsum(array)))
+        ends = numpy.arange(1, count + 1)
+        starts = numpy.maximum(ends - size, 0)
+        means = (sums[ends] - sums[starts]) / (ends - starts)
+        #pads the front with the first value so every position has a full window
+        padded = numpy.concatenate((numpy.full(size - 1, array[0]), array))
+        windows = numpy.lib.stride_tricks.sliding_window_view(padded, size)
+        return means.tolist(), windows.min(axis=1).tolist(), windows.max(axis=1).tolist()
+
+    sums = [0.0] + list(itertools.accumulate(values))
+    means = []
+    for end in range(1, count + 1):
+        start = max(0, end - size)
+        means.append((sums[end] - sums[start]) / (end - start))
+    window = Rolling_Window(size)
+    mins = []
+    maxs = []
+    for value in values:
+        window.append(value)
+        mins.append(window.get_min())
+        maxs.append(window.get_max())
+    return means, mins, maxs
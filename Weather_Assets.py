@@ -0,0 +1,67 @@
+'''
+Name: Eric and Sanvi
+Last modified: May 21, 2025
+Program details: An application that provides weather monitoring with a GUI from tkinter package.
+                 It will read weather data from a file, automatically updates conditions at set intervals, and
+                 dynamically display weather conditions (e.g., Sunny, Rainy, or Snowy).
+'''
+#Resized PIL images and Tk photo images, keyed by (image name, size)
+_images = {}
+_photos = {}
+#Counts of cache hits and misses across both caches
+CACHE_STATS = {"hits": 0, "misses": 0}
+
+def get_image(image_path, size):
+    """
+    Loads and resizes an image once and returns the cached copy afterwards.
+    PIL is imported here so that importing this module stays free of GUI libraries.
+
+    Parameters:
+        image_path: the name of the image to load (str)
+        size: the size to resize the image to (tuple)
+    Returns:
+        image: the resized image (PIL.Image.Image)
+    """
+    key = (image_path, size)
+    image = _images.get(key)
+    if image is not None:
+        CACHE_STATS["hits"] += 1
+        return image
+    CACHE_STATS["misses"] += 1
+    from PIL import Image
+    image = Image.open(image_path).resize(size)
+    _images[key] = image
+    return image
+
+def get_photo(image_path, size):
+    """
+    Returns a Tk photo image of a resized image, creating it only the first time.
+    Needs a Tk window to exist already.
+
+    Parameters:
+        image_path: the name of the image to load (str)
+        size: the size to resize the image to (tuple)
+    Returns:
+        photo: the Tk image, which the cache also keeps alive (ImageTk.PhotoImage)
+    """
+    key = (image_path, size)
+    photo = _photos.get(key)
+    if photo is not None:
+        CACHE_STATS["hits"] += 1
+        return photo
+    from PIL import ImageTk
+    photo = ImageTk.PhotoImage(get_image(image_path, size))
+    _photos[key] = photo
+    return photo
+
+def get_hit_rate():
+    """
+    Returns the fraction of image requests served from the cache.
+
+    Returns:
+        hit rate between 0 and 1, or 0 before any request (float)
+    """
+    total = CACHE_STATS["hits"] + CACHE_STATS["misses"]
+    if total == 0:
+        return 0.0
+    return CACHE_STATS["hits"] / total
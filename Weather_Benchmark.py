@@ -0,0 +1,377 @@
+'''
+Name: Eric and Sanvi
+Last modified: May 21, 2025
+Program details: An application that provides weather monitoring with a GUI from tkinter package.
+                 It will read weather data from a file, automatically updates conditions at set intervals, and
+                 dynamically display weather conditions (e.g., Sunny, Rainy, or Snowy).
+
+Benchmarks the parse, derive, classify and render paths on synthetic data.
+
+    python Weather_Benchmark.py --sizes 5,10000 --output run.json
+    python Weather_Benchmark.py --sizes 5,10000 --baseline run.json
+'''
+import argparse
+import datetime
+import gc
+import json
+import math
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+import Weather_Core
+
+#Number of days in the synthetic inputs
+DEFAULT_SIZES = [5, 10000, 1000000, 10000000]
+#Most days in one synthetic station file; larger sizes are spread over several stations
+#because yyyy-mm-dd dates only cover about 3.6 million distinct days
+DAYS_PER_STATION = 1000000
+#Fractional drop in throughput that counts as a regression
+DEFAULT_TOLERANCE = 0.2
+DIRECTIONS = ["N", "NE", "E", "SE", "S", "SW", "W", "NW"]
+
+def make_rows(days):
+    """
+    Builds simple synthetic weather rows for benchmarking.
+
+    Parameters:
+        days: number of rows to build (int)
+    Returns:
+        rows: list of dictionaries with the six weather fields (list)
+    """
+    start = datetime.date(1000, 1, 1).toordinal()
+    rows = []
+    for i in range(days):
+        rows.append({
+            "Date": datetime.date.fromordinal(start + i).isoformat(),
+            "Min Temperature": "%.2f" % (i % 30 - 5),
+            "Max Temperature": "%.2f" % (i % 30 + 5),
+            "Humidity": "%.2f" % (i % 100),
+            "Wind Speed": "%.2f" % (i % 200),
+            "Wind Direction": DIRECTIONS[i % 8]
+        })
+    return rows
+
+def write_text_file(file_name, rows):
+    """
+    Writes rows in the block format of data.txt.
+
+    Parameters:
+        file_name: name of the file to write (str)
+        rows: rows built by make_rows (list)
+    """
+    with open(file_name, 'w', encoding="utf-8") as out:
+        out.write("Weather Forecast\n--------------------------------\n")
+        for row in rows:
+            out.write("Date: %s\nMin Temperature: %s°C\nMax Temperature: %s°C\nHumidity: %s%%\n"
+                      "Wind Speed: %s km/h\nWind Direction: %s\n\n" % (
+                          row["Date"], row["Min Temperature"], row["Max Temperature"],
+                          row["Humidity"], row["Wind Speed"], row["Wind Direction"]))
+
+def write_rows(folder, rows):
+    """
+    Writes the same rows in the text, CSV and JSON Lines formats.
+
+    Parameters:
+        folder: directory the files are written to (str)
+        rows: rows built by make_rows (list)
+    Returns:
+        files: dictionary mapping format names to file names (dict)
+    """
+    files = {
+        "text": os.path.join(folder, "bench.txt"),
+        "csv": os.path.join(folder, "bench.csv"),
+        "jsonl": os.path.join(folder, "bench.jsonl")
+    }
+    write_text_file(files["text"], rows)
+    with open(files["csv"], 'w', encoding="utf-8") as out:
+        out.write(",".join(rows[0].keys()) + "\n")
+        for row in rows:
+            out.write(",".join(row.values()) + "\n")
+    with open(files["jsonl"], 'w', encoding="utf-8") as out:
+        for row in rows:
+            out.write(json.dumps(row) + "\n")
+    return files
+
+def benchmark_readers(days=100000):
+    """
+    Measures how many rows per second each reader can ingest.
+
+    Parameters:
+        days: number of rows in each synthetic file (int)
+    Returns:
+        results: dictionary mapping format names to rows per second (dict)
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as folder:
+        files = write_rows(folder, make_rows(days))
+        for name, file_name in files.items():
+            start = time.perf_counter()
+            data = Weather_Core.Weather_App_Data(file_name)
+            elapsed = time.perf_counter() - start
+            results[name] = len(data.get_list()) / elapsed
+    return results
+
+def percentile(samples, fraction):
+    """
+    Returns a percentile of a list of samples using the nearest-rank method.
+
+    Parameters:
+        samples: measured values (list)
+        fraction: the percentile as a fraction, e.g. 0.99 (float)
+    Returns:
+        the sample at that percentile (float)
+    """
+    ordered = sorted(samples)
+    rank = max(0, math.ceil(fraction * len(ordered)) - 1)
+    return ordered[rank]
+
+def summarize(seconds, days, peak_bytes):
+    """
+    Turns the timings of one stage into the numbers that are reported.
+
+    Parameters:
+        seconds: wall time of every repeat of the stage (list)
+        days: number of days handled by one repeat (int)
+        peak_bytes: peak traced memory of one repeat (int)
+    Returns:
+        summary: throughput, latency percentiles and peak memory (dict)
+    """
+    return {
+        "days": days,
+        "repeats": len(seconds),
+        "days_per_second": days / percentile(seconds, 0.5),
+        "p50_seconds": percentile(seconds, 0.5),
+        "p95_seconds": percentile(seconds, 0.95),
+        "p99_seconds": percentile(seconds, 0.99),
+        "peak_bytes": peak_bytes
+    }
+
+def measure(stage, repeats, trace_memory):
+    """
+    Runs a stage several times and records its wall time, then once more to trace memory.
+
+    Parameters:
+        stage: function that runs the stage once (function)
+        repeats: number of timed runs (int)
+        trace_memory: True to add a run under tracemalloc (bool)
+    Returns:
+        seconds: wall time of every timed run (list)
+        peak_bytes: peak traced memory, 0 if not traced (int)
+    """
+    seconds = []
+    for _ in range(repeats):
+        gc.collect()
+        start = time.perf_counter()
+        stage()
+        seconds.append(time.perf_counter() - start)
+    peak_bytes = 0
+    if trace_memory:
+        gc.collect()
+        tracemalloc.start()
+        stage()
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return seconds, peak_bytes
+
+def classify_all(weather_data):
+    """
+    Classifies every stored day with the compiled condition rules, in one batch.
+
+    Parameters:
+        weather_data: the data to classify (Weather_Calculations)
+    """
+    Weather_Core.determine_conditions(weather_data)
+
+def benchmark_render(weather_data, repeats):
+    """
+    Times a full show_info redraw of the first day.
+    Needs tkinter, PIL and a display; returns the reason instead when they are missing.
+
+    Parameters:
+        weather_data: the data to show (Weather_Calculations)
+        repeats: number of redraws (int)
+    Returns:
+        seconds: wall time of every redraw (list) or the reason the stage was skipped (str)
+    """
+    try:
+        import Weather_GUI
+        gui = Weather_GUI.Weather_Gui(weather_data, start_loop=False)
+    except Exception as error:
+        return "skipped: " + str(error).strip()
+    first = weather_data.get_day_key(0)
+    seconds = []
+    try:
+        for _ in range(repeats):
+            start = time.perf_counter()
+            gui.show_info(first)
+            gui.main_window.update_idletasks()
+            seconds.append(time.perf_counter() - start)
+    finally:
+        gui.close()
+    return seconds
+
+def benchmark_size(days, repeats, trace_memory, render):
+    """
+    Benchmarks every stage for one input size.
+
+    Parameters:
+        days: total number of synthetic days (int)
+        repeats: number of timed runs per stage (int)
+        trace_memory: True to record peak memory (bool)
+        render: True to time show_info as well (bool)
+    Returns:
+        results: summary of each stage (dict)
+    """
+    stations = max(1, math.ceil(days / DAYS_PER_STATION))
+    results = {}
+    with tempfile.TemporaryDirectory() as folder:
+        files = []
+        for station in range(stations):
+            count = min(DAYS_PER_STATION, days - station * DAYS_PER_STATION)
+            file_name = os.path.join(folder, "station_%d.txt" % station)
+            write_text_file(file_name, make_rows(count))
+            files.append((file_name, count))
+
+        totals = {}
+        for file_name, count in files:
+            seconds, peak = measure(lambda: Weather_Core.Weather_App_Data(file_name), repeats, trace_memory)
+            totals.setdefault("parse", []).append((seconds, peak))
+
+            weather_data = Weather_Core.Weather_Calculations(file_name)
+            for name, stage in [
+                ("derive", weather_data.recalculate),
+                ("derive.heat_index", lambda: (weather_data.get_heat_index().clear(), weather_data.heat_index())),
+                ("derive.wind_chill", lambda: (weather_data.get_wind_chill().clear(), weather_data.wind_chill())),
+                ("derive.dew_point", lambda: (weather_data.get_dew_point().clear(), weather_data.dew_point())),
+                ("classify", lambda: classify_all(weather_data))]:
+                seconds, peak = measure(stage, repeats, trace_memory)
+                totals.setdefault(name, []).append((seconds, peak))
+            if render and file_name == files[0][0]:
+                render_seconds = benchmark_render(weather_data, max(repeats, 5))
+                if isinstance(render_seconds, str):
+                    results["render"] = {"status": render_seconds}
+                else:
+                    results["render"] = summarize(render_seconds, 1, 0)
+            del weather_data
+
+        #adds up the stations so each stage covers every day
+        for name, runs in totals.items():
+            seconds = [sum(run[0][i] for run in runs) for i in range(repeats)]
+            peak = max(run[1] for run in runs)
+            results[name] = summarize(seconds, days, peak)
+    return results
+
+def compare(results, baseline, tolerance):
+    """
+    Finds stages whose throughput dropped by more than the tolerance compared to a baseline.
+
+    Parameters:
+        results: the current run, as returned by run_suite (dict)
+        baseline: an earlier run loaded from JSON (dict)
+        tolerance: allowed fractional drop in throughput (float)
+    Returns:
+        regressions: one line per regression (list)
+    """
+    regressions = []
+    for size, stages in results["results"].items():
+        for name, summary in stages.items():
+            old = baseline.get("results", {}).get(size, {}).get(name)
+            if not old or "days_per_second" not in old or "days_per_second" not in summary:
+                continue
+            if summary["days_per_second"] < old["days_per_second"] * (1 - tolerance):
+                regressions.append("%s days %s: %.0f days/s, baseline %.0f days/s" % (
+                    size, name, summary["days_per_second"], old["days_per_second"]))
+    return regressions
+
+def run_suite(sizes, repeats=None, trace_memory=True, render=True):
+    """
+    Benchmarks every size and collects the results with details about the machine.
+
+    Parameters:
+        sizes: numbers of synthetic days (list)
+        repeats: timed runs per stage, default picks more runs for smaller sizes (int or None)
+        trace_memory: True to record peak memory (bool)
+        render: True to time show_info as well (bool)
+    Returns:
+        results: JSON ready results (dict)
+    """
+    results = {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "results": {}
+    }
+    for days in sizes:
+        size_repeats = repeats or max(3, min(200, 200000 // max(days, 1)))
+        if days >= DAYS_PER_STATION and repeats is None:
+            size_repeats = 1
+        results["results"][str(days)] = benchmark_size(days, size_repeats, trace_memory, render)
+    return results
+
+def print_results(results):
+    """
+    Prints a table of the benchmark results.
+
+    Parameters:
+        results: results returned by run_suite (dict)
+    """
+    print("%10s %-18s %14s %12s %12s %12s %12s" % (
+        "days", "stage", "days/s", "p50 ms", "p95 ms", "p99 ms", "peak MB"))
+    for size, stages in results["results"].items():
+        for name, summary in stages.items():
+            if "status" in summary:
+                print("%10s %-18s %s" % (size, name, summary["status"]))
+                continue
+            print("%10s %-18s %14.0f %12.3f %12.3f %12.3f %12.1f" % (
+                size, name, summary["days_per_second"], summary["p50_seconds"] * 1000,
+                summary["p95_seconds"] * 1000, summary["p99_seconds"] * 1000,
+                summary["peak_bytes"] / 1e6))
+
+def main(arguments=None):
+    """
+    Runs the benchmark suite from the command line.
+
+    Parameters:
+        arguments: command line arguments, default is sys.argv (list)
+    Returns:
+        exit code, 1 if a regression was found (int)
+    """
+    parser = argparse.ArgumentParser(description="Benchmarks the weather app's parse, derive, classify and render paths.")
+    parser.add_argument("--sizes", default=",".join(str(size) for size in DEFAULT_SIZES),
+                        help="comma separated numbers of days")
+    parser.add_argument("--repeat", type=int, default=None, help="timed runs per stage")
+    parser.add_argument("--output", help="file to save the results to as JSON")
+    parser.add_argument("--baseline", help="earlier JSON results to compare against")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed fractional drop in throughput")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc runs")
+    parser.add_argument("--no-render", action="store_true", help="skip the show_info stage")
+    parser.add_argument("--readers", type=int, metavar="DAYS",
+                        help="only compare the text, CSV and JSON Lines readers")
+    options = parser.parse_args(arguments)
+
+    if options.readers:
+        for name, rate in benchmark_readers(options.readers).items():
+            print("%-6s %12.0f rows/s" % (name, rate))
+        return 0
+
+    sizes = [int(size) for size in options.sizes.split(",")]
+    results = run_suite(sizes, options.repeat, not options.no_memory, not options.no_render)
+    print_results(results)
+    if options.output:
+        with open(options.output, 'w') as out:
+            json.dump(results, out, indent=2)
+    if options.baseline:
+        with open(options.baseline) as baseline_file:
+            regressions = compare(results, json.load(baseline_file), options.tolerance)
+        for line in regressions:
+            print("REGRESSION", line)
+        if regressions:
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,322 @@
+'''
+Name: Eric and Sanvi
+Last modified: May 21, 2025
+Program details: An application that provides weather monitoring with a GUI from tkinter package.
+                 It will read weather data from a file, automatically updates conditions at set intervals, and
+                 dynamically display weather conditions (e.g., Sunny, Rainy, or Snowy).
+
+Draws the whole weather history as a line chart that can be zoomed and panned.
+'''
+import bisect
+import datetime
+import time
+import tkinter as tk
+
+#Series drawn on the chart and their colours
+SERIES = [
+    ("Max Temperature", "#e63946"),
+    ("Min Temperature", "#1d3557"),
+    ("Humidity", "#2a9d8f"),
+    ("Wind Speed", "#f4a261")
+]
+#Space around the plot for the axis labels
+MARGIN_LEFT = 55
+MARGIN_RIGHT = 20
+MARGIN_TOP = 35
+MARGIN_BOTTOM = 40
+#Smallest number of days the chart can zoom in to
+MIN_SPAN_DAYS = 7
+#Views whose downsampled lines are kept before the cache is emptied
+MAX_DOWNSAMPLED = 64
+
+def lttb(xs, ys, threshold):
+    """
+    Downsamples a series with Largest-Triangle-Three-Buckets, which keeps the
+    peaks and dips that a plain every-nth-point decimation would lose.
+
+    Parameters:
+        xs: x values in increasing order (list)
+        ys: y values, one for each x (list)
+        threshold: number of points to keep, at least 3 (int)
+    Returns:
+        xs, ys: the kept points, the first and last always included (tuple of lists)
+    """
+    count = len(xs)
+    if threshold >= count or threshold < 3:
+        return list(xs), list(ys)
+    out_x = [xs[0]]
+    out_y = [ys[0]]
+    #Every bucket but the first and last holds this many points
+    every = (count - 2) / (threshold - 2)
+    previous = 0
+    for bucket in range(threshold - 2):
+        #Averages the next bucket, the third corner of the triangle
+        next_start = int((bucket + 1) * every) + 1
+        next_end = min(int((bucket + 2) * every) + 1, count)
+        size = next_end - next_start
+        avg_x = sum(xs[next_start:next_end]) / size
+        avg_y = sum(ys[next_start:next_end]) / size
+        #Keeps the point of this bucket that makes the largest triangle
+        prev_x = xs[previous]
+        prev_y = ys[previous]
+        best = start = int(bucket * every) + 1
+        best_area = -1.0
+        for point in range(start, int((bucket + 1) * every) + 1):
+            area = abs((prev_x - avg_x) * (ys[point] - prev_y) - (prev_x - xs[point]) * (avg_y - prev_y))
+            if area > best_area:
+                best_area = area
+                best = point
+        out_x.append(xs[best])
+        out_y.append(ys[best])
+        previous = best
+    out_x.append(xs[-1])
+    out_y.append(ys[-1])
+    return out_x, out_y
+
+def to_day_numbers(date_keys):
+    """
+    Turns yyyy-mm-dd dates into day numbers, so gaps in the data keep their width on the chart.
+
+    Parameters:
+        date_keys: dates in yyyy-mm-dd format, in order (list)
+    Returns:
+        proleptic Gregorian day numbers (list of int)
+    """
+    return [datetime.date.fromisoformat(date_key).toordinal() for date_key in date_keys]
+
+class Weather_Chart():
+    """
+    A window with one line per weather field over the whole history.
+    Each field is a single canvas line whose points are replaced on every redraw,
+    downsampled to the plot width, so zooming and panning stay cheap for any history length.
+    The downsampled lines are cached per data version, plot width and range of days, so
+    a redraw of a view that was already drawn only scales the kept points.
+    The mouse wheel zooms around the pointer, dragging pans and a double click shows everything.
+    """
+    def __init__(self, master, weather_data, width=900, height=400, clock=None):
+        """
+        Initializes the Weather_Chart and opens its window.
+
+        Parameters:
+            master: the main window (tk.Tk)
+            weather_data: the data to chart (Weather_App_Data)
+            width: width of the chart in pixels, default is 900 (int)
+            height: height of the chart in pixels, default is 400 (int)
+            clock: frame clock that redraws are coalesced on, default is redrawing when Tk is idle (Frame_Clock)
+        """
+        self.__weather_data = weather_data
+        self.__width = width
+        self.__height = height
+        self.__clock = clock
+        self.__redraw_pending = False
+        self.__last_redraw_seconds = 0.0
+        self.__drag_x = None
+        self.__xs = []
+        self.__columns = {}
+        self.__version = None
+        self.__downsampled = {} #maps (data version, plot width, first slot, end slot) to (lines, y low, y high)
+        self.__view = (0.0, 1.0) #first and last day number on screen
+
+        #Creates the window and the canvas
+        self.__window = tk.Toplevel(master)
+        self.__window.title("Weather History")
+        self.__window.resizable(False, False)
+        self.__window.protocol("WM_DELETE_WINDOW", self.close)
+        self.__canvas = tk.Canvas(self.__window, width=width, height=height, bg="#FFFBF1")
+        self.__canvas.pack()
+        self.__open = True
+
+        #Draws the plot area and the items that are updated on every redraw
+        self.__canvas.create_rectangle(MARGIN_LEFT, MARGIN_TOP, width - MARGIN_RIGHT, height - MARGIN_BOTTOM,
+                                       fill="#edf2fb", outline="#2B5876")
+        self.__lines = {}
+        legend_x = MARGIN_LEFT
+        for name, color in SERIES:
+            self.__lines[name] = self.__canvas.create_line(0, 0, 0, 0, fill=color, width=1.5)
+            self.__canvas.create_text(legend_x, MARGIN_TOP / 2, text=name, fill=color, anchor="w",
+                                      font=("Tahoma", 11, "bold"))
+            legend_x += 170
+        self.__labels = {
+            "y_high": self.__canvas.create_text(MARGIN_LEFT - 5, MARGIN_TOP, anchor="e", font=("Tahoma", 10)),
+            "y_low": self.__canvas.create_text(MARGIN_LEFT - 5, height - MARGIN_BOTTOM, anchor="e", font=("Tahoma", 10)),
+            "x_first": self.__canvas.create_text(MARGIN_LEFT, height - MARGIN_BOTTOM + 15, anchor="w", font=("Tahoma", 10)),
+            "x_last": self.__canvas.create_text(width - MARGIN_RIGHT, height - MARGIN_BOTTOM + 15, anchor="e", font=("Tahoma", 10))
+        }
+
+        #Zooms with the mouse wheel (Button-4 and Button-5 are the wheel on X11) and pans by dragging
+        self.__canvas.bind("<MouseWheel>", lambda event: self.zoom(event.x, 0.8 if event.delta > 0 else 1.25))
+        self.__canvas.bind("<Button-4>", lambda event: self.zoom(event.x, 0.8))
+        self.__canvas.bind("<Button-5>", lambda event: self.zoom(event.x, 1.25))
+        self.__canvas.bind("<ButtonPress-1>", self.start_drag)
+        self.__canvas.bind("<B1-Motion>", self.drag)
+        self.__canvas.bind("<Double-Button-1>", lambda event: self.show_all())
+
+        self.reload()
+        self.show_all()
+
+    def reload(self):
+        """
+        Takes the latest columns from the data and redraws, keeping the zoomed range.
+        """
+        version = self.__weather_data.get_data_version()
+        if version != self.__version:
+            self.__version = version
+            self.__downsampled = {}
+            self.__columns = self.__weather_data.get_columns()
+            self.__xs = to_day_numbers(self.__columns["Date"])
+        self.request_redraw()
+
+    def get_plot_width(self):
+        """
+        Returns the width of the plot area.
+        Returns:
+            width in pixels (int)
+        """
+        return self.__width - MARGIN_LEFT - MARGIN_RIGHT
+
+    def show_all(self):
+        """
+        Zooms out to the whole history.
+        """
+        if self.__xs:
+            self.set_view(self.__xs[0], max(self.__xs[-1], self.__xs[0] + MIN_SPAN_DAYS))
+
+    def set_view(self, first, last):
+        """
+        Shows the days between two day numbers, kept within the history.
+
+        Parameters:
+            first: the day number at the left edge (float)
+            last: the day number at the right edge (float)
+        """
+        if not self.__xs:
+            return
+        span = min(max(last - first, MIN_SPAN_DAYS), max(self.__xs[-1] - self.__xs[0], MIN_SPAN_DAYS))
+        first = max(self.__xs[0], min(first, self.__xs[-1] - span))
+        self.__view = (first, first + span)
+        self.request_redraw()
+
+    def zoom(self, pixel_x, factor):
+        """
+        Zooms in or out around a point of the plot.
+
+        Parameters:
+            pixel_x: x position of the pointer on the canvas (int)
+            factor: below 1 zooms in, above 1 zooms out (float)
+        """
+        first, last = self.__view
+        fraction = min(max((pixel_x - MARGIN_LEFT) / self.get_plot_width(), 0.0), 1.0)
+        center = first + (last - first) * fraction
+        span = (last - first) * factor
+        self.set_view(center - span * fraction, center + span * (1 - fraction))
+
+    def start_drag(self, event):
+        """
+        Remembers where a drag started.
+
+        Parameters:
+            event: the button press (tk.Event)
+        """
+        self.__drag_x = event.x
+
+    def drag(self, event):
+        """
+        Pans the chart by the distance the pointer moved.
+
+        Parameters:
+            event: the pointer motion (tk.Event)
+        """
+        if self.__drag_x is None:
+            return
+        first, last = self.__view
+        days = (self.__drag_x - event.x) * (last - first) / self.get_plot_width()
+        self.__drag_x = event.x
+        self.set_view(first + days, last + days)
+
+    def request_redraw(self):
+        """
+        Redraws on the next frame, once no matter how many changes were asked for.
+        """
+        if self.__clock is not None:
+            self.__clock.request_frame(self.redraw, self)
+        elif not self.__redraw_pending:
+            self.__redraw_pending = True
+            self.__window.after_idle(self.redraw)
+
+    def redraw(self):
+        """
+        Downsamples the days on screen to the plot width and moves every line to its new points.
+        """
+        self.__redraw_pending = False
+        if not self.__open or not self.__xs:
+            return
+        start = time.perf_counter()
+        first, last = self.__view
+        #Finds the days on screen with a binary search instead of a scan
+        low = bisect.bisect_left(self.__xs, first)
+        high = bisect.bisect_right(self.__xs, last)
+        if low >= high:
+            return
+        plot_width = self.get_plot_width()
+        key = (self.__version, plot_width, low, high)
+        entry = self.__downsampled.get(key)
+        if entry is None:
+            xs = self.__xs[low:high]
+            #Uses one y scale for every series so the lines can be compared
+            y_low = min(min(self.__columns[name][low:high]) for name, _ in SERIES)
+            y_high = max(max(self.__columns[name][low:high]) for name, _ in SERIES)
+            if y_high == y_low:
+                y_high = y_low + 1.0
+            lines = {name: lttb(xs, self.__columns[name][low:high], plot_width) for name, _ in SERIES}
+            if len(self.__downsampled) >= MAX_DOWNSAMPLED:
+                self.__downsampled.clear()
+            entry = self.__downsampled[key] = (lines, y_low, y_high)
+        lines, y_low, y_high = entry
+        plot_height = self.__height - MARGIN_TOP - MARGIN_BOTTOM
+        x_scale = plot_width / (last - first)
+        y_scale = plot_height / (y_high - y_low)
+        for name, _ in SERIES:
+            kept_x, kept_y = lines[name]
+            points = []
+            for x, y in zip(kept_x, kept_y):
+                points.append(MARGIN_LEFT + (x - first) * x_scale)
+                points.append(MARGIN_TOP + (y_high - y) * y_scale)
+            if len(points) == 2:
+                points = points * 2 #a line needs two points
+            self.__canvas.coords(self.__lines[name], points)
+        #Updates the axis labels
+        self.__canvas.itemconfigure(self.__labels["y_high"], text="%.1f" % y_high)
+        self.__canvas.itemconfigure(self.__labels["y_low"], text="%.1f" % y_low)
+        self.__canvas.itemconfigure(self.__labels["x_first"], text=datetime.date.fromordinal(int(first)).isoformat())
+        self.__canvas.itemconfigure(self.__labels["x_last"], text=datetime.date.fromordinal(int(last)).isoformat())
+        self.__last_redraw_seconds = time.perf_counter() - start
+
+    def get_last_redraw_seconds(self):
+        """
+        Returns how long the last redraw took.
+        Returns:
+            self.__last_redraw_seconds: duration in seconds (float)
+        """
+        return self.__last_redraw_seconds
+
+    def is_open(self):
+        """
+        Tells whether the chart window is still open.
+        Returns:
+            self.__open (bool)
+        """
+        return self.__open
+
+    def lift(self):
+        """
+        Brings the chart window to the front.
+        """
+        self.__window.deiconify()
+        self.__window.lift()
+
+    def close(self):
+        """
+        Closes the chart window.
+        """
+        self.__open = False
+        self.__window.destroy()
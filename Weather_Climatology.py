@@ -0,0 +1,408 @@
+'''
+Name: Eric and Sanvi
+Last modified: May 21, 2025
+Program details: An application that provides weather monitoring with a GUI from tkinter package.
+                 It will read weather data from a file, automatically updates conditions at set intervals, and
+                 dynamically display weather conditions (e.g., Sunny, Rainy, or Snowy).
+
+Builds percentile sketches of every field for each station and calendar day, so a day
+can be placed against its history, e.g. "97th percentile for May 2".
+'''
+import argparse
+import bisect
+import gzip
+import json
+import multiprocessing
+import os
+import random
+import sys
+import time
+import Weather_App_Data
+
+#Fields that get a sketch, measured and derived
+SKETCH_FIELDS = Weather_App_Data.NUMERIC_FIELDS + Weather_App_Data.DERIVED_FIELDS
+#Years of the same calendar day a sketch needs before its percentiles mean anything
+MIN_HISTORY = 5
+
+class Quantile_Sketch():
+    """
+    A KLL quantile sketch. Values go into a stack of compactors; when the sketch is full
+    a compactor sorts its values and passes every other one up a level, where each value
+    stands for twice as many. Lower levels hold fewer values than higher ones, so the
+    size stays around 3k values for any number of inputs, and two sketches merge by
+    joining their levels.
+    """
+    def __init__(self, k=64):
+        """
+        Initializes an empty Quantile_Sketch.
+
+        Parameters:
+            k: capacity of the top level, larger is more accurate, default is 64 (int)
+        """
+        self.__k = k
+        self.__levels = [[]]
+        self.__count = 0 #values added
+        self.__size = 0 #values held
+        self.__max_size = self.capacity(0) #values held before compacting
+        self.__ranks = None #sorted values and cumulative weights, built on first lookup
+
+    def capacity(self, level):
+        """
+        Returns how many values a level holds before it is compacted.
+
+        Parameters:
+            level: the level, 0 is where values are added (int)
+        Returns:
+            capacity (int)
+        """
+        depth = len(self.__levels) - level - 1
+        return max(2, int(self.__k * (2 / 3) ** depth) + 1)
+
+    def update(self, value):
+        """
+        Adds a value.
+
+        Parameters:
+            value: the value (float)
+        """
+        self.__levels[0].append(value)
+        self.__count += 1
+        self.__size += 1
+        self.__ranks = None
+        if self.__size >= self.__max_size:
+            self.compress()
+
+    def compress(self):
+        """
+        Compacts levels from the bottom until the sketch fits within its capacity.
+        """
+        while self.__size >= self.__max_size:
+            for level in range(len(self.__levels)):
+                if len(self.__levels[level]) >= self.capacity(level):
+                    if level + 1 == len(self.__levels):
+                        self.__levels.append([])
+                        self.__max_size = sum(self.capacity(index) for index in range(len(self.__levels)))
+                    values = sorted(self.__levels[level])
+                    #keeps the odd or even values at random, so the rank error cancels out
+                    kept = values[random.getrandbits(1)::2]
+                    self.__levels[level + 1].extend(kept)
+                    self.__levels[level] = []
+                    self.__size += len(kept) - len(values)
+                    break
+
+    def merge(self, other):
+        """
+        Adds every value of another sketch to this one.
+
+        Parameters:
+            other: the sketch to merge in, left unchanged (Quantile_Sketch)
+        """
+        other_levels = other.get_levels()
+        while len(self.__levels) < len(other_levels):
+            self.__levels.append([])
+        self.__max_size = sum(self.capacity(index) for index in range(len(self.__levels)))
+        for level, values in enumerate(other_levels):
+            self.__levels[level].extend(values)
+            self.__size += len(values)
+        self.__count += other.get_count()
+        self.__ranks = None
+        self.compress()
+
+    def build_ranks(self):
+        """
+        Sorts the held values with their weights, so rank lookups are binary searches.
+        Returns:
+            values, cumulative weights: sorted values and the weight up to and including each (tuple of lists)
+        """
+        if self.__ranks is None:
+            weighted = sorted((value, 1 << level) for level, values in enumerate(self.__levels) for value in values)
+            values = []
+            totals = []
+            total = 0
+            for value, weight in weighted:
+                total += weight
+                values.append(value)
+                totals.append(total)
+            self.__ranks = (values, totals)
+        return self.__ranks
+
+    def percentile(self, value):
+        """
+        Returns the share of added values that are at or below a value.
+
+        Parameters:
+            value: the value to place (float)
+        Returns:
+            percentile between 0 and 100 (float) or None if the sketch is empty
+        """
+        values, totals = self.build_ranks()
+        if not values:
+            return None
+        position = bisect.bisect_right(values, value)
+        if position == 0:
+            return 0.0
+        return 100.0 * totals[position - 1] / totals[-1]
+
+    def quantile(self, fraction):
+        """
+        Returns the value below which a share of the added values fall.
+
+        Parameters:
+            fraction: between 0 and 1, e.g. 0.5 for the median (float)
+        Returns:
+            the value (float) or None if the sketch is empty
+        """
+        values, totals = self.build_ranks()
+        if not values:
+            return None
+        position = bisect.bisect_left(totals, fraction * totals[-1])
+        return values[min(position, len(values) - 1)]
+
+    def get_count(self):
+        """
+        Returns how many values were added.
+        Returns:
+            self.__count: number of values (int)
+        """
+        return self.__count
+
+    def get_levels(self):
+        """
+        Returns the values held at each level.
+        Returns:
+            self.__levels: one list of values per level (list)
+        """
+        return self.__levels
+
+    def to_dict(self):
+        """
+        Returns the sketch as plain data for saving.
+        Returns:
+            dictionary with k, count and levels (dict)
+        """
+        return {"k": self.__k, "count": self.__count,
+                "levels": [[round(value, 3) for value in values] for values in self.__levels]}
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Creates a sketch from data made by to_dict.
+
+        Parameters:
+            data: dictionary with k, count and levels (dict)
+        Returns:
+            sketch: the sketch (Quantile_Sketch)
+        """
+        sketch = cls(data["k"])
+        sketch.__levels = [list(values) for values in data["levels"]] or [[]]
+        sketch.__count = data["count"]
+        sketch.__size = sum(len(values) for values in sketch.__levels)
+        sketch.__max_size = sum(sketch.capacity(index) for index in range(len(sketch.__levels)))
+        return sketch
+
+class Climatology():
+    """
+    One Quantile_Sketch per station, calendar day (mm-dd) and field.
+    """
+    def __init__(self, k=64):
+        """
+        Initializes an empty Climatology.
+
+        Parameters:
+            k: accuracy of every sketch, see Quantile_Sketch, default is 64 (int)
+        """
+        self.__k = k
+        self.__sketches = {} #maps (station, mm-dd, field) to a sketch
+
+    def add(self, station, date_key, record):
+        """
+        Adds one day's measured and derived values.
+
+        Parameters:
+            station: station name (str)
+            date_key: date in yyyy-mm-dd format (str)
+            record: the day's weather data (dict)
+        """
+        values = Weather_App_Data.derived_values(record)
+        day = date_key[5:]
+        for field in SKETCH_FIELDS:
+            value = record[field] if field in record else values[field]
+            key = (station, day, field)
+            sketch = self.__sketches.get(key)
+            if sketch is None:
+                sketch = self.__sketches[key] = Quantile_Sketch(self.__k)
+            sketch.update(value)
+
+    def add_data(self, weather_data):
+        """
+        Adds every stored day of a station in one pass.
+
+        Parameters:
+            weather_data: the station's data (Weather_App_Data)
+        """
+        station = weather_data.get_station()
+        for date_key, record in zip(weather_data.get_day_keys(), weather_data.get_list()):
+            self.add(station, date_key, record)
+
+    def replace_days(self, weather_data, days):
+        """
+        Rebuilds the sketches of some calendar days from the stored data, e.g. after
+        days were corrected or removed, since a sketch cannot take a value back out.
+
+        Parameters:
+            weather_data: the station's data (Weather_App_Data)
+            days: calendar days in mm-dd format (set)
+        """
+        station = weather_data.get_station()
+        for key in [key for key in self.__sketches if key[0] == station and key[1] in days]:
+            del self.__sketches[key]
+        for date_key, record in zip(weather_data.get_day_keys(), weather_data.get_list()):
+            if date_key[5:] in days:
+                self.add(station, date_key, record)
+
+    def merge(self, other):
+        """
+        Adds the sketches of another climatology, e.g. one built by another process.
+
+        Parameters:
+            other: the climatology to merge in, left unchanged (Climatology)
+        """
+        for key, sketch in other.get_sketches().items():
+            if key in self.__sketches:
+                self.__sketches[key].merge(sketch)
+            else:
+                self.__sketches[key] = Quantile_Sketch.from_dict(sketch.to_dict())
+
+    def percentile(self, station, date_key, field, value, min_count=MIN_HISTORY):
+        """
+        Places a value against the station's history for the same calendar day.
+
+        Parameters:
+            station: station name (str)
+            date_key: date in yyyy-mm-dd format (str)
+            field: e.g. "Max Temperature" or "Dew Point" (str)
+            value: the value to place (float)
+            min_count: values the sketch needs before a percentile is given, default is MIN_HISTORY (int)
+        Returns:
+            percentile between 0 and 100 (float) or None if there is too little history for that day
+        """
+        sketch = self.__sketches.get((station, date_key[5:], field))
+        if sketch is None or sketch.get_count() < min_count:
+            return None
+        return sketch.percentile(value)
+
+    def get_sketch(self, station, day, field):
+        """
+        Returns the sketch for a station, calendar day and field.
+
+        Parameters:
+            station: station name (str)
+            day: calendar day in mm-dd format (str)
+            field: the field (str)
+        Returns:
+            the sketch (Quantile_Sketch) or None if there is none
+        """
+        return self.__sketches.get((station, day, field))
+
+    def get_sketches(self):
+        """
+        Returns every sketch.
+        Returns:
+            self.__sketches: maps (station, mm-dd, field) to sketches (dict)
+        """
+        return self.__sketches
+
+    def save(self, file_name):
+        """
+        Writes the climatology as gzip-compressed JSON.
+
+        Parameters:
+            file_name: the file to write, e.g. "climatology.json.gz" (str)
+        """
+        data = {"k": self.__k, "sketches": [[station, day, field, sketch.to_dict()]
+                                             for (station, day, field), sketch in self.__sketches.items()]}
+        with gzip.open(file_name, "wt", encoding="utf-8") as out:
+            json.dump(data, out, separators=(",", ":"))
+
+def load(file_name):
+    """
+    Reads a climatology written by Climatology.save.
+
+    Parameters:
+        file_name: the file to read (str)
+    Returns:
+        climatology: the climatology (Climatology)
+    """
+    with gzip.open(file_name, "rt", encoding="utf-8") as data_file:
+        data = json.load(data_file)
+    climatology = Climatology(data["k"])
+    sketches = climatology.get_sketches()
+    for station, day, field, sketch in data["sketches"]:
+        sketches[(station, day, field)] = Quantile_Sketch.from_dict(sketch)
+    return climatology
+
+def build_file(file_name, k=64):
+    """
+    Builds the climatology of one station file, for running in a worker process.
+
+    Parameters:
+        file_name: the station file (str)
+        k: accuracy of every sketch (int)
+    Returns:
+        climatology: the station's sketches (Climatology)
+    """
+    climatology = Climatology(k)
+    climatology.add_data(Weather_App_Data.Weather_App_Data(file_name))
+    return climatology
+
+def build(file_names, k=64, processes=1):
+    """
+    Builds one climatology from many station files, in parallel when more than one process is asked for.
+
+    Parameters:
+        file_names: the station files, each named after its station (list)
+        k: accuracy of every sketch, default is 64 (int)
+        processes: number of worker processes, default is 1 (int)
+    Returns:
+        climatology: the merged sketches (Climatology)
+    """
+    climatology = Climatology(k)
+    jobs = [(file_name, k) for file_name in file_names]
+    if processes > 1:
+        with multiprocessing.Pool(processes) as pool:
+            for part in pool.starmap(build_file, jobs):
+                climatology.merge(part)
+    else:
+        for job in jobs:
+            climatology.merge(build_file(*job))
+    return climatology
+
+def main(arguments=None):
+    """
+    Builds a climatology file from station files on the command line.
+
+    Parameters:
+        arguments: command line arguments, default is sys.argv (list)
+    """
+    parser = argparse.ArgumentParser(description="Builds per-day percentile sketches from station files.")
+    parser.add_argument("files", nargs="+", help="station files, or folders of them")
+    parser.add_argument("--out", default="climatology.json.gz")
+    parser.add_argument("--k", type=int, default=64)
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+    options = parser.parse_args(arguments)
+
+    file_names = []
+    for path in options.files:
+        if os.path.isdir(path):
+            file_names.extend(os.path.join(path, name) for name in sorted(os.listdir(path)))
+        else:
+            file_names.append(path)
+    start_time = time.perf_counter()
+    climatology = build(file_names, options.k, options.processes)
+    climatology.save(options.out)
+    print("%d sketches from %d files in %.2f s, %d bytes" % (
+        len(climatology.get_sketches()), len(file_names), time.perf_counter() - start_time,
+        os.path.getsize(options.out)), file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
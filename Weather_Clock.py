@@ -0,0 +1,302 @@
+'''
+Name: Eric and Sanvi
+Last modified: May 21, 2025
+Program details: An application that provides weather monitoring with a GUI from tkinter package.
+                 It will read weather data from a file, automatically updates conditions at set intervals, and
+                 dynamically display weather conditions (e.g., Sunny, Rainy, or Snowy).
+
+Runs every moving widget off one frame clock instead of one after() chain each.
+'''
+import time
+
+#Idle policies: when the clock keeps running
+IDLE_POLICIES = ("visible", "focused", "never")
+
+def bounce(distance, low, high):
+    """
+    Folds a distance travelled into a position that bounces between two limits.
+
+    Parameters:
+        distance: how far the object has moved since it was at low (float)
+        low: the lower limit (float)
+        high: the upper limit (float)
+    Returns:
+        the position between low and high (float)
+    """
+    span = high - low
+    distance = distance % (2 * span)
+    if distance <= span:
+        return low + distance
+    return high - (distance - span)
+
+class Frame_Clock():
+    """
+    One after() chain at a fixed frame rate that drives every animated widget.
+    Updaters are called with the seconds since they were added, so positions are
+    worked out from elapsed time instead of adding a step on every tick.
+    One-shot frame requests are also run on the next frame, and a newer request
+    with the same key replaces an older one, so bursts of changes draw once.
+    The clock stops scheduling itself while it has no work, and while the
+    window it watches is hidden, so an idle kiosk does no per-frame work.
+    """
+    def __init__(self, widget, fps=20, monitor=None):
+        """
+        Initializes the Frame_Clock without starting it.
+
+        Parameters:
+            widget: any Tk widget, used to schedule the frames (tk.Misc)
+            fps: frames per second, default is 20 (int)
+            monitor: event loop monitor the frames are scheduled through (Loop_Monitor or None)
+        """
+        self.__widget = widget
+        self.__interval = 1.0 / fps
+        self.__monitor = monitor
+        self.__updaters = {} #maps updaters to the time they were added
+        self.__requests = {} #maps request keys to the latest callback for the next frame
+        self.__dropped = 0
+        self.__after_id = None
+        self.__next_due = 0.0
+        self.__ticks = 0
+        self.__policy = "never"
+        self.__window = None
+        self.__window_state = {"mapped": True, "visible": True, "focused": True}
+        self.__paused_at = None #time the clock was paused, None while running
+
+    def add_updater(self, updater):
+        """
+        Adds a function that is called on every frame and draws it straight away.
+
+        Parameters:
+            updater: function taking the seconds since it was added (function)
+        Returns:
+            updater, so it can be passed to remove_updater later (function)
+        """
+        self.__updaters[updater] = time.perf_counter()
+        updater(0.0)
+        self.start()
+        return updater
+
+    def remove_updater(self, updater):
+        """
+        Stops calling an updater. Does nothing if it was already removed.
+
+        Parameters:
+            updater: a function given to add_updater (function)
+        """
+        self.__updaters.pop(updater, None)
+        if not self.__updaters:
+            self.stop()
+
+    def request_frame(self, callback, key=None):
+        """
+        Runs a callback once on the next frame. A request with the same key that has
+        not run yet is dropped, so only the latest one runs.
+
+        Parameters:
+            callback: function called with no arguments (function)
+            key: what the request replaces, default is the callback itself (object)
+        """
+        if key is None:
+            key = callback
+        if key in self.__requests:
+            self.__dropped += 1
+        self.__requests[key] = callback
+        self.start()
+
+    def cancel_frame(self, key):
+        """
+        Drops a request that has not run yet. Does nothing if there is none.
+
+        Parameters:
+            key: the key the request was made with (object)
+        """
+        if self.__requests.pop(key, None) is not None:
+            self.__dropped += 1
+
+    def start(self):
+        """
+        Schedules the next frame if none is scheduled yet.
+        """
+        if self.__after_id is None and (self.__updaters or self.__requests) and self.__paused_at is None:
+            self.__next_due = time.perf_counter() + self.__interval
+            self.schedule()
+
+    def stop(self):
+        """
+        Cancels the next frame.
+        """
+        if self.__after_id is not None:
+            self.__widget.after_cancel(self.__after_id)
+            self.__after_id = None
+
+    def schedule(self):
+        """
+        Schedules tick for the next frame time, so frames do not drift.
+        Does nothing while a frame is already scheduled, so there is only ever one chain.
+        """
+        if self.__after_id is not None:
+            return
+        delay = max(1, int(round((self.__next_due - time.perf_counter()) * 1000)))
+        if self.__monitor is not None:
+            self.__after_id = self.__monitor.after(self.__widget, delay, self.tick, "Frame_Clock.tick")
+        else:
+            self.__after_id = self.__widget.after(delay, self.tick)
+
+    def tick(self):
+        """
+        Runs the waiting requests, calls every updater with its elapsed time
+        and schedules the next frame.
+        """
+        self.__after_id = None
+        self.__ticks += 1
+        #Takes the requests first, so ones made while drawing wait for the next frame
+        requests = list(self.__requests.values())
+        self.__requests.clear()
+        for callback in requests:
+            callback()
+        now = time.perf_counter()
+        for updater, added in list(self.__updaters.items()):
+            if updater not in self.__updaters:
+                continue #removed by an earlier updater in this frame
+            start = time.perf_counter()
+            updater(now - added)
+            if self.__monitor is not None:
+                self.__monitor.record(getattr(updater, "__qualname__", repr(updater)), 0.0,
+                                      time.perf_counter() - start)
+        #a request or updater that started the clock again has already scheduled the next frame
+        if self.__after_id is None and (self.__updaters or self.__requests) and self.__paused_at is None:
+            #skips frames that were missed instead of running them back to back
+            self.__next_due = max(self.__next_due + self.__interval, now + self.__interval / 2)
+            self.schedule()
+
+    def watch_window(self, window, policy="visible"):
+        """
+        Pauses the clock while the window cannot be seen and resumes it when it can.
+
+        Parameters:
+            window: the toplevel window to watch (tk.Tk or tk.Toplevel)
+            policy: "visible" pauses while the window is minimised or fully covered,
+                    "focused" also pauses while another application has the focus,
+                    "never" keeps running, default is "visible" (str)
+        """
+        if policy not in IDLE_POLICIES:
+            raise ValueError("policy must be one of " + ", ".join(IDLE_POLICIES))
+        self.__policy = policy
+        if self.__window is None:
+            self.__window = window
+            #Events of child widgets also reach the toplevel, so the handlers check the widget
+            window.bind("<Map>", lambda event: self.set_window_state(event, "mapped", True), add="+")
+            window.bind("<Unmap>", lambda event: self.set_window_state(event, "mapped", False), add="+")
+            window.bind("<Visibility>", lambda event: self.set_window_state(
+                event, "visible", event.state != "VisibilityFullyObscured"), add="+")
+            window.bind("<FocusIn>", lambda event: window.after_idle(self.check_focus), add="+")
+            window.bind("<FocusOut>", lambda event: window.after_idle(self.check_focus), add="+")
+        self.update_pause()
+
+    def set_window_state(self, event, key, value):
+        """
+        Stores a map or visibility change of the watched window.
+
+        Parameters:
+            event: the Tk event (tk.Event)
+            key: "mapped" or "visible" (str)
+            value: the new state (bool)
+        """
+        if event.widget is not self.__window:
+            return
+        self.__window_state[key] = value
+        if key == "mapped":
+            #A newly mapped window is visible until told otherwise
+            self.__window_state["visible"] = value
+        self.update_pause()
+
+    def check_focus(self):
+        """
+        Checks whether any widget of the application has the keyboard focus.
+        Runs after the focus events have settled, so moving between widgets does not pause.
+        """
+        try:
+            focused = self.__window.focus_displayof() is not None
+        except KeyError:
+            focused = True #the focus is on a widget tkinter does not know, e.g. a dialog
+        self.__window_state["focused"] = focused
+        self.update_pause()
+
+    def update_pause(self):
+        """
+        Pauses or resumes the clock to match the window state and the idle policy.
+        """
+        state = self.__window_state
+        if self.__policy == "never":
+            running = True
+        elif self.__policy == "focused":
+            running = state["mapped"] and state["visible"] and state["focused"]
+        else:
+            running = state["mapped"] and state["visible"]
+        if running:
+            self.resume()
+        else:
+            self.pause()
+
+    def pause(self):
+        """
+        Stops all per-frame work until resume is called.
+        """
+        if self.__paused_at is None:
+            self.__paused_at = time.perf_counter()
+            self.stop()
+
+    def resume(self):
+        """
+        Restarts the clock with the paused time left out of every updater's elapsed time,
+        and draws a frame straight away so nothing waits for the next tick.
+        """
+        if self.__paused_at is None:
+            return
+        now = time.perf_counter()
+        for updater, added in self.__updaters.items():
+            self.__updaters[updater] = added + now - max(self.__paused_at, added)
+        self.__paused_at = None
+        self.__next_due = now
+        if self.__updaters or self.__requests:
+            self.tick()
+
+    def is_paused(self):
+        """
+        Tells whether the clock is paused because the window is hidden.
+        Returns:
+            True while paused (bool)
+        """
+        return self.__paused_at is not None
+
+    def is_scheduled(self):
+        """
+        Tells whether the next frame is scheduled.
+        Returns:
+            True while a frame is pending (bool)
+        """
+        return self.__after_id is not None
+
+    def get_ticks(self):
+        """
+        Returns how many frames the clock has run.
+        Returns:
+            self.__ticks: number of frames (int)
+        """
+        return self.__ticks
+
+    def get_dropped(self):
+        """
+        Returns how many frame requests were replaced or cancelled before they ran.
+        Returns:
+            self.__dropped: number of dropped requests (int)
+        """
+        return self.__dropped
+
+    def get_fps(self):
+        """
+        Returns the frame rate of the clock.
+        Returns:
+            frames per second (float)
+        """
+        return 1.0 / self.__interval
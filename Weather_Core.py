@@ -0,0 +1,72 @@
+'''
+Name: Eric and Sanvi
+Last modified: May 21, 2025
+Program details: An application that provides weather monitoring with a GUI from tkinter package.
+                 It will read weather data from a file, automatically updates conditions at set intervals, and
+                 dynamically display weather conditions (e.g., Sunny, Rainy, or Snowy).
+
+The data, calculation and classification layers of the weather app, without tkinter or PIL.
+Batch jobs and servers import this module; Weather_GUI builds the window on top of it.
+'''
+from Weather_App_Data import Weather_App_Data, Weather_Calculations, Rolling_Aggregates, rolling_series
+from Determine_Weather_Condition import Determine_Weather_Condition
+from Weather_Observation_Log import Observation_Log
+from Weather_Readers import FIELDS, get_reader, register_reader
+import Weather_Rules
+
+#Weather conditions that Determine_Weather_Condition can report, from the rule file
+VALID_CONDITIONS = Weather_Rules.get_rule_table().get_names()
+
+def determine_condition(weather_data, day_index):
+    """
+    Determines the weather condition and description for a specified day
+    and stores the condition in the day's data.
+
+    Parameters:
+        weather_data: the weather data and calculations (Weather_Calculations)
+        day_index: the index of the day in the weather data list (int)
+    Returns:
+        condition, description: the weather condition (str) and description (str)
+    """
+    #Creates a weather condition object for the specified day
+    weather_info = Determine_Weather_Condition(weather_data, day_index)
+    #Determines the weather condition
+    weather_info.condition()
+    condition = weather_info.get_weather_condition()
+    description = weather_info.get_weather_description()
+
+    #Checks if the condition is valid
+    contains_valid = False
+    for valid in VALID_CONDITIONS:
+        if valid in condition:
+            contains_valid = True
+            break
+
+    #Sets a default condition if invalid or empty
+    if not condition or not contains_valid:
+        condition = "Surprise!"
+
+    #Updates the condition in the data list
+    weather_data.get_list()[day_index]["Condition"] = condition
+    return condition, description
+
+def determine_conditions(weather_data, rules=None):
+    """
+    Determines the weather condition and description of every stored day in one pass
+    over the columns, and stores each condition in its day's data.
+
+    Parameters:
+        weather_data: the weather data and calculations (Weather_Calculations)
+        rules: the compiled condition rules, default is the rules in conditions.json (Rule_Table)
+    Returns:
+        conditions, descriptions: one condition (str) and description (str) per day (tuple of lists)
+    """
+    rules = rules or Weather_Rules.get_rule_table()
+    columns = dict(weather_data.get_columns())
+    columns["Heat Index"] = weather_data.get_heat_index()
+    columns["Wind Chill"] = weather_data.get_wind_chill()
+    columns["Dew Point"] = weather_data.get_dew_point()
+    conditions, descriptions = rules.evaluate_batch(columns)
+    for day, condition in zip(weather_data.get_list(), conditions):
+        day["Condition"] = condition
+    return conditions, descriptions
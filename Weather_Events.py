@@ -0,0 +1,281 @@
+'''
+Name: Eric and Sanvi
+Last modified: May 21, 2025
+Program details: An application that provides weather monitoring with a GUI from tkinter package.
+                 It will read weather data from a file, automatically updates conditions at set intervals, and
+                 dynamically display weather conditions (e.g., Sunny, Rainy, or Snowy).
+
+Pushes the change-set of each ingest to server-sent event subscribers.
+'''
+import asyncio
+import collections
+import json
+
+#Events queued for one subscriber before it is told to resync instead
+MAX_QUEUED = 256
+#Seconds between keep-alive comments on an idle stream
+KEEP_ALIVE_SECONDS = 15.0
+
+class Subscriber():
+    """
+    One event stream. Events are queued without waiting, so a slow client never
+    holds up ingest; when the queue is full it is emptied and the client is sent a
+    resync event telling it to download the data again.
+    """
+    def __init__(self, station=None, max_queued=MAX_QUEUED):
+        """
+        Initializes the Subscriber with an empty queue.
+
+        Parameters:
+            station: only send this station's events, default is every station (str)
+            max_queued: events queued before the subscriber must resync, default is MAX_QUEUED (int)
+        """
+        self.__station = station
+        self.__max_queued = max_queued
+        self.__queue = collections.deque()
+        self.__ready = asyncio.Event()
+        self.__resync = False
+        self.__closed = False
+        self.__dropped = 0
+
+    def push(self, message):
+        """
+        Queues an encoded event, or drops the queue and asks for a resync if it is full.
+
+        Parameters:
+            message: the event in the text/event-stream format (bytes)
+        Returns:
+            True if the queue overflowed (bool)
+        """
+        overflowed = False
+        if len(self.__queue) >= self.__max_queued:
+            self.__dropped += len(self.__queue)
+            self.__queue.clear()
+            self.__resync = True
+            overflowed = True
+        if self.__resync:
+            self.__dropped += 1 #the client downloads everything again anyway
+        else:
+            self.__queue.append(message)
+        self.__ready.set()
+        return overflowed
+
+    async def next_messages(self, timeout):
+        """
+        Waits for queued events.
+
+        Parameters:
+            timeout: seconds to wait before returning with nothing (float)
+        Returns:
+            messages: the queued events, a resync event if the queue overflowed,
+                      an empty list after the timeout (list of bytes), or None once closed
+        """
+        try:
+            await asyncio.wait_for(self.__ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            return []
+        self.__ready.clear()
+        if self.__closed:
+            return None
+        if self.__resync:
+            self.__resync = False
+            return [encode("resync", None, {"reason": "the client fell behind"})]
+        messages = list(self.__queue)
+        self.__queue.clear()
+        return messages
+
+    def close(self):
+        """
+        Ends the stream, e.g. when the server stops.
+        """
+        self.__closed = True
+        self.__ready.set()
+
+    def get_station(self):
+        """
+        Returns the station the subscriber follows.
+        Returns:
+            self.__station: station name, or None for every station (str)
+        """
+        return self.__station
+
+    def get_dropped(self):
+        """
+        Returns how many events were dropped because the subscriber fell behind.
+        Returns:
+            self.__dropped: number of events (int)
+        """
+        return self.__dropped
+
+class Event_Hub():
+    """
+    Sends every change-set a station's change log records to the subscribers, as one
+    event per ingest. Each event is encoded once and the same bytes are queued for every
+    subscriber. The most recent events are kept, so a client that reconnects with its
+    Last-Event-ID gets what it missed instead of having to resync.
+    """
+    def __init__(self, max_queued=MAX_QUEUED, history=1024):
+        """
+        Initializes the Event_Hub with no subscribers.
+
+        Parameters:
+            max_queued: events queued per subscriber before it must resync, default is MAX_QUEUED (int)
+            history: events kept for reconnecting clients, default is 1024 (int)
+        """
+        self.__max_queued = max_queued
+        self.__subscribers = {} #maps stations, or None for every station, to sets of subscribers
+        self.__history = collections.deque(maxlen=history) #(event id, station, encoded event)
+        self.__sequence = 0
+        self.__metrics = {"events": 0, "dropped": 0, "resyncs": 0}
+
+    def attach(self, weather_data):
+        """
+        Starts sending the changes of a station's ingests.
+
+        Parameters:
+            weather_data: the station's data (Weather_App_Data)
+        """
+        weather_data.get_change_log().add_listener(self.changed)
+
+    def changed(self, weather_data, change_set):
+        """
+        Sends one ingest's change-set to the subscribers of its station and of every station.
+        A change-set too large to list its days is sent as a resync.
+        Has the signature of a change log listener.
+
+        Parameters:
+            weather_data: the station's data (Weather_App_Data)
+            change_set: the change-set from the station's Change_Log (dict)
+        """
+        self.__sequence += 1
+        station = change_set["station"]
+        if change_set["reset"]:
+            message = encode("resync", self.__sequence, {"station": station, "reason": "most of the data changed"})
+        else:
+            message = encode("change", self.__sequence, change_set)
+        self.__history.append((self.__sequence, station, message))
+        for subscribers in (self.__subscribers.get(None, ()), self.__subscribers.get(station, ())):
+            for subscriber in subscribers:
+                if subscriber.push(message):
+                    self.__metrics["resyncs"] += 1
+        self.__metrics["events"] += 1
+
+    def replay(self, last_event_id, station=None):
+        """
+        Returns the events sent after an event id, for a client that reconnects.
+
+        Parameters:
+            last_event_id: the Last-Event-ID the client sent (str)
+            station: only this station's events, default is every station (str)
+        Returns:
+            messages: the encoded events (list of bytes), or None if some were no longer kept
+        """
+        try:
+            sequence = int(last_event_id)
+        except ValueError:
+            return None
+        oldest = self.__history[0][0] if self.__history else self.__sequence + 1
+        if sequence > self.__sequence or sequence < oldest - 1:
+            return None #from before a restart, or older than the events kept
+        return [message for event_id, event_station, message in self.__history
+                if event_id > sequence and (station is None or event_station == station)]
+
+    def subscribe(self, station=None):
+        """
+        Adds a subscriber.
+
+        Parameters:
+            station: only send this station's events, default is every station (str)
+        Returns:
+            subscriber: the new subscriber (Subscriber)
+        """
+        subscriber = Subscriber(station, self.__max_queued)
+        self.__subscribers.setdefault(station, set()).add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        """
+        Removes a subscriber.
+
+        Parameters:
+            subscriber: the subscriber from subscribe (Subscriber)
+        """
+        self.__subscribers.get(subscriber.get_station(), set()).discard(subscriber)
+        self.__metrics["dropped"] += subscriber.get_dropped()
+
+    async def stream(self, writer, station=None, last_event_id=None, keep_alive_seconds=KEEP_ALIVE_SECONDS):
+        """
+        Subscribes a connection and writes its events until the client goes away.
+        The response headers must already have been sent.
+
+        Parameters:
+            writer: the asyncio stream writer of the connection (asyncio.StreamWriter)
+            station: only send this station's events, default is every station (str)
+            last_event_id: the Last-Event-ID of a reconnecting client; it gets the events it
+                           missed, or is told to resync if they are no longer kept,
+                           default is a new client (str)
+            keep_alive_seconds: seconds between comments on an idle stream, default is KEEP_ALIVE_SECONDS (float)
+        """
+        subscriber = self.subscribe(station)
+        writer.write(b"retry: 5000\n\n")
+        if last_event_id is not None:
+            missed = self.replay(last_event_id, station)
+            if missed is None:
+                writer.write(encode("resync", None, {"reason": "events were missed while disconnected"}))
+            else:
+                writer.write(b"".join(missed))
+        try:
+            while not writer.is_closing():
+                messages = await subscriber.next_messages(keep_alive_seconds)
+                if messages is None:
+                    break
+                #a comment line keeps proxies from closing an idle stream and finds dead clients
+                writer.write(b"".join(messages) if messages else b": keep-alive\n\n")
+                await writer.drain()
+        finally:
+            self.unsubscribe(subscriber)
+
+    def close(self):
+        """
+        Ends every subscriber's stream.
+        """
+        for subscribers in self.__subscribers.values():
+            for subscriber in subscribers:
+                subscriber.close()
+
+    def get_sequence(self):
+        """
+        Returns the id of the last event sent.
+        Returns:
+            self.__sequence: the id (int)
+        """
+        return self.__sequence
+
+    def get_metrics(self):
+        """
+        Returns subscriber and event counts.
+        Returns:
+            metrics: dictionary of metric names and values (dict)
+        """
+        metrics = dict(self.__metrics)
+        metrics["subscribers"] = sum(len(subscribers) for subscribers in self.__subscribers.values())
+        metrics["dropped"] += sum(subscriber.get_dropped() for subscribers in self.__subscribers.values()
+                                  for subscriber in subscribers)
+        return metrics
+
+def encode(event_type, event_id, data):
+    """
+    Writes one event in the text/event-stream format.
+
+    Parameters:
+        event_type: the event name, e.g. "change" (str)
+        event_id: the event id, or None for none (int)
+        data: the event data, sent as one line of JSON (dict)
+    Returns:
+        the encoded event (bytes)
+    """
+    lines = "event: " + event_type + "\n"
+    if event_id is not None:
+        lines += "id: " + str(event_id) + "\n"
+    lines += "data: " + json.dumps(data, separators=(",", ":")) + "\n\n"
+    return lines.encode("utf-8")
@@ -5,27 +5,104 @@ Program details: An application that provides weather monitoring with a GUI from
                  It will read weather data from a file, automatically updates conditions at set intervals, and
                  dynamically display weather conditions (e.g., Sunny, Rainy, or Snowy).
 '''
-import tkinter as tk
-from PIL import Image, ImageTk
-import Weather_App_Data
-from Determine_Weather_Condition import Determine_Weather_Condition
-from Weather_Animation import create_weather_animation
+import os
+import time
+import Weather_Alerts
+import Weather_Anomaly
+import Weather_Assets
+import Weather_Climatology
+import Weather_Clock
+import Weather_Core
+import Weather_Loop_Monitor
+import Weather_Metrics
+import Weather_Rules
+import Weather_Timing
 
-class Weather_Gui(Weather_App_Data.Weather_Calculations):
+#tkinter and the animations (which pull in PIL) are imported by load_gui_modules when a
+#window is made, so that importing this module stays as cheap as importing Weather_Core
+tk = None
+create_weather_animation = None
+
+#Layout of the scrolling forecast strip: cards sit on a uniform grid
+STRIP_WIDTH = 1200
+CARD_X0 = 30
+CARD_Y1 = 60
+CARD_Y2 = 270
+CARD_WIDTH = 204
+CARD_STRIDE = 234
+#Number of recycled cards, enough to cover the strip while one card is half scrolled out
+CARD_POOL_SIZE = 8
+
+def load_gui_modules():
+    """
+    Imports tkinter and the animation module the first time a window is created.
+    """
+    global tk, create_weather_animation
+    if tk is None:
+        import tkinter
+        from Weather_Animation import create_weather_animation as create_animation
+        tk = tkinter
+        create_weather_animation = create_animation
+
+class Weather_Gui():
     """
     Creates and manages a Tkinter-based GUI for a weather monitoring application.
-    Inherits from Weather_App_Data.Weather_Calculations to access weather data and calculations.
+    Holds a Weather_Core.Weather_Calculations object to access weather data and calculations.
     Displays weather conditions, a 5-day forecast, and animations, with automatic data updates.
     """
-    def __init__(self):
+    def __init__(self, weather_data=None, start_loop=True, timer=None, metrics_port=None, monitor=None, fps=None, idle_policy=None):
         """
         Initializes the Weather_Gui, setting up the main window, frames, and initial display.
         Starts the Tkinter main loop and schedules periodic data refresh.
-        """
-        #Initializes the parent class for weather calculations
-        Weather_App_Data.Weather_Calculations.__init__(self)
+
+        Parameters:
+            weather_data: the data to display, default is a Weather_Calculations for "data.txt" (Weather_Calculations)
+            start_loop: False to return without running the main loop, e.g. for benchmarks (bool)
+            timer: records how long each refresh and redraw phase takes, default is a new
+                   Phase_Timer, disabled if WEATHER_TIMING=0 (Phase_Timer)
+            metrics_port: localhost port for the Prometheus metrics page, default is the
+                          WEATHER_METRICS_PORT environment variable, or no page if unset (int)
+            monitor: measures how late after() callbacks fire and which ones block the loop,
+                     default is a Loop_Monitor with a 50 ms threshold (Loop_Monitor)
+            fps: frame rate of the clock that moves the warning text and the animation,
+                 default is the WEATHER_FPS environment variable or 20 (int)
+            idle_policy: when the frame clock pauses, "visible", "focused" or "never",
+                         default is the WEATHER_IDLE_POLICY environment variable or "visible" (str)
+        """
+        #Imports the GUI libraries
+        load_gui_modules()
+        #Stores the weather data and calculations
+        if weather_data is None:
+            weather_data = Weather_Core.Weather_Calculations()
+        self.__weather_data = weather_data
+        #Stores the phase timer and lets SIGUSR1 print it
+        if timer is None:
+            timer = Weather_Timing.Phase_Timer(enabled=os.environ.get("WEATHER_TIMING", "1") != "0")
+        self.__timer = timer
+        self.__timer.install_signal()
         #Creates the main Tkinter window
         self.main_window = tk.Tk()
+        #Starts the event loop monitor's heartbeat
+        if monitor is None:
+            monitor = Weather_Loop_Monitor.Loop_Monitor()
+        self.__monitor = monitor
+        self.__monitor.start(self.main_window)
+        #Creates the one frame clock that drives every moving widget
+        if fps is None:
+            fps = int(os.environ.get("WEATHER_FPS", "20"))
+        self.__clock = Weather_Clock.Frame_Clock(self.main_window, fps, self.__monitor)
+        #Pauses the animations while the window is hidden
+        if idle_policy is None:
+            idle_policy = os.environ.get("WEATHER_IDLE_POLICY", "visible")
+        self.__clock.watch_window(self.main_window, idle_policy)
+        self.weather_animation = None
+        #Prints the phase timings and the slowest callbacks when F2 is pressed
+        self.main_window.bind("<F2>", lambda event: (self.__timer.dump(), self.__monitor.dump()))
+        #Opens the history chart when F3 is pressed
+        self.__chart = None
+        self.main_window.bind("<F3>", lambda event: self.open_chart())
+        #Shuts down the same way as the quit button when the window is closed
+        self.main_window.protocol("WM_DELETE_WINDOW", self.close)
         #Sets the window title
         self.main_window.title("WeatherApp")
         #Disables window resizing
@@ -37,20 +114,44 @@ class Weather_Gui(Weather_App_Data.Weather_Calculations):
         self.init_top_screen()
         #Sets up the sidebar canvas
         self.init_side_bar()
-        #Initializes the bottom buttons and forecast
+        #Loads the per-day history percentiles
+        self.load_climatology()
+        #Checks every day against its calendar day as it is ingested
+        self.__anomalies = Weather_Anomaly.Anomaly_Detector()
+        self.__anomalies.attach(self.__weather_data)
+        #Raises and clears alerts as days are ingested
+        self.__alerts = Weather_Alerts.Alert_Engine()
+        self.__alerts.attach(self.__weather_data)
+        #Appends the days each ingest changes to the log named by WEATHER_OBSERVATION_LOG
+        self.__observation_log = None
+        if os.environ.get("WEATHER_OBSERVATION_LOG"):
+            self.__observation_log = Weather_Core.Observation_Log(os.environ["WEATHER_OBSERVATION_LOG"])
+            self.__observation_log.attach(self.__weather_data)
+            self.flush_observation_log()
+        #Initializes the bottom buttons and forecast, scrolled to the first day
+        self.__strip_offset = 0
         self.init_bottom_buttons()
-        #Sets the current info to None initially
-        self.__current_info = None
+        #Sets the current day to None initially
+        self.__current_key = None
         #Schedules periodic data refresh
         self.schedule_refresh()
         #Sets the warning text to None initially
         self.warning = None
+        #Starts the metrics page if a port was given
+        self.__last_refresh_seconds = 0.0
+        self.__refresh_count = 0
+        self.__metrics_server = None
+        if metrics_port is None and os.environ.get("WEATHER_METRICS_PORT"):
+            metrics_port = int(os.environ["WEATHER_METRICS_PORT"])
+        if metrics_port is not None:
+            self.start_metrics(metrics_port)
         #Displays info for the first day if data exists
-        if len(self.get_list()) > 0:
-            self.show_info(self.get_list()[0])
+        if len(self.__weather_data.get_list()) > 0:
+            self.show_info(self.__weather_data.get_day_key(0))
 
         #Starts the Tkinter main loop
-        self.main_window.mainloop()
+        if start_loop:
+            self.main_window.mainloop()
    
     def determine_condition(self, day_index):
         """
@@ -62,38 +163,100 @@ class Weather_Gui(Weather_App_Data.Weather_Calculations):
         Returns:
             condition, description: A tuple containing the weather condition (str) and description (str).
         """
-        #Creates a weather condition object for the specified day
-        weather_info = Determine_Weather_Condition(self, day_index)
-        #Determines the weather condition
-        weather_info.condition()
-        #Gets the weather condition string
-        condition = weather_info.get_weather_condition()
-        #Gets the weather description
-        description = weather_info.get_weather_description()
-
-        #Defines valid weather conditions
-        valid_conditions = [
-            "Sunny!", "Rainy!", "Snowy!", "Windy!", "Stormy!",
-            "Tornado!", "Severe Windstorm!", "Hurricane!",
-            "Extreme Cold!", "Extreme Heat!", "Dew Point!"
-        ]
-       
-        #Checks if the condition is valid
-        contains_valid = False
-        for valid in valid_conditions:
-            if valid in condition:
-                contains_valid = True
-                break
-
-        #Sets a default condition if invalid or empty
-        if not condition or not contains_valid:
-            condition = "Surprise!"
-
-        #Updates the condition in the data list
-        self.get_list()[day_index]["Condition"] = condition
-        #Returns the condition and description
-        return condition, description
+        #Determines the condition and stores it in the data list
+        return Weather_Core.determine_condition(self.__weather_data, day_index)
    
+    def get_weather_data(self):
+        """
+        Returns the weather data object shown by the GUI.
+
+        Returns:
+            self.__weather_data: the weather data and calculations (Weather_Calculations).
+        """
+        return self.__weather_data
+
+    def get_timer(self):
+        """
+        Returns the timer that records how long each refresh and redraw phase takes.
+
+        Returns:
+            self.__timer: the phase timer (Phase_Timer).
+        """
+        return self.__timer
+
+    def get_monitor(self):
+        """
+        Returns the monitor that measures after() lateness and blocking callbacks.
+
+        Returns:
+            self.__monitor: the event loop monitor (Loop_Monitor).
+        """
+        return self.__monitor
+
+    def load_climatology(self):
+        """
+        Loads the percentile sketches named by the WEATHER_CLIMATOLOGY environment variable,
+        or climatology.json.gz if it exists, and otherwise builds them from the loaded data.
+        """
+        file_name = os.environ.get("WEATHER_CLIMATOLOGY", "climatology.json.gz")
+        self.__climatology_from_file = os.path.exists(file_name)
+        self.__climatology_sequence = self.__weather_data.get_change_log().get_sequence()
+        if self.__climatology_from_file:
+            self.__climatology = Weather_Climatology.load(file_name)
+        else:
+            self.__climatology = Weather_Climatology.Climatology()
+            self.__climatology.add_data(self.__weather_data)
+
+    def update_climatology(self):
+        """
+        Adds the days ingested since the last update to sketches built from the loaded data.
+        New days are added as they are; the calendar days of corrected or removed days are
+        rebuilt from the stored data, and everything is rebuilt if the change log has moved on.
+        """
+        if self.__climatology_from_file:
+            return
+        change_log = self.__weather_data.get_change_log()
+        change_sets = change_log.since(self.__climatology_sequence)
+        self.__climatology_sequence = change_log.get_sequence()
+        if change_sets is None or any(change_set["reset"] for change_set in change_sets):
+            self.__climatology = Weather_Climatology.Climatology()
+            self.__climatology.add_data(self.__weather_data)
+            return
+        #A sketch cannot take a value back out, so those calendar days start over
+        days = {day["date"][5:] for change_set in change_sets for day in change_set["updated"]}
+        days.update(date_key[5:] for change_set in change_sets for date_key in change_set["removed"])
+        if days:
+            self.__climatology.replace_days(self.__weather_data, days)
+        station = self.__weather_data.get_station()
+        for change_set in change_sets:
+            for day in change_set["inserted"]:
+                record = self.__weather_data.get_day(day["date"])
+                if record is not None and day["date"][5:] not in days:
+                    self.__climatology.add(station, day["date"], record)
+
+    def get_percentile(self, date_key, field, value):
+        """
+        Places a value against the station's history for the same calendar day.
+
+        Parameters:
+            date_key: The day, in yyyy-mm-dd format (str).
+            field: The field, e.g. "Max Temperature" (str).
+            value: The day's value (float).
+
+        Returns:
+            percentile: between 0 and 100, or None with fewer than Weather_Climatology.MIN_HISTORY years of that day (float).
+        """
+        return self.__climatology.percentile(self.__weather_data.get_station(), date_key, field, value)
+
+    def get_clock(self):
+        """
+        Returns the frame clock that drives the warning text and the animation.
+
+        Returns:
+            self.__clock: the frame clock (Frame_Clock).
+        """
+        return self.__clock
+
     def load_and_place_image(self, canvas, image_path, x, y, size=(50, 50), bg_color="#FFFBF1"):
         """
         Loads an image and places it on a Tkinter canvas at specified coordinates.
@@ -110,11 +273,8 @@ class Weather_Gui(Weather_App_Data.Weather_Calculations):
             success: True if the image was loaded and placed successfully, False otherwise (bool).
         """
         try:
-            #Loads and resizes the image
-            img = Image.open(image_path).resize(size)
-
-            #Converts the image to a Tkinter-compatible format
-            photo_img = ImageTk.PhotoImage(img)
+            #Loads, resizes and converts the image, reusing the cached copy if there is one
+            photo_img = Weather_Assets.get_photo(image_path, size)
            
             #Initializes the image references list if not present
             if not hasattr(self, 'image_references'):
@@ -155,22 +315,6 @@ class Weather_Gui(Weather_App_Data.Weather_Calculations):
                 #Increments the x-coordinate for the next image
                 x_offset += 80
 
-    def get_square_coords(self):
-        """
-        Provides coordinates for five rectangular areas in the 5-day forecast display.
-
-        Returns:
-            coords: A list of tuples containing (x1, y1, x2, y2) coordinates for each rectangle (list).
-        """
-        #Returns predefined coordinates for forecast rectangles
-        return [
-            (30, 60, 234, 270),
-            (264, 60, 468, 270),
-            (498, 60, 702, 270),
-            (732, 60, 936, 270),
-            (966, 60, 1170, 270)
-        ]
-
     def simple_click_handler(self, event):
         """
         Handles mouse click events on the forecast canvas to display the selected day's information.
@@ -178,19 +322,28 @@ class Weather_Gui(Weather_App_Data.Weather_Calculations):
         Parameters:
             event: The Tkinter event object containing click coordinates (tk.Event).
         """
-        #Gets the x and y coordinates of the click
-        x_click = event.x
-        y_click = event.y
+        #Works out the day from the uniform card grid instead of testing every card
+        strip_x = event.x + self.__strip_offset - CARD_X0
+        if strip_x < 0 or strip_x % CARD_STRIDE > CARD_WIDTH or not CARD_Y1 <= event.y <= CARD_Y2:
+            return #the click is in a gap between cards
+        day_index = strip_x // CARD_STRIDE
+        #The day's card is always the same one in the pool
+        card = self.__cards[day_index % CARD_POOL_SIZE]
+        if card["day"] == day_index and card["shown"]:
+            #Displays info for the clicked day on the next frame
+            self.request_show_info(card["key"])
 
-        #Checks if the click is within any forecast rectangle
-        for rect in self.__squares:
-            x1, y1, x2, y2, info = rect
-            if x1 <= x_click <= x2 and y1 <= y_click <= y2:
-                #Displays info for the clicked day
-                self.show_info(info)
-                break
+    def request_show_info(self, date_key):
+        """
+        Asks for a day to be displayed on the next frame. Clicks that arrive before
+        then replace the request, so only the latest selection is drawn.
 
-    def create_data_rectangle(self, canvas, x1, y1, x2, y2, title, value, icon=None):
+        Parameters:
+            date_key: The day to display, in yyyy-mm-dd format (str).
+        """
+        self.__clock.request_frame(lambda: self.show_info(date_key), "show_info")
+
+    def create_data_rectangle(self, canvas, x1, y1, x2, y2, title, value, icon=None, percentile=None):
         """
         Creates a rectangular box on a canvas to display weather data with an optional icon.
 
@@ -203,6 +356,7 @@ class Weather_Gui(Weather_App_Data.Weather_Calculations):
             title: The title of the data to display (str).
             value: The value of the data to display (str).
             icon: The name of an icon image, default is None (str).
+            percentile: Where the value falls in the history of the same calendar day, default is None (float).
         """
         #Draws a rectangle for the data box
         canvas.create_rectangle(
@@ -229,52 +383,74 @@ class Weather_Gui(Weather_App_Data.Weather_Calculations):
         if icon:
             icon_x = center_x - 20
             self.load_and_place_image(canvas, icon, icon_x, icon_y, size=(40, 40), bg_color="#edf2fb")
+        #Adds where the value falls in the day's history if there is one
+        if percentile is not None:
+            rank = int(round(percentile))
+            suffix = "th" if 10 <= rank % 100 <= 20 else {1: "st", 2: "nd", 3: "rd"}.get(rank % 10, "th")
+            canvas.create_text(
+                center_x, y2 - 10, text=str(rank) + suffix + " pct. for this day", font=("Tahoma", 10), fill="#2B5876"
+            )
 
-    def weather_warning_bar(self, condition):
+    def weather_warning_bar(self, condition, anomalies=(), alerts=()):
         """
         Displays a weather warning bar at the top of the GUI based on the condition.
+        Open alerts for the station come first; days without severe weather but with
+        values far from normal get an unusual weather bar.
 
         Parameters:
             condition: The weather condition to determine the warning message and color (str).
+            anomalies: The day's anomalies from the Anomaly_Detector, default is none (list).
+            alerts: The station's open alerts from the Alert_Engine, default is none (list).
         """
-        #Cancels any existing text animation
-        if hasattr(self, 'anim_id'):
-            self.top_canvas.after_cancel(self.anim_id)
+        #Stops moving the previous warning text
+        self.__clock.remove_updater(self.animate_text)
         #Clears the top canvas
         self.top_canvas.delete("all")
        
         #Displays a warning or no-warning message based on condition
-        if ("Extreme" not in condition) and ("Severe" not in condition):
+        if alerts:
+            #Shows the alert that has been open the longest, and how many others there are
+            text = "Alert: " + alerts[0]["name"] + " since " + alerts[0]["since"]
+            if len(alerts) > 1:
+                text += " (+" + str(len(alerts) - 1) + ")"
+            self.top_canvas.create_rectangle(0, 0, 900, 50, fill='#e63946', outline='#e63946')
+            self.warning = self.top_canvas.create_text(450, 25, text=text, font=("Tahoma", 15, "bold"), fill="#FFFBF1")
+        elif ("Extreme" not in condition) and ("Severe" not in condition) and anomalies:
+            #Shows the value that is furthest from normal
+            worst = max(anomalies, key=lambda anomaly: abs(anomaly[2]))
+            self.top_canvas.create_rectangle(0, 0, 900, 50, fill='#f4a261', outline='#f4a261')
+            self.warning = self.top_canvas.create_text(450, 25, text="Unusual: " + Weather_Anomaly.describe(worst), font=("Tahoma", 15, "bold"), fill="#FFFBF1")
+        elif ("Extreme" not in condition) and ("Severe" not in condition):
             self.top_canvas.create_rectangle(0, 0, 900, 50, fill='#007ea7', outline='#007ea7')
             self.warning = self.top_canvas.create_text(450, 25, text="No Weather Warning Today!", font=("Tahoma", 15, "bold"), fill="#FFFBF1")
         else:
             self.top_canvas.create_rectangle(0, 0, 900, 50, fill='#e63946', outline='#e63946')
             self.warning = self.top_canvas.create_text(450, 25, text="Severe Weather Today!", font=("Tahoma", 15, "bold"), fill="#FFFBF1")
 
-        #Sets the initial text movement direction
-        self.__dx = 2
-        #Starts the text animation
-        self.animate_text()
+        #Keeps long messages on screen by narrowing how far the text travels
+        x1, _, x2, _ = self.top_canvas.bbox(self.warning)
+        half_width = (x2 - x1) / 2 + 10
+        self.__marquee_range = (max(140, min(450, half_width)), min(760, max(450, 900 - half_width)))
+        #Starts the text animation on the frame clock
+        self.__clock.add_updater(self.animate_text)
 
-    def animate_text(self):
+    def animate_text(self, elapsed):
         """
         Animates the warning text by moving it horizontally across the top canvas.
+        The text starts in the middle and bounces between x=140 and x=760, or less for long
+        messages, at 200 pixels a second.
+
+        Parameters:
+            elapsed: Seconds since the warning bar was drawn (float).
         """
-        #Moves the warning text
-        self.top_canvas.move(self.warning, self.__dx, 0)
-        #Gets the current position of the text
-        pos = self.top_canvas.coords(self.warning)
-
-        #Reverses the text direction at canvas boundaries
-        x = pos[0]
-        if x <= 140 or x >= 760:
-            self.__dx = -self.__dx
-        #Schedules the next animation frame
-        self.anim_id = self.top_canvas.after(10, self.animate_text)
+        #Works out the position from the time instead of stepping it every tick
+        low, high = self.__marquee_range
+        x = Weather_Clock.bounce((high - low) / 2 + 200 * elapsed, low, high)
+        self.top_canvas.coords(self.warning, x, 25)
    
     def init_bottom_buttons(self):
         """
-        Initializes the bottom section of the GUI with the 5-day forecast.
+        Initializes the bottom section of the GUI with the scrolling forecast strip.
         """
         #Sets up the bottom canvas
         self.setup_bottom_canvas()
@@ -287,33 +463,43 @@ class Weather_Gui(Weather_App_Data.Weather_Calculations):
 
     def setup_bottom_canvas(self):
         """
-        Sets up the bottom canvas for the 5-day forecast display.
+        Sets up the bottom canvas and its scrollbar for the forecast strip.
         """
-        #Destroys the existing bottom canvas if it exists
+        #Destroys the existing bottom canvas and scrollbar if they exist
         if hasattr(self, 'bottom_canvas'):
             self.bottom_canvas.destroy()
+            self.strip_scrollbar.destroy()
         #Creates a new bottom canvas
-        self.bottom_canvas = tk.Canvas(self.bottom_frame, width=1200, height=300, bg="#5FA8D3")
+        self.bottom_canvas = tk.Canvas(self.bottom_frame, width=STRIP_WIDTH, height=300, bg="#5FA8D3")
         #Packs the bottom canvas
         self.bottom_canvas.pack()
+        #Creates the scrollbar that moves the strip
+        self.strip_scrollbar = tk.Scrollbar(self.bottom_frame, orient="horizontal", command=self.scroll_strip)
+        self.strip_scrollbar.pack(fill="x")
+        #Scrolls with the mouse wheel (Button-4 and Button-5 are the wheel on X11)
+        self.bottom_canvas.bind("<MouseWheel>", lambda event: self.scroll_strip("scroll", -event.delta // abs(event.delta or 1), "wheel"))
+        self.bottom_canvas.bind("<Button-4>", lambda event: self.scroll_strip("scroll", -1, "wheel"))
+        self.bottom_canvas.bind("<Button-5>", lambda event: self.scroll_strip("scroll", 1, "wheel"))
         #Draws the canvas background
         self.draw_canvas_background()
         #Adds the forecast title
         self.add_forecast_title()
+        #Creates the cards that are reused as the strip scrolls
+        self.create_card_pool()
 
     def draw_canvas_background(self):
         """
         Draws the background rectangle for the bottom canvas.
         """
         #Creates a filled rectangle for the bottom canvas background
-        self.bottom_canvas.create_rectangle(0, 0, 1200, 300, fill='#cae9ff', outline='#cae9ff')
+        self.bottom_canvas.create_rectangle(0, 0, STRIP_WIDTH, 300, fill='#cae9ff', outline='#cae9ff')
 
     def add_forecast_title(self):
         """
-        Adds the "5 Day Forecast" title to the bottom canvas.
+        Adds the forecast title to the bottom canvas. Its text is set when the strip is laid out.
         """
         #Creates the forecast title text
-        self.bottom_canvas.create_text(600, 30, text="5 Day Forecast",
+        self.__forecast_title = self.bottom_canvas.create_text(STRIP_WIDTH // 2, 30, text="Forecast",
                                      font=("Tahoma", 16, "underline"), fill="#2B5876")
 
     def get_weather_images(self):
@@ -323,63 +509,166 @@ class Weather_Gui(Weather_App_Data.Weather_Calculations):
         Returns:
             weather_images: A dictionary with weather conditions as keys and image names as values (dict).
         """
-        #Defines and returns the weather images dictionary
-        return {
-            "Sunny!": "sunny.png",
-            "Rainy!": "rainy.png",
-            "Snowy!": "snowy.png",
-            "Windy!": "windy.png",
-            "Stormy!": "stormy.png",
-            "Tornado!": "tornado.png",
-            "Severe Windstorm!": "severe_windstorm.png",
-            "Hurricane!": "hurricane.png",
-            "Extreme Cold!": "extreme_cold.png",
-            "Extreme Heat!": "extreme_heat.png",
-            "Dew Point!": "extremely_humid.png",
-            "Surprise!": "surprise.png"
-        }
+        #Returns the images named in the condition rules
+        return Weather_Rules.get_rule_table().get_images()
+
+    def create_card_pool(self):
+        """
+        Creates a fixed number of hidden day cards. Each card is a box, four lines of
+        text and up to three images, all tagged so the card moves with one call.
+        """
+        self.__cards = []
+        for slot in range(CARD_POOL_SIZE):
+            tag = "card" + str(slot)
+            center_x = CARD_WIDTH // 2
+            center_y = (CARD_Y1 + CARD_Y2) // 2
+            box = self.bottom_canvas.create_rectangle(0, CARD_Y1, CARD_WIDTH, CARD_Y2, fill="#FFFBF1",
+                                                      outline="#FFFBF1", state="hidden", tags=tag)
+            texts = []
+            for y_offset, font in ((-70, ("Tahoma", 14, "underline")), (-38, ("Tahoma", 13)),
+                                   (-13, ("Tahoma", 13)), (12, ("Tahoma", 13))):
+                texts.append(self.bottom_canvas.create_text(center_x, center_y + y_offset, font=font,
+                                                            fill="black", state="hidden", tags=tag))
+            images = []
+            for image_slot in range(3):
+                images.append(self.bottom_canvas.create_image(40 + 80 * image_slot, CARD_Y1 + 140, anchor="nw",
+                                                              state="hidden", tags=tag))
+            self.__cards.append({"tag": tag, "box": box, "texts": texts, "images": images,
+                                 "image_count": 0, "day": None, "key": None, "x": 0, "shown": False})
 
     def create_forecast_days(self, weather_images):
         """
-        Creates the display for the 5-day forecast on the bottom canvas.
+        Lays out the forecast strip for every day in the weather data.
 
         Parameters:
             weather_images: A dictionary mapping conditions to image names (dict).
         """
-        #Gets the coordinates for forecast rectangles
-        square_coords = self.get_square_coords()
-        #Initializes the squares list for storing rectangle info
-        self.__squares = []
-       
-        #Creates a display for each forecast day
-        for day_index in range(5):
-            self.create_single_day(day_index, square_coords[day_index], weather_images)
+        #Keeps the images for cards filled in while scrolling
+        self.__weather_images = weather_images
+        #Keeps the scroll position across refreshes, within the new strip width
+        self.__strip_offset = min(self.__strip_offset, self.get_max_strip_offset())
+        #Lays out the cards on screen
+        self.layout_strip()
 
-    def create_single_day(self, day_index, coords, weather_images):
+    def get_max_strip_offset(self):
         """
-        Creates the display for a single day in the 5-day forecast.
+        Returns how far the strip can scroll.
+
+        Returns:
+            offset: the largest scroll position in pixels (int).
+        """
+        #Measures the strip from the left margin to the right margin of the last card
+        count = len(self.__weather_data.get_list())
+        width = 2 * CARD_X0 + (count - 1) * CARD_STRIDE + CARD_WIDTH
+        return max(0, width - STRIP_WIDTH)
+
+    def scroll_strip(self, action, amount, unit=None):
+        """
+        Scrolls the forecast strip. Accepts the arguments a Tk scrollbar passes to its command.
 
         Parameters:
+            action: "moveto" or "scroll" (str).
+            amount: fraction of the strip for "moveto", number of steps for "scroll" (str or number).
+            unit: "units" (one card), "pages" (one screen) or "wheel" (a third of a card) (str).
+        """
+        if action == "moveto":
+            total = self.get_max_strip_offset() + STRIP_WIDTH
+            offset = float(amount) * total
+        else:
+            step = {"units": CARD_STRIDE, "pages": STRIP_WIDTH - CARD_X0}.get(unit, CARD_STRIDE // 3)
+            offset = self.__strip_offset + int(amount) * step
+        self.set_strip_offset(offset)
+
+    def set_strip_offset(self, offset):
+        """
+        Moves the strip to a scroll position and redraws it on the next frame.
+
+        Parameters:
+            offset: the scroll position in pixels (int).
+        """
+        offset = int(max(0, min(offset, self.get_max_strip_offset())))
+        if offset != self.__strip_offset:
+            self.__strip_offset = offset
+            #Many scroll events in one frame are drawn once
+            self.__clock.request_frame(self.layout_strip, "forecast_strip")
+
+    def layout_strip(self):
+        """
+        Places a card from the pool on every day that is on screen and hides the rest.
+        Only cards that move to a new day are refilled, so scrolling mostly moves items.
+        """
+        with self.__timer.span("layout_strip"):
+            count = len(self.__weather_data.get_list())
+            offset = self.__strip_offset
+            #Finds the days whose cards overlap the canvas
+            first = max(0, (offset - CARD_X0 - CARD_WIDTH) // CARD_STRIDE + 1)
+            last = min(count, (offset + STRIP_WIDTH - CARD_X0) // CARD_STRIDE + 1)
+            #Each day always uses the same card, so a card keeps its content while on screen
+            for day_index in range(first, last):
+                card = self.__cards[day_index % CARD_POOL_SIZE]
+                if card["day"] != day_index:
+                    self.fill_card(card, day_index)
+                x = CARD_X0 + day_index * CARD_STRIDE - offset
+                self.bottom_canvas.move(card["tag"], x - card["x"], 0)
+                card["x"] = x
+                self.show_card(card, True)
+            for card in self.__cards:
+                if card["day"] is None or not first <= card["day"] < last:
+                    self.show_card(card, False)
+            #Updates the title and the scrollbar
+            self.bottom_canvas.itemconfigure(self.__forecast_title, text=str(count) + " Day Forecast")
+            total = self.get_max_strip_offset() + STRIP_WIDTH
+            self.strip_scrollbar.set(offset / total, (offset + STRIP_WIDTH) / total)
+
+    def fill_card(self, card, day_index):
+        """
+        Writes a day's date, condition, temperatures and images into a card.
+
+        Parameters:
+            card: the card from the pool (dict).
             day_index: The index of the day in the weather data list (int).
-            coords: The coordinates (x1, y1, x2, y2) for the day's rectangle (tuple).
-            weather_images: A dictionary mapping conditions to image names (dict).
         """
-        #Unpacks the rectangle coordinates
-        x1, y1, x2, y2 = coords
-        #Gets the weather info for the day
+        #Gets the weather info and condition for the day, only when its card comes on screen
         info = self.get_day_info(day_index)
-        #Gets the weather condition for the day
         condition = self.get_day_condition(day_index, info)
-       
-        #Draws the day box
-        self.draw_day_box(x1, y1, x2, y2)
-        #Adds text for the day
-        self.add_day_text(x1, y1, x2, y2, day_index, condition)
-        #Adds the weather image
-        self.add_weather_image(x1, y1, condition, weather_images)
-       
-        #Stores the rectangle info
-        self.store_square_info(x1, y1, x2, y2, info)
+        lines = ["Day " + str(day_index + 1) + ": " + info.get("Date"), condition,
+                 "Min Temp: " + str(info.get("Min Temperature")) + "°C",
+                 "Max Temp: " + str(info.get("Max Temperature")) + "°C"]
+        for text_id, line in zip(card["texts"], lines):
+            self.bottom_canvas.itemconfigure(text_id, text=line)
+        #Shows an image for each condition tag that matches
+        card["image_count"] = 0
+        for tag in self.__weather_images:
+            if tag in condition and card["image_count"] < len(card["images"]):
+                try:
+                    photo = Weather_Assets.get_photo(self.__weather_images[tag], (50, 50))
+                except Exception:
+                    continue
+                self.bottom_canvas.itemconfigure(card["images"][card["image_count"]], image=photo)
+                card["image_count"] += 1
+        card["day"] = day_index
+        card["key"] = self.__weather_data.get_day_key(day_index)
+        card["shown"] = False
+
+    def show_card(self, card, shown):
+        """
+        Shows or hides a card and the images it uses.
+
+        Parameters:
+            card: the card from the pool (dict).
+            shown: True to show the card (bool).
+        """
+        if card["shown"] == shown:
+            return
+        card["shown"] = shown
+        if not shown:
+            self.bottom_canvas.itemconfigure(card["tag"], state="hidden")
+            return
+        self.bottom_canvas.itemconfigure(card["box"], state="normal")
+        for text_id in card["texts"]:
+            self.bottom_canvas.itemconfigure(text_id, state="normal")
+        for image_slot, image_id in enumerate(card["images"]):
+            self.bottom_canvas.itemconfigure(image_id, state="normal" if image_slot < card["image_count"] else "hidden")
 
     def get_day_info(self, day_index):
         """
@@ -392,7 +681,7 @@ class Weather_Gui(Weather_App_Data.Weather_Calculations):
             info: A dictionary containing weather data for the specified day (dict).
         """
         #Returns the weather data for the specified day
-        return self.get_list()[day_index]
+        return self.__weather_data.get_list()[day_index]
 
     def get_day_condition(self, day_index, info):
         """
@@ -413,87 +702,23 @@ class Weather_Gui(Weather_App_Data.Weather_Calculations):
         #Returns the condition
         return condition
 
-    def draw_day_box(self, x1, y1, x2, y2):
-        """
-        Draws a rectangular box for a single day in the forecast.
-
-        Parameters:
-            x1: The x-coordinate of the top-left corner (int).
-            y1: The y-coordinate of the top-left corner (int).
-            x2: The x-coordinate of the bottom-right corner (int).
-            y2: The y-coordinate of the bottom-right corner (int).
-        """
-        #Creates a rectangle for the day box
-        self.bottom_canvas.create_rectangle(x1, y1, x2, y2, fill="#FFFBF1", outline="#FFFBF1")
-
-    def add_day_text(self, x1, y1, x2, y2, day_index, condition):
-        """
-        Adds text to a day's forecast box, including date, condition, and temperatures.
-
-        Parameters:
-            x1: The x-coordinate of the top-left corner (int).
-            y1: The y-coordinate of the top-left corner (int).
-            x2: The x-coordinate of the bottom-right corner (int).
-            y2: The y-coordinate of the bottom-right corner (int).
-            day_index: The index of the day in the weather data list (int).
-            condition: The weather condition for the day (str).
-        """
-        #Calculates the center coordinates for text placement
-        center_x = (x1 + x2) // 2
-        center_y = (y1 + y2) // 2
-       
-        #Gets the weather data for the day
-        day_data = self.get_list()[day_index]
-        #Defines the text elements to display
-        texts = [
-            ("Day " + str(day_index + 1) + ": " + day_data.get("Date"), center_y - 70, ("Tahoma", 14, "underline")),
-            (condition, center_y - 38, ("Tahoma", 13)),
-            ("Min Temp: " + str(day_data.get("Min Temperature")) + "°C", center_y - 13, ("Tahoma", 13)),
-            ("Max Temp: " + str(day_data.get("Max Temperature")) + "°C", center_y + 12, ("Tahoma", 13))
-        ]
-       
-        #Adds each text element to the canvas
-        for text, y_pos, font in texts:
-            self.bottom_canvas.create_text(center_x, y_pos, text=text, font=font, fill="black")
-
-    def add_weather_image(self, x, y, condition, weather_images):
-        """
-        Adds a weather image to a day's forecast box.
-
-        Parameters:
-            x: The x-coordinate for image placement (int).
-            y: The y-coordinate for image placement (int).
-            condition: The weather condition to determine the image (str).
-            weather_images: A dictionary mapping conditions to image names (dict).
-        """
-        #Places the weather image for the condition
-        self.place_weather_images(self.bottom_canvas, condition, x + 40, y + 140, weather_images)
-
-    def store_square_info(self, x1, y1, x2, y2, info):
-        """
-        Stores information about a forecast rectangle for click handling.
-
-        Parameters:
-            x1: The x-coordinate of the top-left corner (int).
-            y1: The y-coordinate of the top-left corner (int).
-            x2: The x-coordinate of the bottom-right corner (int).
-            y2: The y-coordinate of the bottom-right corner (int).
-            info: The weather data for the day (dict).
-        """
-        #Appends the rectangle coordinates and info to the squares list
-        self.__squares.append((x1, y1, x2, y2, info))
-
     def setup_click_handler(self):
         """
         Sets up the click handler for the bottom canvas to handle forecast day selection.
         """
         #Binds the click event to the click handler
-        self.bottom_canvas.bind("<Button>", self.simple_click_handler)
+        self.bottom_canvas.bind("<Button-1>", self.__monitor.wrap(self.simple_click_handler))
    
     def close(self):
         """
         Closes the main window and terminates the application.
         """
+        #Stops the metrics page
+        if self.__metrics_server is not None:
+            self.__metrics_server.stop()
+        #Writes the observation log's buffered days to disk
+        if self.__observation_log is not None:
+            self.__observation_log.close()
         #Stops the Tkinter main loop
         self.main_window.quit()
         #Destroys the main window
@@ -508,12 +733,15 @@ class Weather_Gui(Weather_App_Data.Weather_Calculations):
             condition: The weather condition for the day (str).
             description: The description of the weather condition (str).
         """
+        #Stops the previous animation so it is no longer drawn
+        if self.weather_animation is not None:
+            self.weather_animation.stop()
         #Clears the sidebar canvas
         self.side_canvas.delete("all")
-        #Creates a weather animation for the condition
-        self.weather_animation = create_weather_animation(condition, self.side_canvas, 150, 250)
+        #Creates a weather animation for the condition on the shared frame clock
+        self.weather_animation = create_weather_animation(condition, self.side_canvas, 150, 250, self.__clock)
         #Adds the date text to the sidebar
-        self.side_canvas.create_text(150, 60, text=(self.get_list()[day_index].get("Date")),
+        self.side_canvas.create_text(150, 60, text=(self.__weather_data.get_list()[day_index].get("Date")),
                                     font=("Tahoma", 23), fill="black")
         #Adds the condition text to the sidebar
         self.side_canvas.create_text(150, 130, text=condition,
@@ -532,6 +760,26 @@ class Weather_Gui(Weather_App_Data.Weather_Calculations):
         #Places the quit button on the canvas
         self.top_canvas.create_window(800, 100, window=quit_button)
 
+    def create_history_button(self):
+        """
+        Creates a button on the top canvas that opens the history chart.
+        """
+        #Creates a history button
+        history_button = tk.Button(self.top_canvas, text="History", command=self.open_chart,
+                                   bg="#edf2fb", font=("Tahoma", 10, "bold"))
+        #Places the history button left of the quit button
+        self.top_canvas.create_window(735, 100, window=history_button)
+
+    def open_chart(self):
+        """
+        Opens the chart of the whole weather history, or brings it to the front if it is open.
+        """
+        import Weather_Chart
+        if self.__chart is not None and self.__chart.is_open():
+            self.__chart.lift()
+        else:
+            self.__chart = Weather_Chart.Weather_Chart(self.main_window, self.__weather_data, clock=self.__clock)
+
     def create_forecast_title(self):
         """
         Adds the "Today's Forecast" title to the top canvas.
@@ -572,23 +820,35 @@ class Weather_Gui(Weather_App_Data.Weather_Calculations):
         box_height = 150
         start_x = 60
         start_y = 140
+        #Looks up where each value falls in the history of the same calendar day
+        date_key = self.__weather_data.get_day_key(day_index)
+        values = {"Heat Index": self.__weather_data.get_heat_index()[day_index],
+                  "Wind Chill": self.__weather_data.get_wind_chill()[day_index],
+                  "Dew Point": self.__weather_data.get_dew_point()[day_index]}
+        for field in ("Min Temperature", "Max Temperature", "Wind Speed", "Humidity"):
+            values[field] = info.get(field)
+        percentiles = {field: self.get_percentile(date_key, field, value) for field, value in values.items()}
        
         #Creates a rectangle for min temperature
         self.create_data_rectangle(
             self.top_canvas, start_x, start_y, start_x+box_width, start_y+box_height,
-            "Min Temperature", str(info.get("Min Temperature")) + "°C", self.get_data_icons()["Min Temperature"])
+            "Min Temperature", str(info.get("Min Temperature")) + "°C", self.get_data_icons()["Min Temperature"],
+            percentiles["Min Temperature"])
         #Creates a rectangle for max temperature
         self.create_data_rectangle(
             self.top_canvas, start_x+box_width+20, start_y, start_x+2*box_width+20, start_y+box_height,
-            "Max Temperature", str(info.get("Max Temperature")) + "°C", self.get_data_icons()["Max Temperature"])
+            "Max Temperature", str(info.get("Max Temperature")) + "°C", self.get_data_icons()["Max Temperature"],
+            percentiles["Max Temperature"])
         #Creates a rectangle for wind speed
         self.create_data_rectangle(
             self.top_canvas, start_x+2*box_width+40, start_y, start_x+3*box_width+40, start_y+box_height,
-            "Wind Speed", str(info.get("Wind Speed")) + " km/h", self.get_data_icons()["Wind Speed"])
+            "Wind Speed", str(info.get("Wind Speed")) + " km/h", self.get_data_icons()["Wind Speed"],
+            percentiles["Wind Speed"])
         #Creates a rectangle for humidity
         self.create_data_rectangle(
             self.top_canvas, start_x+3*box_width+60, start_y, start_x+4*box_width+60, start_y+box_height,
-            "Humidity", str(info.get("Humidity")) + "%", self.get_data_icons()["Humidity"])
+            "Humidity", str(info.get("Humidity")) + "%", self.get_data_icons()["Humidity"],
+            percentiles["Humidity"])
         #Creates a rectangle for wind direction
         self.create_data_rectangle(
             self.top_canvas, start_x, start_y+box_height+20, start_x+box_width, start_y+2*box_height+20,
@@ -596,43 +856,59 @@ class Weather_Gui(Weather_App_Data.Weather_Calculations):
         #Creates a rectangle for heat index
         self.create_data_rectangle(
             self.top_canvas, start_x+box_width+20, start_y+box_height+20, start_x+2*box_width+20, start_y+2*box_height+20,
-            "Heat Index", "%.2f°C" % self.get_heat_index()[day_index], self.get_data_icons()["Heat Index"])
+            "Heat Index", "%.2f°C" % self.__weather_data.get_heat_index()[day_index], self.get_data_icons()["Heat Index"],
+            percentiles["Heat Index"])
         #Creates a rectangle for wind chill
         self.create_data_rectangle(
             self.top_canvas, start_x+2*box_width+40, start_y+box_height+20, start_x+3*box_width+40, start_y+2*box_height+20,
-            "Wind Chill", "%.2f°C" % self.get_wind_chill()[day_index], self.get_data_icons()["Wind Chill"])
+            "Wind Chill", "%.2f°C" % self.__weather_data.get_wind_chill()[day_index], self.get_data_icons()["Wind Chill"],
+            percentiles["Wind Chill"])
         #Creates a rectangle for dew point
         self.create_data_rectangle(
             self.top_canvas, start_x+3*box_width+60, start_y+box_height+20, start_x+4*box_width+60, start_y+2*box_height+20,
-            "Dew Point", "%.2f°C" % self.get_dew_point()[day_index], self.get_data_icons()["Dew Point"])
+            "Dew Point", "%.2f°C" % self.__weather_data.get_dew_point()[day_index], self.get_data_icons()["Dew Point"],
+            percentiles["Dew Point"])
 
-    def show_info(self, info):
+    def show_info(self, date_key):
         """
         Displays detailed weather information for a selected day.
+        Shows the first day instead if the date is no longer stored.
 
         Parameters:
-            info: The weather data for the day to display (dict).
-        """
-        #Stores the current day's info
-        self.__current_info = info
-        #Clears the top canvas
-        self.top_canvas.delete("all")
-        #Gets the index of the current day
-        day_index = self.get_list().index(info)
-       
-        #Determines the weather condition and description
-        condition, description = self.determine_condition(day_index)
-        #Updates the weather warning bar
-        self.weather_warning_bar(condition)
-       
-        #Sets up the sidebar content
-        self.setup_sidebar_content(day_index, condition, description)
-        #Creates the quit button
-        self.create_quit_button()
-        #Adds the forecast title
-        self.create_forecast_title()
-        #Sets up the data rectangles
-        self.setup_data_rectangles(info, day_index)
+            date_key: The day to display, in yyyy-mm-dd format (str).
+        """
+        with self.__timer.span("show_info"):
+            #Looks up the day through the date index, which also tells apart days with identical data
+            day_index = self.__weather_data.get_day_index(date_key)
+            if day_index is None:
+                day_index = 0
+                date_key = self.__weather_data.get_day_key(0)
+            info = self.__weather_data.get_day(date_key)
+            #Stores the current day
+            self.__current_key = date_key
+            #Clears the top canvas
+            self.top_canvas.delete("all")
+           
+            #Determines the weather condition and description
+            with self.__timer.span("show_info.determine_condition"):
+                condition, description = self.determine_condition(day_index)
+            #Updates the weather warning bar
+            with self.__timer.span("show_info.warning_bar"):
+                station = self.__weather_data.get_station()
+                self.weather_warning_bar(condition, self.__anomalies.get_anomalies(station, date_key),
+                                         self.__alerts.get_active(station))
+           
+            #Sets up the sidebar content
+            with self.__timer.span("show_info.sidebar"):
+                self.setup_sidebar_content(day_index, condition, description)
+            with self.__timer.span("show_info.top_canvas"):
+                #Creates the quit and history buttons
+                self.create_quit_button()
+                self.create_history_button()
+                #Adds the forecast title
+                self.create_forecast_title()
+                #Sets up the data rectangles
+                self.setup_data_rectangles(info, day_index)
    
     def init_top_screen(self):
         """
@@ -674,36 +950,117 @@ class Weather_Gui(Weather_App_Data.Weather_Calculations):
         """
         Refreshes the weather data and updates the GUI display.
         """
-        #Reads new weather data
-        self.read_data()
-        #Clears the heat index list
-        self.get_heat_index().clear()
-        #Clears the wind chill list
-        self.get_wind_chill().clear()
-        #Clears the dew point list
-        self.get_dew_point().clear()
-   
-        #Recalculates the heat index
-        self.heat_index()
-        #Recalculates the wind chill
-        self.wind_chill()
-        #Recalculates the dew point
-        self.dew_point()
-       
-        #Updates the display with current or first day's info
-        if hasattr(self, "current_info") and self.__current_info in self.get_list():
-            self.show_info(self.__current_info)
-        else:
-            self.show_info(self.get_list()[0])
-        #Reinitializes the bottom buttons
-        self.init_bottom_buttons()
+        start = time.perf_counter()
+        with self.__timer.span("refresh"):
+            #Reads new weather data
+            sequence = self.__weather_data.get_change_log().get_sequence()
+            with self.__timer.span("refresh.read_data"):
+                self.__weather_data.read_data()
+            #Leaves the display as it is when the read changed no day
+            if self.__weather_data.get_change_log().get_sequence() == sequence:
+                self.__last_refresh_seconds = time.perf_counter() - start
+                self.__refresh_count += 1
+                return
+            #Recalculates the heat index, wind chill, and dew point
+            with self.__timer.span("refresh.derive"):
+                self.__weather_data.recalculate()
+           
+            #Adds the changed days to the percentiles when they come from the loaded data
+            with self.__timer.span("refresh.climatology"):
+                self.update_climatology()
+            #Updates the display with the current day, or the first day if it is gone
+            self.show_info(self.__current_key)
+            #Reinitializes the bottom buttons
+            with self.__timer.span("refresh.init_bottom_buttons"):
+                self.init_bottom_buttons()
+            #Redraws the history chart with the new data
+            if self.__chart is not None and self.__chart.is_open():
+                self.__chart.reload()
+        #Keeps the duration for the metrics page
+        self.__last_refresh_seconds = time.perf_counter() - start
+        self.__refresh_count += 1
    
+    def start_metrics(self, port):
+        """
+        Starts the localhost metrics page and the sampler that keeps it up to date.
+
+        Parameters:
+            port: the port to listen on (int).
+        """
+        #Creates the registry and starts serving it
+        self.__metrics = Weather_Metrics.Metrics_Registry()
+        self.__metrics_server = Weather_Metrics.Metrics_Server(self.__metrics, port)
+        self.__metrics_server.start()
+        #Remembers the frame count so frames per second can be worked out
+        self.__last_sample = (time.perf_counter(), 0)
+        self.sample_metrics()
+
+    def sample_metrics(self):
+        """
+        Copies the app's health numbers into the metrics registry every second.
+        Runs on the Tk thread because Tk may only be asked about its timers from there.
+        """
+        import Weather_Animation
+        stats = self.__weather_data.get_ingest_stats()
+        now = time.perf_counter()
+        frames = Weather_Animation.ANIMATION_STATS["frames"]
+        last_time, last_frames = self.__last_sample
+        self.__last_sample = (now, frames)
+
+        #Updates every metric
+        self.__metrics.set("refresh_duration_seconds", self.__last_refresh_seconds,
+                           "Wall time of the last refresh_data call.")
+        self.__metrics.set("refreshes_total", self.__refresh_count,
+                           "Number of refreshes since start.", "counter")
+        self.__metrics.set("records_ingested_total", stats["records"],
+                           "Valid records ingested since start.", "counter")
+        self.__metrics.set("validation_rejects_total", stats["rejected"],
+                           "Records rejected by validation since start.", "counter")
+        self.__metrics.set("after_timers", len(self.main_window.tk.splitlist(self.main_window.tk.call("after", "info"))),
+                           "Number of pending Tk after() callbacks.")
+        self.__metrics.set("animation_instances", len(Weather_Animation.LIVE_ANIMATIONS),
+                           "Weather animation objects that are still alive.")
+        self.__metrics.set("frames_per_second", (frames - last_frames) / max(now - last_time, 1e-9),
+                           "Animation frames drawn per second over the last sample.")
+        self.__metrics.set("animation_frames_total", frames,
+                           "Animation frames drawn since start.", "counter")
+        self.__metrics.set("frame_clock_ticks_total", self.__clock.get_ticks(),
+                           "Frames run by the shared frame clock since start.", "counter")
+        self.__metrics.set("render_requests_dropped_total", self.__clock.get_dropped(),
+                           "Redraw requests replaced by a newer one before they ran.", "counter")
+        self.__metrics.set("alerts_active", len(self.__alerts.get_active()),
+                           "Weather alerts raised and not yet cleared.")
+        self.__metrics.set("alerts_raised_total", self.__alerts.get_counts()["raised"],
+                           "Weather alerts raised since start, not counting reopened ones.", "counter")
+        self.__metrics.set("alert_late_days_total", self.__alerts.get_counts()["late"],
+                           "Days older than the latest one, which do not raise or clear alerts.", "counter")
+        self.__metrics.set("frame_clock_paused", int(self.__clock.is_paused()),
+                           "1 while animations are paused because the window is hidden.")
+        self.__metrics.set("asset_cache_hit_ratio", Weather_Assets.get_hit_rate(),
+                           "Fraction of image loads served from the asset cache.")
+        self.__metrics.set("event_loop_lag_seconds", self.__monitor.get_last_lag(),
+                           "How late the last event loop heartbeat fired.")
+        self.__metrics.set("slow_callbacks_total", self.__monitor.get_slow_count(),
+                           "Callbacks that blocked the event loop longer than the threshold.", "counter")
+        self.__metrics.set("process_resident_memory_bytes", Weather_Metrics.get_rss_bytes(),
+                           "Resident memory of the process.")
+        #Samples again in a second
+        self.__monitor.after(self.main_window, 1000, self.sample_metrics)
+
+    def flush_observation_log(self):
+        """
+        Writes the observation log's buffered days once they are due, even if no more days
+        arrive, and checks again when the next ones will be.
+        """
+        delay = self.__observation_log.tick()
+        self.__monitor.after(self.main_window, max(1, int(delay * 1000)), self.flush_observation_log)
+
     def schedule_refresh(self):
         """
         Schedules a periodic refresh of the weather data every minute.
         """
         #Schedules the refresh every 60 seconds
-        self.main_window.after(60000, self.refresh_every_minute)
+        self.__monitor.after(self.main_window, 60000, self.refresh_every_minute)
 
     def refresh_every_minute(self):
         """
@@ -715,4 +1072,5 @@ class Weather_Gui(Weather_App_Data.Weather_Calculations):
         self.schedule_refresh()
          
 #Creates an instance of the Weather_Gui class to run the application
-Weather_Gui()
\ No newline at end of file
+if __name__ == "__main__":
+    Weather_Gui()
\ No newline at end of file
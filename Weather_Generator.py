@@ -0,0 +1,246 @@
+'''
+Name: Eric and Sanvi
+Last modified: May 21, 2025
+Program details: An application that provides weather monitoring with a GUI from tkinter package.
+                 It will read weather data from a file, automatically updates conditions at set intervals, and
+                 dynamically display weather conditions (e.g., Sunny, Rainy, or Snowy).
+
+Writes seeded synthetic station files in the data.txt block format for load testing.
+
+    python Weather_Generator.py --stations 20 --days 100000 --out stations --seed 7
+    python Weather_Generator.py --stations 2 --days 1000 --corrupt-rate 0.05
+'''
+import argparse
+import datetime
+import math
+import multiprocessing
+import os
+import random
+import sys
+import time
+
+DIRECTIONS = ["N", "NE", "E", "SE", "S", "SW", "W", "NW"]
+#Number of records joined into one string before it is written
+WRITE_BATCH = 5000
+#Extreme events and the condition() branch each one is meant to reach
+EXTREMES = ["heat", "cold", "storm", "severe", "hurricane", "tornado", "humid", "sunny"]
+#Kinds of corruption; "noise" lines must be rejected by parse_line, the rest by the validators
+CORRUPTIONS = ["noise", "number", "date", "month", "direction", "missing"]
+
+class Station_Generator():
+    """
+    Generates the records of one weather station. Temperatures follow the seasons,
+    humidity and wind move together, and a few days get extreme values so every
+    branch of Determine_Weather_Condition.condition is reached.
+    """
+    def __init__(self, seed, extreme_rate=0.02, corrupt_rate=0.0):
+        """
+        Initializes the Station_Generator with its own climate drawn from the seed.
+
+        Parameters:
+            seed: seed of the station's random numbers (int)
+            extreme_rate: fraction of days with an extreme event, default is 0.02 (float)
+            corrupt_rate: fraction of records with a malformed line, default is 0.0 (float)
+        """
+        self.__random = random.Random(seed)
+        self.__extreme_rate = extreme_rate
+        self.__corrupt_rate = corrupt_rate
+        #Picks a climate for the station
+        self.__mean = self.__random.uniform(-5, 25) #yearly mean temperature
+        self.__swing = self.__random.uniform(3, 18) #summer to winter difference
+        self.__spread = self.__random.uniform(3, 9) #half the daily min to max range
+        self.__wet = self.__random.uniform(40, 80) #typical humidity
+        #Seasonal temperature for every day of the year, computed once
+        self.__season = [self.__mean + self.__swing * math.cos(2 * math.pi * (day - 200) / 365.25)
+                         for day in range(367)]
+        self.__corrupted = 0
+
+    def make_day(self, date):
+        """
+        Makes the weather values of one day.
+
+        Parameters:
+            date: the day (datetime.date)
+        Returns:
+            low, high, humidity, speed, direction: the day's values (tuple)
+        """
+        rand = self.__random
+        average = self.__season[date.timetuple().tm_yday] + rand.gauss(0, 3)
+        low = average - self.__spread * rand.uniform(0.6, 1.4)
+        high = average + self.__spread * rand.uniform(0.6, 1.4)
+        #wet days are windier and a little cooler in the afternoon
+        storminess = rand.random()
+        humidity = min(100.0, max(5.0, self.__wet + 35 * (storminess - 0.5) + rand.gauss(0, 8)))
+        speed = max(0.0, rand.gammavariate(2.0, 4.0) * (0.5 + 1.5 * storminess))
+        high -= 3 * storminess
+        direction = DIRECTIONS[rand.randrange(8)]
+
+        if rand.random() < self.__extreme_rate:
+            kind = EXTREMES[rand.randrange(len(EXTREMES))]
+            if kind == "heat":
+                low = rand.uniform(40, 45)
+                high = low + rand.uniform(2, 8)
+            elif kind == "cold":
+                low = rand.uniform(-35, -20)
+                high = low + rand.uniform(1, 6)
+            elif kind == "storm":
+                speed = rand.uniform(40, 88)
+                humidity = rand.uniform(70, 100)
+            elif kind == "severe":
+                speed = rand.uniform(89, 118)
+            elif kind == "hurricane":
+                speed = rand.uniform(119, 176)
+                humidity = rand.uniform(80, 100)
+            elif kind == "tornado":
+                speed = rand.uniform(177, 300)
+            elif kind == "humid":
+                low = rand.uniform(24, 30)
+                high = low + rand.uniform(3, 6)
+                humidity = rand.uniform(90, 100)
+            else:
+                low = rand.uniform(10, 14)
+                high = rand.uniform(15, 20)
+                speed = rand.uniform(0, 20)
+        return low, high, humidity, speed, direction
+
+    def make_record(self, date):
+        """
+        Formats one day as a block of data.txt lines, possibly corrupted.
+
+        Parameters:
+            date: the day (datetime.date)
+        Returns:
+            the record text, ending with a blank line (str)
+        """
+        low, high, humidity, speed, direction = self.make_day(date)
+        lines = [
+            "Date: " + date.isoformat(),
+            "Min Temperature: %.2f°C" % low,
+            "Max Temperature: %.2f°C" % high,
+            "Humidity: %.2f%%" % humidity,
+            "Wind Speed: %.2f km/h" % speed,
+            "Wind Direction: " + direction
+        ]
+        if self.__corrupt_rate and self.__random.random() < self.__corrupt_rate:
+            self.corrupt(lines)
+        return "\n".join(lines) + "\n\n"
+
+    def corrupt(self, lines):
+        """
+        Damages one record in a way the parser or the validators must reject.
+
+        Parameters:
+            lines: the six lines of the record, changed in place (list)
+        """
+        rand = self.__random
+        kind = CORRUPTIONS[rand.randrange(len(CORRUPTIONS))]
+        if kind == "noise":
+            #a line with no colon, which parse_line skips
+            lines.insert(rand.randrange(len(lines) + 1), rand.choice(["#####", "NaN NaN", "--- truncated ---"]))
+            return
+        self.__corrupted += 1
+        if kind == "number":
+            line = rand.randrange(1, 5)
+            lines[line] = lines[line].split(":")[0] + ": " + rand.choice(["abc", "", "1.2.3", "--"])
+        elif kind == "date":
+            lines[0] = "Date: " + rand.choice(["2025/05/01", "May 1 2025", "20250501", "2025-5-1"])
+        elif kind == "month":
+            lines[0] = "Date: 2025-%02d-10" % rand.choice([0, 13, 42])
+        elif kind == "direction":
+            lines[5] = "Wind Direction: " + rand.choice(["NNE", "north", "X", ""])
+        else:
+            #swaps a field name so the record is missing a field
+            line = rand.randrange(len(lines))
+            lines[line] = "Pressure: 1013"
+
+    def get_corrupted(self):
+        """
+        Returns how many records were written with a value the validators must reject.
+        Returns:
+            self.__corrupted: number of corrupted records (int)
+        """
+        return self.__corrupted
+
+def write_station(file_name, seed, days, start, extreme_rate=0.02, corrupt_rate=0.0):
+    """
+    Writes one station file.
+
+    Parameters:
+        file_name: name of the file to write (str)
+        seed: seed of the station's random numbers (int)
+        days: number of days to write (int)
+        start: first day (datetime.date)
+        extreme_rate: fraction of days with an extreme event (float)
+        corrupt_rate: fraction of records with a malformed line (float)
+    Returns:
+        file_name, days, corrupted: the file, the number of records and how many must be rejected (tuple)
+    """
+    generator = Station_Generator(seed, extreme_rate, corrupt_rate)
+    first = start.toordinal()
+    with open(file_name, 'w', encoding="utf-8") as out:
+        out.write("Weather Forecast\n--------------------------------\n")
+        batch = []
+        for day in range(days):
+            batch.append(generator.make_record(datetime.date.fromordinal(first + day)))
+            if len(batch) == WRITE_BATCH:
+                out.write("".join(batch))
+                batch = []
+        out.write("".join(batch))
+    return file_name, days, generator.get_corrupted()
+
+def write_stations(folder, stations, days, seed=0, start=datetime.date(2000, 1, 1),
+                   extreme_rate=0.02, corrupt_rate=0.0, processes=1):
+    """
+    Writes one file per station, in parallel when more than one process is asked for.
+    The same seed always gives the same files, whatever the number of processes.
+
+    Parameters:
+        folder: directory the files are written to (str)
+        stations: number of stations (int)
+        days: number of days per station (int)
+        seed: base seed, default is 0 (int)
+        start: first day, default is January 1, 2000 (datetime.date)
+        extreme_rate: fraction of days with an extreme event, default is 0.02 (float)
+        corrupt_rate: fraction of records with a malformed line, default is 0.0 (float)
+        processes: number of worker processes, default is 1 (int)
+    Returns:
+        results: (file name, records, corrupted) for every station (list)
+    """
+    os.makedirs(folder, exist_ok=True)
+    jobs = [(os.path.join(folder, "station_%04d.txt" % station), seed * 100003 + station,
+             days, start, extreme_rate, corrupt_rate) for station in range(stations)]
+    if processes > 1:
+        with multiprocessing.Pool(processes) as pool:
+            return pool.starmap(write_station, jobs)
+    return [write_station(*job) for job in jobs]
+
+def main(arguments=None):
+    """
+    Writes station files from the command line and reports the write rate.
+
+    Parameters:
+        arguments: command line arguments, default is sys.argv (list)
+    """
+    parser = argparse.ArgumentParser(description="Writes synthetic weather station files.")
+    parser.add_argument("--stations", type=int, default=1)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--start", default="2000-01-01", help="first date, yyyy-mm-dd")
+    parser.add_argument("--out", default="stations", help="directory to write to")
+    parser.add_argument("--extreme-rate", type=float, default=0.02)
+    parser.add_argument("--corrupt-rate", type=float, default=0.0)
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+    options = parser.parse_args(arguments)
+
+    start_time = time.perf_counter()
+    results = write_stations(options.out, options.stations, options.days, options.seed,
+                             datetime.date.fromisoformat(options.start), options.extreme_rate,
+                             options.corrupt_rate, options.processes)
+    elapsed = time.perf_counter() - start_time
+    records = sum(result[1] for result in results)
+    corrupted = sum(result[2] for result in results)
+    print("wrote %d records in %d files in %.2fs (%.0f records/minute), %d corrupted" % (
+        records, len(results), elapsed, records / elapsed * 60, corrupted))
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,380 @@
+'''
+Name: Eric and Sanvi
+Last modified: May 21, 2025
+Program details: An application that provides weather monitoring with a GUI from tkinter package.
+                 It will read weather data from a file, automatically updates conditions at set intervals, and
+                 dynamically display weather conditions (e.g., Sunny, Rainy, or Snowy).
+'''
+import asyncio
+import codecs
+import os
+import time
+from urllib.parse import urlsplit
+import Weather_App_Data
+import Weather_Readers
+
+#Maps response content types to the file extension whose reader parses them
+CONTENT_TYPES = {
+    "text/csv": ".csv",
+    "application/x-ndjson": ".jsonl",
+    "application/jsonl": ".jsonl",
+    "application/json-lines": ".jsonl"
+}
+#Number of bytes read from the socket at a time
+CHUNK_SIZE = 1 << 16
+
+class Connection_Pool():
+    """
+    Keeps idle keep-alive connections open so that repeated polls of the same
+    host reuse one socket instead of connecting every time.
+    """
+    def __init__(self, max_idle=4):
+        """
+        Initializes the Connection_Pool with no open connections.
+
+        Parameters:
+            max_idle: most idle connections kept per host, default is 4 (int)
+        """
+        self.__max_idle = max_idle
+        self.__idle = {} #maps (host, port) to a list of (reader, writer) pairs
+        self.__opened = 0
+
+    async def acquire(self, host, port):
+        """
+        Returns an idle connection to a host or opens a new one.
+
+        Parameters:
+            host: host name (str)
+            port: port number (int)
+        Returns:
+            reader, writer: the asyncio stream pair (tuple)
+            reused: True if the connection was already open (bool)
+        """
+        idle = self.__idle.get((host, port), [])
+        while idle:
+            reader, writer = idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer, True
+        reader, writer = await asyncio.open_connection(host, port)
+        self.__opened += 1
+        return reader, writer, False
+
+    def release(self, host, port, reader, writer):
+        """
+        Gives a connection back to the pool, or closes it if the pool is full.
+
+        Parameters:
+            host: host name (str)
+            port: port number (int)
+            reader: the asyncio stream reader (asyncio.StreamReader)
+            writer: the asyncio stream writer (asyncio.StreamWriter)
+        """
+        idle = self.__idle.setdefault((host, port), [])
+        if len(idle) < self.__max_idle and not writer.is_closing():
+            idle.append((reader, writer))
+        else:
+            writer.close()
+
+    def close(self):
+        """
+        Closes every idle connection.
+        """
+        for idle in self.__idle.values():
+            for _, writer in idle:
+                writer.close()
+        self.__idle = {}
+
+    def get_opened(self):
+        """
+        Returns how many connections have been opened in total.
+        Returns:
+            self.__opened: number of connections (int)
+        """
+        return self.__opened
+
+class Weather_Http_Source():
+    """
+    Polls one or more HTTP endpoints for weather records and feeds them into a
+    Weather_App_Data object. Responses are parsed while they stream in, and
+    ETag/Last-Modified validators avoid downloading payloads that did not change.
+    """
+    def __init__(self, weather_data, urls, max_idle=4, timeout=10.0):
+        """
+        Initializes the Weather_Http_Source.
+
+        Parameters:
+            weather_data: the object the records are ingested into (Weather_App_Data)
+            urls: http:// URLs of the endpoints to poll (list)
+            max_idle: most idle keep-alive connections kept per host, default is 4 (int)
+            timeout: seconds to wait for one response, default is 10.0 (float)
+        """
+        self.__data = weather_data
+        self.__urls = list(urls)
+        self.__timeout = timeout
+        self.__pool = Connection_Pool(max_idle)
+        self.__validators = {} #maps urls to their ETag, Last-Modified and body size
+        self.__metrics = {
+            "requests": 0,
+            "not_modified": 0,
+            "errors": 0,
+            "bytes_received": 0,
+            "bytes_saved": 0,
+            "records": 0,
+            "last_latency": 0.0,
+            "total_latency": 0.0
+        }
+
+    async def fetch(self, url):
+        """
+        Requests one endpoint and parses its body while it streams in.
+
+        Parameters:
+            url: the endpoint to request (str)
+        Returns:
+            records: list of records, each a list of (key, value) pairs (list) or None if unchanged
+        """
+        parts = urlsplit(url)
+        host = parts.hostname
+        port = parts.port or 80
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+
+        start = time.perf_counter()
+        for attempt in range(2):
+            reader, writer, reused = await self.__pool.acquire(host, port)
+            try:
+                status, headers, records, size = await asyncio.wait_for(
+                    self.exchange(reader, writer, host, path, url), self.__timeout)
+                break
+            except (ConnectionError, asyncio.IncompleteReadError):
+                writer.close()
+                #the server may have closed an idle keep-alive connection, so retry once on a new one
+                if not reused or attempt == 1:
+                    raise
+            except BaseException:
+                writer.close()
+                raise
+        if headers.get("connection", "").lower() == "close":
+            writer.close()
+        else:
+            self.__pool.release(host, port, reader, writer)
+
+        latency = time.perf_counter() - start
+        self.__metrics["requests"] += 1
+        self.__metrics["last_latency"] = latency
+        self.__metrics["total_latency"] += latency
+        self.__metrics["bytes_received"] += size
+
+        if status == 304:
+            self.__metrics["not_modified"] += 1
+            self.__metrics["bytes_saved"] += self.__validators.get(url, {}).get("size", 0)
+            return None
+        if status != 200:
+            raise ConnectionError("%s returned HTTP %d" % (url, status))
+        #remembers the validators so the next poll can be conditional
+        self.__validators[url] = {
+            "etag": headers.get("etag"),
+            "last-modified": headers.get("last-modified"),
+            "size": size
+        }
+        return records
+
+    async def exchange(self, reader, writer, host, path, url):
+        """
+        Sends one request on an open connection and reads the response.
+
+        Parameters:
+            reader: the asyncio stream reader (asyncio.StreamReader)
+            writer: the asyncio stream writer (asyncio.StreamWriter)
+            host: host name (str)
+            path: path and query of the request (str)
+            url: the full url, used to look up validators (str)
+        Returns:
+            status: HTTP status code (int)
+            headers: response headers with lower case names (dict)
+            records: parsed records (list)
+            size: number of body bytes received (int)
+        """
+        request = "GET " + path + " HTTP/1.1\r\nHost: " + host + "\r\nConnection: keep-alive\r\n"
+        validators = self.__validators.get(url, {})
+        if validators.get("etag"):
+            request += "If-None-Match: " + validators["etag"] + "\r\n"
+        if validators.get("last-modified"):
+            request += "If-Modified-Since: " + validators["last-modified"] + "\r\n"
+        writer.write((request + "\r\n").encode("latin-1"))
+        await writer.drain()
+
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionError("connection closed before the response")
+        status = int(status_line.split()[1])
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        records = []
+        size = 0
+        if status == 304 or status == 204:
+            return status, headers, records, size
+        parser = Stream_Parser(url, headers.get("content-type", ""))
+        async for chunk in self.read_body(reader, headers):
+            size += len(chunk)
+            records.extend(parser.feed(chunk))
+        records.extend(parser.finish())
+        return status, headers, records, size
+
+    async def read_body(self, reader, headers):
+        """
+        Yields the response body in chunks, handling Content-Length and chunked encoding.
+
+        Parameters:
+            reader: the asyncio stream reader (asyncio.StreamReader)
+            headers: response headers with lower case names (dict)
+        Returns:
+            async generator of body chunks (bytes)
+        """
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            while True:
+                length = int((await reader.readline()).split(b";")[0], 16)
+                if length == 0:
+                    await reader.readline() #blank line after the last chunk
+                    return
+                yield await reader.readexactly(length)
+                await reader.readline() #line break after each chunk
+        elif "content-length" in headers:
+            remaining = int(headers["content-length"])
+            while remaining > 0:
+                chunk = await reader.read(min(CHUNK_SIZE, remaining))
+                if not chunk:
+                    raise asyncio.IncompleteReadError(b"", remaining)
+                remaining -= len(chunk)
+                yield chunk
+        else:
+            headers["connection"] = "close" #the body ends when the server closes the socket
+            while True:
+                chunk = await reader.read(CHUNK_SIZE)
+                if not chunk:
+                    return
+                yield chunk
+
+    async def poll_once(self):
+        """
+        Requests every endpoint at once and ingests the records that changed.
+        Returns:
+            count: number of records ingested (int)
+        """
+        results = await asyncio.gather(*[self.fetch(url) for url in self.__urls], return_exceptions=True)
+        records = []
+        for result in results:
+            if isinstance(result, BaseException):
+                self.__metrics["errors"] += 1
+            elif result is not None:
+                records.extend(result)
+        if records:
+            self.__data.ingest_records(records, replace=False)
+            if isinstance(self.__data, Weather_App_Data.Weather_Calculations):
+                self.__data.recalculate()
+            self.__metrics["records"] += len(records)
+        return len(records)
+
+    async def poll_forever(self, interval=60.0):
+        """
+        Polls every endpoint, then waits, until the task is cancelled.
+
+        Parameters:
+            interval: seconds between polls, default is 60.0 (float)
+        """
+        try:
+            while True:
+                await self.poll_once()
+                await asyncio.sleep(interval)
+        finally:
+            self.close()
+
+    def close(self):
+        """
+        Closes the pooled connections.
+        """
+        self.__pool.close()
+
+    def get_metrics(self):
+        """
+        Returns request counts, latency and the bytes saved by conditional requests.
+        Returns:
+            metrics: dictionary of metric names and values (dict)
+        """
+        metrics = dict(self.__metrics)
+        requests = metrics["requests"]
+        metrics["average_latency"] = metrics["total_latency"] / requests if requests else 0.0
+        metrics["connections_opened"] = self.__pool.get_opened()
+        return metrics
+
+class Stream_Parser():
+    """
+    Turns body chunks into records as they arrive, using the reader that matches
+    the response content type or url.
+    """
+    def __init__(self, url, content_type):
+        """
+        Initializes the Stream_Parser for one response.
+
+        Parameters:
+            url: the requested url, used for its file extension (str)
+            content_type: the Content-Type response header (str)
+        """
+        self.__name = urlsplit(url).path
+        extension = CONTENT_TYPES.get(content_type.split(";")[0].strip().lower())
+        if extension is not None:
+            self.__name = "response" + extension
+        self.__decoder = codecs.getincrementaldecoder("utf-8")("replace")
+        self.__reader = None
+        self.__pending = ""
+
+    def feed(self, chunk):
+        """
+        Parses the complete lines in a chunk and keeps the unfinished last line.
+
+        Parameters:
+            chunk: the next piece of the body (bytes)
+        Returns:
+            records: the records completed by this chunk (list)
+        """
+        text = self.__pending + self.__decoder.decode(chunk)
+        if self.__reader is None:
+            self.__reader = Weather_Readers.get_reader(self.__name, text)
+        lines = text.split("\n")
+        self.__pending = lines.pop()
+        records = []
+        for line in lines:
+            record = self.__reader.feed_line(line)
+            if record is not None:
+                records.append(record)
+        return records
+
+    def finish(self):
+        """
+        Parses whatever is left once the body has ended.
+        Returns:
+            records: the records completed by the last line (list)
+        """
+        records = self.feed(b"")
+        if self.__pending:
+            record = self.__reader.feed_line(self.__pending)
+            self.__pending = ""
+            if record is not None:
+                records.append(record)
+        return records
+
+if __name__ == "__main__":
+    import sys
+    source = Weather_Http_Source(Weather_App_Data.Weather_Calculations(), sys.argv[1:])
+    interval = float(os.environ.get("WEATHER_POLL_SECONDS", "60"))
+    try:
+        asyncio.run(source.poll_forever(interval))
+    except KeyboardInterrupt:
+        print(source.get_metrics())
@@ -0,0 +1,182 @@
+'''
+Name: Eric and Sanvi
+Last modified: May 21, 2025
+Program details: An application that provides weather monitoring with a GUI from tkinter package.
+                 It will read weather data from a file, automatically updates conditions at set intervals, and
+                 dynamically display weather conditions (e.g., Sunny, Rainy, or Snowy).
+
+Load-tests the JSON API server and reports throughput and latency percentiles.
+
+    python Weather_Load_Test.py --spawn data.txt --connections 50 --seconds 10
+    python Weather_Load_Test.py --url http://127.0.0.1:8080/stations/data --conditional
+'''
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from urllib.parse import urlsplit
+import Weather_Benchmark
+
+async def run_client(host, port, request, deadline, latencies, statuses, conditional):
+    """
+    Sends requests one after another on one keep-alive connection until the deadline.
+
+    Parameters:
+        host: host name (str)
+        port: port number (int)
+        request: the request without its final blank line (bytes)
+        deadline: perf_counter time at which to stop (float)
+        latencies: list that each request's seconds are added to (list)
+        statuses: dictionary counting the statuses received (dict)
+        conditional: True to send the ETag of the last response back as If-None-Match (bool)
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    etag = None
+    try:
+        while time.perf_counter() < deadline:
+            message = request
+            if conditional and etag:
+                message += b"If-None-Match: " + etag + b"\r\n"
+            start = time.perf_counter()
+            writer.write(message + b"\r\n")
+            status = int((await reader.readline()).split()[1])
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b""):
+                    break
+                name, _, value = line.partition(b":")
+                name = name.strip().lower()
+                if name == b"content-length":
+                    length = int(value)
+                elif name == b"etag":
+                    etag = value.strip()
+            if length:
+                await reader.readexactly(length)
+            latencies.append(time.perf_counter() - start)
+            statuses[status] = statuses.get(status, 0) + 1
+    finally:
+        writer.close()
+
+async def load_test(url, connections=50, seconds=10.0, conditional=False):
+    """
+    Runs many clients at once against one url.
+
+    Parameters:
+        url: the http:// url to request (str)
+        connections: number of concurrent connections, default is 50 (int)
+        seconds: how long to send requests for, default is 10.0 (float)
+        conditional: True to send If-None-Match, as a polling client would (bool)
+    Returns:
+        results: request count, throughput, latency percentiles and status counts (dict)
+    """
+    parts = urlsplit(url)
+    host = parts.hostname
+    port = parts.port or 80
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+    request = ("GET " + path + " HTTP/1.1\r\nHost: " + host + "\r\n").encode("latin-1")
+    latencies = []
+    statuses = {}
+    start = time.perf_counter()
+    deadline = start + seconds
+    await asyncio.gather(*[run_client(host, port, request, deadline, latencies, statuses, conditional)
+                           for _ in range(connections)])
+    elapsed = time.perf_counter() - start
+    if not latencies:
+        return {"requests": 0, "statuses": statuses}
+    return {
+        "requests": len(latencies),
+        "requests_per_second": len(latencies) / elapsed,
+        "p50_ms": Weather_Benchmark.percentile(latencies, 0.5) * 1000,
+        "p99_ms": Weather_Benchmark.percentile(latencies, 0.99) * 1000,
+        "max_ms": max(latencies) * 1000,
+        "statuses": statuses
+    }
+
+def free_port():
+    """
+    Finds a port on localhost that nothing is listening on.
+    Returns:
+        port number (int)
+    """
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+def spawn_server(file_names, port, timeout=60.0):
+    """
+    Starts Weather_Api_Server.py in another process and waits until it accepts connections.
+
+    Parameters:
+        file_names: the station files to serve (list)
+        port: the port to serve on (int)
+        timeout: seconds to wait for the server, default is 60.0 (float)
+    Returns:
+        process: the server process (subprocess.Popen)
+    """
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Weather_Api_Server.py")
+    process = subprocess.Popen([sys.executable, script, "--port", str(port), "--refresh", "0"] + file_names,
+                               stdout=subprocess.DEVNULL)
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), 1).close()
+            return process
+        except OSError:
+            if process.poll() is not None:
+                raise RuntimeError("the server exited with code %d" % process.returncode)
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError("the server did not start within %.0f s" % timeout)
+
+def main(arguments=None):
+    """
+    Runs a load test from the command line and prints the results.
+
+    Parameters:
+        arguments: command line arguments, default is sys.argv (list)
+    """
+    parser = argparse.ArgumentParser(description="Load-tests the weather JSON API server.")
+    parser.add_argument("--url", help="url to request, default is the first station of the spawned server")
+    parser.add_argument("--spawn", nargs="+", metavar="FILE", help="start a local server for these station files")
+    parser.add_argument("--connections", type=int, default=50)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--conditional", action="store_true", help="send If-None-Match like a polling client")
+    parser.add_argument("--output", help="file to save the results to as JSON")
+    options = parser.parse_args(arguments)
+    if not options.url and not options.spawn:
+        parser.error("give --url or --spawn")
+
+    process = None
+    url = options.url
+    if options.spawn:
+        port = free_port()
+        process = spawn_server(options.spawn, port)
+        if url is None:
+            station = os.path.basename(options.spawn[0]).split(".")[0]
+            url = "http://127.0.0.1:%d/stations/%s" % (port, station)
+    try:
+        results = asyncio.run(load_test(url, options.connections, options.seconds, options.conditional))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+    results["url"] = url
+    results["connections"] = options.connections
+    if results["requests"]:
+        print("%d requests in %.1f s over %d connections: %.0f req/s, p50 %.2f ms, p99 %.2f ms, max %.2f ms" % (
+            results["requests"], options.seconds, options.connections, results["requests_per_second"],
+            results["p50_ms"], results["p99_ms"], results["max_ms"]))
+    print("statuses:", results["statuses"])
+    if options.output:
+        with open(options.output, 'w') as out:
+            json.dump(results, out, indent=2)
+
+if __name__ == "__main__":
+    main()
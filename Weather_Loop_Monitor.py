@@ -0,0 +1,186 @@
+'''
+Name: Eric and Sanvi
+Last modified: May 21, 2025
+Program details: An application that provides weather monitoring with a GUI from tkinter package.
+                 It will read weather data from a file, automatically updates conditions at set intervals, and
+                 dynamically display weather conditions (e.g., Sunny, Rainy, or Snowy).
+
+Measures how late Tk after() callbacks fire and which callbacks block the event loop.
+'''
+import collections
+import sys
+import time
+
+class Loop_Monitor():
+    """
+    Schedules after() callbacks through a wrapper that records how late each one
+    fired and how long it ran. Callbacks that run longer than the threshold, or
+    fire later than it, go into a rolling log so UI jank can be traced to a code path.
+    """
+    def __init__(self, threshold=0.05, heartbeat_ms=250, log_size=200):
+        """
+        Initializes the Loop_Monitor.
+
+        Parameters:
+            threshold: seconds a callback may run or be late before it is flagged, default is 0.05 (float)
+            heartbeat_ms: interval of the heartbeat that measures loop lag, default is 250 (int)
+            log_size: number of flagged callbacks kept, default is 200 (int)
+        """
+        self.__threshold = threshold
+        self.__heartbeat_ms = heartbeat_ms
+        self.__stats = {} #maps callback names to their counts and worst times
+        self.__log = collections.deque(maxlen=log_size) #recent flagged callbacks
+        self.__last_lag = 0.0
+        self.__slow_count = 0
+
+    def after(self, widget, delay_ms, callback, name=None):
+        """
+        Schedules a callback like widget.after, measuring when it fires and how long it runs.
+
+        Parameters:
+            widget: any Tk widget (tk.Misc)
+            delay_ms: delay in milliseconds (int)
+            callback: function called with no arguments (function)
+            name: name the callback is reported under, default is its qualified name (str)
+        Returns:
+            the after id, which widget.after_cancel accepts (str)
+        """
+        if name is None:
+            name = getattr(callback, "__qualname__", repr(callback))
+        due = time.perf_counter() + delay_ms / 1000
+
+        def run():
+            start = time.perf_counter()
+            try:
+                callback()
+            finally:
+                self.record(name, start - due, time.perf_counter() - start)
+
+        #calls the class method so a watched widget does not wrap the callback twice
+        return type(widget).after(widget, delay_ms, run)
+
+    def wrap(self, callback, name=None):
+        """
+        Wraps an event handler so the time it blocks the loop is recorded too.
+
+        Parameters:
+            callback: the handler, e.g. for widget.bind (function)
+            name: name the handler is reported under, default is its qualified name (str)
+        Returns:
+            the wrapped handler (function)
+        """
+        if name is None:
+            name = getattr(callback, "__qualname__", repr(callback))
+
+        def handler(*args):
+            start = time.perf_counter()
+            try:
+                return callback(*args)
+            finally:
+                self.record(name, 0.0, time.perf_counter() - start)
+
+        return handler
+
+    def watch(self, widget):
+        """
+        Routes widget.after through the monitor for code that schedules its own callbacks,
+        such as the weather animations.
+
+        Parameters:
+            widget: the widget whose after method is replaced (tk.Misc)
+        """
+        def after(delay_ms, func=None, *args):
+            if func is None:
+                return type(widget).after(widget, delay_ms) #plain sleep
+            return self.after(widget, delay_ms, lambda: func(*args),
+                              getattr(func, "__qualname__", repr(func)))
+        widget.after = after
+
+    def start(self, widget):
+        """
+        Starts the heartbeat, whose lateness shows how long anything blocked the loop.
+
+        Parameters:
+            widget: any Tk widget (tk.Misc)
+        """
+        self.after(widget, self.__heartbeat_ms, lambda: self.start(widget), "monitor.heartbeat")
+
+    def record(self, name, lateness, duration):
+        """
+        Adds one callback run to the statistics and flags it if it was slow or late.
+
+        Parameters:
+            name: name of the callback (str)
+            lateness: seconds between when it was due and when it started (float)
+            duration: seconds it ran for (float)
+        """
+        lateness = max(0.0, lateness)
+        stats = self.__stats.get(name)
+        if stats is None:
+            stats = self.__stats[name] = {"count": 0, "total": 0.0, "max_duration": 0.0,
+                                          "max_lateness": 0.0, "slow": 0}
+        stats["count"] += 1
+        stats["total"] += duration
+        stats["max_duration"] = max(stats["max_duration"], duration)
+        stats["max_lateness"] = max(stats["max_lateness"], lateness)
+        if name == "monitor.heartbeat":
+            self.__last_lag = lateness
+        if duration > self.__threshold or lateness > self.__threshold:
+            if duration > self.__threshold:
+                stats["slow"] += 1
+                self.__slow_count += 1
+            self.__log.append((time.time(), name, duration, lateness))
+
+    def get_worst(self, count=10):
+        """
+        Returns the callbacks that blocked the loop the longest.
+
+        Parameters:
+            count: number of callbacks to return, default is 10 (int)
+        Returns:
+            list of (name, stats) pairs, worst first (list)
+        """
+        return sorted(self.__stats.items(), key=lambda item: item[1]["max_duration"], reverse=True)[:count]
+
+    def get_log(self):
+        """
+        Returns the rolling log of flagged callbacks.
+        Returns:
+            list of (wall time, name, duration, lateness) tuples, oldest first (list)
+        """
+        return list(self.__log)
+
+    def get_last_lag(self):
+        """
+        Returns how late the last heartbeat fired.
+        Returns:
+            self.__last_lag: lag in seconds (float)
+        """
+        return self.__last_lag
+
+    def get_slow_count(self):
+        """
+        Returns how many callbacks ran longer than the threshold.
+        Returns:
+            self.__slow_count: number of slow callbacks (int)
+        """
+        return self.__slow_count
+
+    def dump(self, out=None):
+        """
+        Prints the worst offenders and the most recent flagged callbacks.
+
+        Parameters:
+            out: file to print to, default is sys.stderr (file object)
+        """
+        out = out or sys.stderr
+        print("%-40s %7s %10s %10s %10s %6s" % ("callback", "count", "mean ms", "max ms", "late ms", "slow"), file=out)
+        for name, stats in self.get_worst(15):
+            print("%-40s %7d %10.2f %10.2f %10.2f %6d" % (
+                name[-40:], stats["count"], stats["total"] / stats["count"] * 1000,
+                stats["max_duration"] * 1000, stats["max_lateness"] * 1000, stats["slow"]), file=out)
+        for wall_time, name, duration, lateness in list(self.__log)[-10:]:
+            print("%s %-40s ran %.1f ms, %.1f ms late" % (
+                time.strftime("%H:%M:%S", time.localtime(wall_time)), name[-40:],
+                duration * 1000, lateness * 1000), file=out)
+        out.flush()
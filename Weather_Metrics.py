@@ -0,0 +1,143 @@
+'''
+Name: Eric and Sanvi
+Last modified: May 21, 2025
+Program details: An application that provides weather monitoring with a GUI from tkinter package.
+                 It will read weather data from a file, automatically updates conditions at set intervals, and
+                 dynamically display weather conditions (e.g., Sunny, Rainy, or Snowy).
+
+Serves the app's health numbers on localhost in the Prometheus text format.
+'''
+import http.server
+import os
+import threading
+
+class Metrics_Registry():
+    """
+    Holds the latest value of every metric. Values are set from the Tk thread
+    and read by the server thread, so every access goes through a lock.
+    """
+    def __init__(self, prefix="weather_app_"):
+        """
+        Initializes the Metrics_Registry with no metrics.
+
+        Parameters:
+            prefix: text put in front of every metric name, default is "weather_app_" (str)
+        """
+        self.__prefix = prefix
+        self.__lock = threading.Lock()
+        self.__metrics = {} #maps names to (type, help, value)
+
+    def set(self, name, value, help_text, metric_type="gauge"):
+        """
+        Stores the value of a metric.
+
+        Parameters:
+            name: metric name without the prefix (str)
+            value: the current value (int or float)
+            help_text: one line describing the metric (str)
+            metric_type: "gauge" or "counter", default is "gauge" (str)
+        """
+        with self.__lock:
+            self.__metrics[name] = (metric_type, help_text, value)
+
+    def render(self):
+        """
+        Writes every metric in the Prometheus text exposition format.
+        Returns:
+            text: the metrics page (str)
+        """
+        with self.__lock:
+            metrics = sorted(self.__metrics.items())
+        lines = []
+        for name, (metric_type, help_text, value) in metrics:
+            full_name = self.__prefix + name
+            lines.append("# HELP " + full_name + " " + help_text)
+            lines.append("# TYPE " + full_name + " " + metric_type)
+            lines.append(full_name + " " + repr(float(value)))
+        return "\n".join(lines) + "\n"
+
+class Metrics_Handler(http.server.BaseHTTPRequestHandler):
+    """
+    Answers GET /metrics with the registry of the server it belongs to.
+    """
+    def do_GET(self):
+        """
+        Sends the metrics page, or 404 for any other path.
+        """
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = self.server.registry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """
+        Keeps scrapes out of the console.
+        """
+        return
+
+class Metrics_Server():
+    """
+    Runs the metrics page on a background thread, bound to localhost only.
+    """
+    def __init__(self, registry, port=9464, host="127.0.0.1"):
+        """
+        Initializes the Metrics_Server without starting it.
+
+        Parameters:
+            registry: the metrics to serve (Metrics_Registry)
+            port: port to listen on, 0 picks a free one, default is 9464 (int)
+            host: address to bind, default is "127.0.0.1" (str)
+        """
+        self.__registry = registry
+        self.__address = (host, port)
+        self.__server = None
+        self.__thread = None
+
+    def start(self):
+        """
+        Starts serving in a daemon thread.
+        Returns:
+            port: the port that is being listened on (int)
+        """
+        self.__server = http.server.ThreadingHTTPServer(self.__address, Metrics_Handler)
+        self.__server.daemon_threads = True
+        self.__server.registry = self.__registry
+        self.__thread = threading.Thread(target=self.__server.serve_forever, name="metrics", daemon=True)
+        self.__thread.start()
+        return self.__server.server_address[1]
+
+    def stop(self):
+        """
+        Stops the server and waits for its thread to end.
+        """
+        if self.__server is not None:
+            self.__server.shutdown()
+            self.__server.server_close()
+            self.__thread.join()
+            self.__server = None
+
+def get_rss_bytes():
+    """
+    Returns the resident memory of this process.
+    Uses /proc on Linux and falls back to the peak value from resource elsewhere.
+
+    Returns:
+        resident set size in bytes, 0 if it cannot be read (int)
+    """
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource
+        import sys
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+    except (ImportError, OSError):
+        return 0
@@ -0,0 +1,451 @@
+'''
+Name: Eric and Sanvi
+Last modified: May 21, 2025
+Program details: An application that provides weather monitoring with a GUI from tkinter package.
+                 It will read weather data from a file, automatically updates conditions at set intervals, and
+                 dynamically display weather conditions (e.g., Sunny, Rainy, or Snowy).
+
+An append-only binary log of validated observations, one file per station, with a
+columnar sidecar that the log is compacted into.
+
+    python Weather_Observation_Log.py import data.txt data.wlog
+    python Weather_Observation_Log.py compact data.wlog
+    python Weather_Observation_Log.py load data.wlog
+
+Log file: an 8 byte header, then one frame per observation. A frame is its payload
+length and the CRC32 of its payload (two little-endian uint32), then the payload:
+the yyyy-mm-dd date, the four numeric fields as float64 and the wind direction.
+A crash can only leave a torn frame at the end, which recovery cuts off.
+
+Sidecar (<log>.cols): a header with the day count and the CRC32 of the body, then
+the body as columns: every date, then each numeric field, then every direction.
+'''
+import argparse
+import array
+import asyncio
+import os
+import struct
+import sys
+import time
+import zlib
+
+#First bytes of a log file and of a sidecar
+LOG_MAGIC = b"WOBS\x01\x00\x00\x00"
+COLUMNS_MAGIC = b"WCOL"
+#Length and CRC32 in front of every frame
+FRAME_HEADER = struct.Struct("<II")
+#Date, minimum and maximum temperature, humidity, wind speed and wind direction
+OBSERVATION = struct.Struct("<10s4dB")
+#Version, byte order of the columns, and day count, after the sidecar magic, then the body's CRC32
+COLUMNS_HEADER = struct.Struct("<BBxxII")
+#Frames longer than this are taken as corruption
+MAX_FRAME = 4096
+#Wind directions, stored as their position in this list
+DIRECTIONS = ["N", "NE", "E", "SE", "S", "SW", "W", "NW"]
+#Numeric fields in the order they are stored
+NUMERIC_FIELDS = ("Min Temperature", "Max Temperature", "Humidity", "Wind Speed")
+
+class Observation_Log():
+    """
+    Appends observations to a station's log. Frames are buffered and written and
+    fsynced in batches, every sync_frames frames or sync_seconds seconds, so a
+    crash loses at most one batch. Appending only checks the time when a frame
+    arrives, so whatever owns the log calls tick regularly, or starts the timer on
+    its asyncio loop, to flush a batch that no further frame comes after. Opening the log cuts off a torn last frame, and
+    once compact_frames frames have built up the log is folded into the sidecar.
+    """
+    def __init__(self, file_name, sync_frames=1024, sync_seconds=1.0, compact_frames=100000):
+        """
+        Opens a log for appending, creating it if needed and recovering it if a write was cut off.
+
+        Parameters:
+            file_name: the log file, e.g. "station.wlog" (str)
+            sync_frames: frames buffered before they are written and fsynced, default is 1024 (int)
+            sync_seconds: longest time an appended frame waits for its fsync, default is 1.0 (float)
+            compact_frames: frames in the log before it is compacted, 0 for never, default is 100000 (int)
+        """
+        self.__file_name = file_name
+        self.__sync_frames = sync_frames
+        self.__sync_seconds = sync_seconds
+        self.__compact_frames = compact_frames
+        self.__buffer = bytearray()
+        self.__pending = 0 #frames in the buffer
+        self.__last_sync = time.monotonic()
+        self.__timer = None #the asyncio timer handle of start_timer
+        self.__stats = {"appended": 0, "syncs": 0, "compactions": 0, "recovered_bytes": 0}
+        self.__frames, good_size = recover(file_name)
+        self.__file = open(file_name, "ab")
+        if self.__file.tell() > good_size:
+            #cuts off the torn frame a crash left behind
+            self.__stats["recovered_bytes"] = self.__file.tell() - good_size
+            self.__file.truncate(good_size)
+        if good_size == 0:
+            self.__file.write(LOG_MAGIC)
+            self.__file.flush()
+            os.fsync(self.__file.fileno())
+
+    def attach(self, weather_data):
+        """
+        Appends every day that the data ingests and that is new or changed.
+
+        Parameters:
+            weather_data: the station's data (Weather_App_Data)
+        """
+        weather_data.add_ingest_listener(self.changed)
+
+    def changed(self, weather_data, date_key, record, old_record):
+        """
+        Appends one ingested day. Has the signature of an ingest listener.
+        The log has no frame for a removed day, so removals are not logged.
+
+        Parameters:
+            weather_data: the station's data (Weather_App_Data)
+            date_key: the day in yyyy-mm-dd format (str)
+            record: the day's weather data, or None if the day was removed (dict)
+            old_record: the day's earlier data, not used (dict)
+        """
+        if record is not None:
+            self.append(date_key, record)
+
+    def append(self, date_key, record):
+        """
+        Adds one validated observation to the log.
+
+        Parameters:
+            date_key: the day in yyyy-mm-dd format (str)
+            record: the day's weather data, with every numeric field and the wind direction (dict)
+        """
+        payload = OBSERVATION.pack(date_key.encode("ascii"), record["Min Temperature"], record["Max Temperature"],
+                                   record["Humidity"], record["Wind Speed"],
+                                   DIRECTIONS.index(record["Wind Direction"]))
+        self.__buffer += FRAME_HEADER.pack(len(payload), zlib.crc32(payload))
+        self.__buffer += payload
+        self.__pending += 1
+        self.__stats["appended"] += 1
+        if self.__pending >= self.__sync_frames or time.monotonic() - self.__last_sync >= self.__sync_seconds:
+            self.sync()
+
+    def sync(self):
+        """
+        Writes the buffered frames and waits until they are on disk, then compacts
+        the log if it has grown past compact_frames.
+        """
+        self.write_frames()
+        if self.__compact_frames and self.__frames >= self.__compact_frames:
+            self.compact()
+
+    def tick(self):
+        """
+        Syncs the buffered frames once they have waited sync_seconds.
+
+        Returns:
+            seconds until the buffered frames are due, or sync_seconds if there are none (float)
+        """
+        if self.__pending and self.__file is not None:
+            due = self.__last_sync + self.__sync_seconds - time.monotonic()
+            if due > 0:
+                return due
+            self.sync()
+        return self.__sync_seconds
+
+    def start_timer(self, loop=None):
+        """
+        Calls tick on an asyncio loop until the log is closed.
+
+        Parameters:
+            loop: the event loop, default is the running loop (asyncio.AbstractEventLoop)
+        """
+        if loop is None:
+            loop = asyncio.get_running_loop()
+
+        def run():
+            self.__timer = loop.call_later(self.tick(), run) if self.__file is not None else None
+
+        self.__timer = loop.call_later(self.__sync_seconds, run)
+
+    def write_frames(self):
+        """
+        Writes the buffered frames and fsyncs them in one go.
+        """
+        if self.__buffer:
+            self.__file.write(self.__buffer)
+            self.__file.flush()
+            os.fsync(self.__file.fileno())
+            self.__frames += self.__pending
+            self.__buffer = bytearray()
+            self.__pending = 0
+            self.__stats["syncs"] += 1
+        self.__last_sync = time.monotonic()
+
+    def compact(self):
+        """
+        Folds the sidecar and every frame into a new sidecar with the latest
+        observation of each day, then empties the log. The sidecar is replaced in one
+        rename, and reading a frame that is already in it again changes nothing, so a
+        crash at any point leaves the same days.
+        """
+        self.write_frames()
+        columns = latest_columns(read_observations(self.__file_name))
+        write_columns(columns_file(self.__file_name), columns)
+        self.__file.truncate(len(LOG_MAGIC))
+        self.__file.flush()
+        os.fsync(self.__file.fileno())
+        self.__frames = 0
+        self.__stats["compactions"] += 1
+
+    def close(self):
+        """
+        Writes the buffered frames, stops the timer and closes the log.
+        """
+        if self.__timer is not None:
+            self.__timer.cancel()
+            self.__timer = None
+        if self.__file is not None:
+            self.write_frames()
+            self.__file.close()
+            self.__file = None
+
+    def get_frames(self):
+        """
+        Returns how many frames are in the log since it was last compacted, not counting buffered ones.
+        Returns:
+            self.__frames: number of frames (int)
+        """
+        return self.__frames
+
+    def get_stats(self):
+        """
+        Returns how many observations were appended and how many syncs, compactions
+        and recovered bytes there were.
+        Returns:
+            stats: dictionary of counts (dict)
+        """
+        stats = dict(self.__stats)
+        stats["frames"] = self.__frames
+        stats["pending"] = self.__pending
+        return stats
+
+def columns_file(file_name):
+    """
+    Returns the name of a log's sidecar.
+
+    Parameters:
+        file_name: the log file (str)
+    Returns:
+        the sidecar file (str)
+    """
+    return file_name + ".cols"
+
+def is_log_file(file_name):
+    """
+    Tells whether a file is an observation log, by its extension or its first bytes.
+
+    Parameters:
+        file_name: the file (str)
+    Returns:
+        True for an observation log (bool)
+    """
+    if file_name.endswith(".wlog"):
+        return True
+    try:
+        with open(file_name, "rb") as data:
+            return data.read(len(LOG_MAGIC)) == LOG_MAGIC
+    except OSError:
+        return False
+
+def scan_frames(data):
+    """
+    Walks the frames of a log held in memory and stops at the first one that is
+    cut off or fails its CRC.
+
+    Parameters:
+        data: the log, header included (bytes)
+    Returns:
+        payloads: the payload of every good frame, in order (list of bytes)
+        good_size: bytes up to the end of the last good frame (int)
+    """
+    if not data:
+        return [], 0
+    if data[:len(LOG_MAGIC)] != LOG_MAGIC:
+        if LOG_MAGIC.startswith(data):
+            return [], 0 #the header itself was cut off
+        raise ValueError("not an observation log")
+    view = memoryview(data)
+    payloads = []
+    offset = len(LOG_MAGIC)
+    end = len(data)
+    header_size = FRAME_HEADER.size
+    unpack = FRAME_HEADER.unpack_from
+    crc32 = zlib.crc32
+    while offset + header_size <= end:
+        length, crc = unpack(view, offset)
+        start = offset + header_size
+        if length > MAX_FRAME or start + length > end:
+            break
+        payload = view[start:start + length]
+        if crc32(payload) != crc:
+            break
+        payloads.append(payload)
+        offset = start + length
+    return payloads, offset
+
+def recover(file_name):
+    """
+    Finds how much of a log is intact.
+
+    Parameters:
+        file_name: the log file (str)
+    Returns:
+        frames: number of good frames (int)
+        good_size: bytes up to the end of the last good frame, 0 for a missing or empty log (int)
+    """
+    try:
+        with open(file_name, "rb") as data:
+            payloads, good_size = scan_frames(data.read())
+    except FileNotFoundError:
+        return 0, 0
+    return len(payloads), good_size
+
+def read_columns(file_name):
+    """
+    Reads a sidecar.
+
+    Parameters:
+        file_name: the sidecar file (str)
+    Returns:
+        columns: "Date" as a list of yyyy-mm-dd strings, each numeric field as an
+                 array of float, and "Wind Direction" as a list of str, or None if there is no sidecar (dict)
+    """
+    try:
+        with open(file_name, "rb") as data:
+            contents = data.read()
+    except FileNotFoundError:
+        return None
+    if contents[:len(COLUMNS_MAGIC)] != COLUMNS_MAGIC:
+        raise ValueError(file_name + " is not an observation sidecar")
+    _, big_endian, count, crc = COLUMNS_HEADER.unpack_from(contents, len(COLUMNS_MAGIC))
+    body = memoryview(contents)[len(COLUMNS_MAGIC) + COLUMNS_HEADER.size:]
+    if zlib.crc32(body) != crc:
+        raise ValueError(file_name + " is damaged")
+    dates = bytes(body[:count * 10]).decode("ascii")
+    columns = {"Date": [dates[start:start + 10] for start in range(0, count * 10, 10)]}
+    offset = count * 10
+    for field in NUMERIC_FIELDS:
+        values = array.array("d")
+        values.frombytes(body[offset:offset + count * 8])
+        if big_endian != (sys.byteorder == "big"):
+            values.byteswap()
+        columns[field] = values
+        offset += count * 8
+    columns["Wind Direction"] = [DIRECTIONS[code] for code in body[offset:offset + count]]
+    return columns
+
+def write_columns(file_name, columns):
+    """
+    Writes a sidecar next to the final name, fsyncs it and renames it into place.
+
+    Parameters:
+        file_name: the sidecar file (str)
+        columns: columns as returned by read_columns (dict)
+    """
+    count = len(columns["Date"])
+    body = bytearray("".join(columns["Date"]).encode("ascii"))
+    for field in NUMERIC_FIELDS:
+        body += array.array("d", columns[field]).tobytes()
+    body += bytes(DIRECTIONS.index(direction) for direction in columns["Wind Direction"])
+    temporary = file_name + ".tmp"
+    with open(temporary, "wb") as out:
+        out.write(COLUMNS_MAGIC)
+        out.write(COLUMNS_HEADER.pack(1, sys.byteorder == "big", count, zlib.crc32(body)))
+        out.write(body)
+        out.flush()
+        os.fsync(out.fileno())
+    os.replace(temporary, file_name)
+    #makes the rename itself durable
+    if hasattr(os, "O_DIRECTORY"):
+        folder = os.open(os.path.dirname(os.path.abspath(file_name)), os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(folder)
+        finally:
+            os.close(folder)
+
+def read_observations(file_name):
+    """
+    Reads every observation of a station, oldest first: the sidecar's, then the log's.
+    A torn frame at the end of the log and everything after it are skipped.
+
+    Parameters:
+        file_name: the log file (str)
+    Returns:
+        observations: (date, minimum, maximum, humidity, wind speed, direction) tuples (list)
+    """
+    observations = []
+    columns = read_columns(columns_file(file_name))
+    if columns is not None:
+        observations.extend(zip(columns["Date"], *[columns[field] for field in NUMERIC_FIELDS],
+                                columns["Wind Direction"]))
+    try:
+        with open(file_name, "rb") as data:
+            payloads, _ = scan_frames(data.read())
+    except FileNotFoundError:
+        payloads = []
+    unpack = OBSERVATION.unpack
+    for payload in payloads:
+        date, min_temp, max_temp, humid, speed, direction = unpack(payload[:OBSERVATION.size])
+        observations.append((date.decode("ascii"), min_temp, max_temp, humid, speed, DIRECTIONS[direction]))
+    return observations
+
+def latest_columns(observations):
+    """
+    Keeps the latest observation of each day and turns them into columns sorted by date.
+
+    Parameters:
+        observations: (date, minimum, maximum, humidity, wind speed, direction) tuples, oldest first (list)
+    Returns:
+        columns: columns as written by write_columns (dict)
+    """
+    latest = {observation[0]: observation for observation in observations}
+    rows = [latest[date_key] for date_key in sorted(latest)]
+    names = ("Date",) + NUMERIC_FIELDS + ("Wind Direction",)
+    columns = {name: [row[position] for row in rows] for position, name in enumerate(names)}
+    return columns
+
+def main(arguments=None):
+    """
+    Imports a data file into a log, compacts a log, or times rebuilding a station from one.
+
+    Parameters:
+        arguments: command line arguments, default is sys.argv (list)
+    """
+    import Weather_App_Data
+    parser = argparse.ArgumentParser(description="Manages append-only weather observation logs.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    import_command = commands.add_parser("import", help="append the days of a data file to a log")
+    import_command.add_argument("source")
+    import_command.add_argument("log")
+    compact_command = commands.add_parser("compact", help="fold a log into its sidecar")
+    compact_command.add_argument("log")
+    load_command = commands.add_parser("load", help="time rebuilding a station from a log")
+    load_command.add_argument("log")
+    options = parser.parse_args(arguments)
+
+    start_time = time.perf_counter()
+    if options.command == "import":
+        source = Weather_App_Data.Weather_App_Data(options.source)
+        log = Observation_Log(options.log, compact_frames=0)
+        for date_key, record in zip(source.get_day_keys(), source.get_list()):
+            log.append(date_key, record)
+        log.close()
+        print("appended %d days in %.2f s" % (log.get_stats()["appended"], time.perf_counter() - start_time))
+    elif options.command == "compact":
+        log = Observation_Log(options.log, compact_frames=0)
+        frames = log.get_frames()
+        log.compact()
+        log.close()
+        print("compacted %d frames in %.2f s" % (frames, time.perf_counter() - start_time))
+    else:
+        data = Weather_App_Data.Weather_App_Data(options.log)
+        print("rebuilt %d days in %.2f s" % (len(data.get_list()), time.perf_counter() - start_time))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,378 @@
+'''
+Name: Eric and Sanvi
+Last modified: May 21, 2025
+Program details: An application that provides weather monitoring with a GUI from tkinter package.
+                 It will read weather data from a file, automatically updates conditions at set intervals, and
+                 dynamically display weather conditions (e.g., Sunny, Rainy, or Snowy).
+'''
+import bz2
+import collections
+import csv
+import gzip
+import io
+import json
+import lzma
+import os
+import time
+
+#Fields every weather record needs before it can be stored
+FIELDS = ["Date", "Min Temperature", "Max Temperature", "Humidity", "Wind Speed", "Wind Direction"]
+FIELD_SET = frozenset(FIELDS)
+#Unit characters that are stripped off the end of values
+UNIT_CHARACTERS = 'Â°C%km/h'
+#Size of the read buffer used when opening data files
+BUFFER_SIZE = 1 << 16
+#Maps compressed file extensions to the function that opens them
+DECOMPRESSORS = {
+    ".gz": gzip.open,
+    ".bz2": bz2.open,
+    ".xz": lzma.open
+}
+#Magic bytes used to spot compressed files that have no matching extension
+MAGIC_NUMBERS = [
+    (b"\x1f\x8b", ".gz"),
+    (b"BZh", ".bz2"),
+    (b"\xfd7zXZ\x00", ".xz")
+]
+
+def clean_value(value):
+    """
+    Removes surrounding whitespace and unit characters from a raw value.
+
+    Parameters:
+        value: the raw value read from the file (str)
+    Returns:
+        the value without its units (str)
+    """
+    return str(value).strip().strip(UNIT_CHARACTERS).strip()
+
+class Text_Reader():
+    """
+    Reads the original block format where every line is 'Key: value unit'
+    and six lines make up one day.
+    """
+    def __init__(self):
+        """
+        Initializes the Text_Reader with an empty list of pending key-value pairs.
+        Does not accept any parameters (other than self) and does not return anything.
+        """
+        self.__pairs = []
+
+    def parse_line(self, info):
+        """
+        Parses a single line from the data file into key-value format.
+
+        Parameters:
+            info: a raw line of data that has come from the txt file (str)
+        Returns:
+            key: describes what the info is for. Will be refereneced in the dic's key-value pair (str)
+            value: contains the actual information. Will be refereneced in the dic's key-value pair (str)
+            None: returned if the line is empty/has no colon (nonetype)
+        """
+        line = info.strip()
+
+        if not line or ':' not in line:
+            return None
+
+        index_colon = line.find(":")
+        key = line[:index_colon] #strips colon
+        value = line[index_colon + 1:].strip(UNIT_CHARACTERS).strip() #strips extra special characters
+        return key, value
+
+    def feed_line(self, line):
+        """
+        Adds one line to the reader and returns a record once six items have been collected.
+
+        Parameters:
+            line: a raw line of data (str)
+        Returns:
+            record: list of (key, value) pairs (list) or None if the record is not complete yet
+        """
+        result = self.parse_line(line)
+        if result is None:
+            return None
+        self.__pairs.append(result)
+        if len(self.__pairs) == len(FIELDS): #checks if 6 items are in record
+            record = self.__pairs
+            self.__pairs = []
+            return record
+        return None
+
+    def read_records(self, lines):
+        """
+        Streams records out of an iterable of lines.
+
+        Parameters:
+            lines: an open file or any other iterable of lines (iterable)
+        Returns:
+            generator of records, each a list of (key, value) pairs (generator)
+        """
+        for line in lines:
+            record = self.feed_line(line)
+            if record is not None:
+                yield record
+
+class Csv_Reader():
+    """
+    Reads comma separated files whose first row is a header naming the fields.
+    One csv.reader reads the whole stream, so a quoted field may go on over several lines.
+    """
+    def __init__(self):
+        """
+        Initializes the Csv_Reader before its header row has been seen.
+        Does not accept any parameters (other than self) and does not return anything.
+        """
+        self.__header = None
+        self.__queue = collections.deque() #lines given to feed_line that the csv reader has not read yet
+        self.__quotes = 0 #quote characters in the queued lines, odd while a quoted field is open
+        self.__rows = csv.reader(self.queued_lines())
+
+    def queued_lines(self):
+        """
+        Hands the lines given to feed_line to the csv reader. The reader is only asked
+        for a row once its last line is queued, so the queue is never empty when it reads.
+
+        Returns:
+            generator of lines (generator)
+        """
+        while True:
+            yield self.__queue.popleft()
+
+    def feed_line(self, line):
+        """
+        Adds one line to the reader and returns the record it completes.
+
+        Parameters:
+            line: a raw line of data (str)
+        Returns:
+            record: list of (key, value) pairs (list) or None for the header, blank lines
+                    and lines that end inside a quoted field
+        """
+        if not self.__queue and not line.strip():
+            return None
+        self.__queue.append(line if line.endswith("\n") else line + "\n")
+        self.__quotes += line.count('"')
+        if self.__quotes % 2:
+            return None #the quoted field goes on over the next line
+        self.__quotes = 0
+        return self.make_record(next(self.__rows))
+
+    def make_record(self, row):
+        """
+        Pairs a row with the header, or stores the row as the header if it is the first.
+
+        Parameters:
+            row: the values of one row (list)
+        Returns:
+            record: list of (key, value) pairs (list) or None for the header and blank rows
+        """
+        if not row or (len(row) == 1 and not row[0].strip()):
+            return None
+        if self.__header is None:
+            self.__header = [name.strip() for name in row] #first row names the columns
+            return None
+        return [(key, clean_value(value)) for key, value in zip(self.__header, row)]
+
+    def read_records(self, lines):
+        """
+        Streams records out of an iterable of lines.
+
+        Parameters:
+            lines: an open file or any other iterable of lines (iterable)
+        Returns:
+            generator of records, each a list of (key, value) pairs (generator)
+        """
+        for row in csv.reader(lines):
+            record = self.make_record(row)
+            if record is not None:
+                yield record
+
+class Jsonl_Reader():
+    """
+    Reads JSON Lines files where every line is one object holding a whole day.
+    """
+    def feed_line(self, line):
+        """
+        Adds one line to the reader and returns the record it holds.
+
+        Parameters:
+            line: a raw line of data (str)
+        Returns:
+            record: list of (key, value) pairs (list) or None for blank or broken lines
+        """
+        line = line.strip()
+        if not line:
+            return None
+        try:
+            obj = json.loads(line)
+        except ValueError:
+            return [] #an empty record is rejected by validation
+        if not isinstance(obj, dict):
+            return []
+        return [(key, clean_value(value)) for key, value in obj.items()]
+
+    def read_records(self, lines):
+        """
+        Streams records out of an iterable of lines.
+
+        Parameters:
+            lines: an open file or any other iterable of lines (iterable)
+        Returns:
+            generator of records, each a list of (key, value) pairs (generator)
+        """
+        for line in lines:
+            record = self.feed_line(line)
+            if record is not None:
+                yield record
+
+#Maps file extensions to the reader class that understands them
+READERS = {
+    ".txt": Text_Reader,
+    ".csv": Csv_Reader,
+    ".jsonl": Jsonl_Reader,
+    ".ndjson": Jsonl_Reader
+}
+
+def register_reader(extension, reader_class):
+    """
+    Adds or replaces the reader used for a file extension.
+
+    Parameters:
+        extension: the file extension including the dot, e.g. ".csv" (str)
+        reader_class: a class with feed_line and read_records methods (class)
+    """
+    READERS[extension.lower()] = reader_class
+
+def sniff_reader(sample):
+    """
+    Guesses the reader class from the first lines of a file.
+
+    Parameters:
+        sample: the start of the file (str)
+    Returns:
+        the reader class that matches the sample (class)
+    """
+    for line in sample.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith("{"):
+            return Jsonl_Reader
+        if "," in line and line.split(",")[0].strip() in FIELDS:
+            return Csv_Reader
+        if line.split(":")[0] in FIELDS:
+            return Text_Reader
+    return Text_Reader
+
+def get_reader(file_name, sample=""):
+    """
+    Creates the reader for a file, chosen by its extension or by sniffing the sample.
+
+    Parameters:
+        file_name: name of the data file (str)
+        sample: the start of the file, used when the extension is unknown (str)
+    Returns:
+        a new reader object (object)
+    """
+    extension = os.path.splitext(file_name)[1].lower()
+    if extension in READERS:
+        return READERS[extension]()
+    return sniff_reader(sample)()
+
+class Timed_Stream(io.RawIOBase):
+    """
+    Wraps a binary stream and adds up the time spent reading from it, so that
+    decompression time can be reported apart from parse time.
+    """
+    def __init__(self, stream):
+        """
+        Initializes the Timed_Stream around another binary stream.
+
+        Parameters:
+            stream: the binary stream to read from (file object)
+        """
+        io.RawIOBase.__init__(self)
+        self.__stream = stream
+        self.__seconds = 0.0
+
+    def readable(self):
+        """
+        Tells io that the stream can be read.
+        Returns:
+            True (bool)
+        """
+        return True
+
+    def readinto(self, buffer):
+        """
+        Reads bytes from the wrapped stream into a buffer while timing the read.
+
+        Parameters:
+            buffer: the buffer to fill (bytearray or memoryview)
+        Returns:
+            count: number of bytes read (int)
+        """
+        start = time.perf_counter()
+        count = self.__stream.readinto(buffer)
+        self.__seconds += time.perf_counter() - start
+        return count
+
+    def close(self):
+        """
+        Closes the wrapped stream as well as this one.
+        """
+        self.__stream.close()
+        io.RawIOBase.close(self)
+
+    def get_seconds(self):
+        """
+        Returns the total time spent reading from the wrapped stream.
+        Returns:
+            self.__seconds: time in seconds (float)
+        """
+        return self.__seconds
+
+def detect_compression(file_name):
+    """
+    Finds the compression of a file from its extension or, failing that, its first bytes.
+
+    Parameters:
+        file_name: name of the data file (str)
+    Returns:
+        the compressed extension (".gz", ".bz2" or ".xz") or None if the file is plain (str or None)
+    """
+    extension = os.path.splitext(file_name)[1].lower()
+    if extension in DECOMPRESSORS:
+        return extension
+    with open(file_name, 'rb') as raw:
+        start = raw.read(6)
+    for magic, extension in MAGIC_NUMBERS:
+        if start.startswith(magic):
+            return extension
+    return None
+
+def open_data_file(file_name):
+    """
+    Opens a data file for buffered, line by line reading. Compressed files
+    are decoded in chunks as they are read, without temporary files.
+
+    Parameters:
+        file_name: name of the data file (str)
+    Returns:
+        stream: the open text file (file object)
+        reader: the reader that understands the file (object)
+        timer: the stream that records how long reading and decompressing took (Timed_Stream)
+    """
+    compression = detect_compression(file_name)
+    inner_name = file_name
+    if compression is None:
+        raw = open(file_name, 'rb', buffering=0)
+    else:
+        raw = DECOMPRESSORS[compression](file_name, 'rb')
+        if file_name.lower().endswith(compression):
+            inner_name = file_name[:-len(compression)] #data.csv.gz is read as data.csv
+    timer = Timed_Stream(raw)
+    buffered = io.BufferedReader(timer, BUFFER_SIZE)
+    reader = get_reader(inner_name, buffered.peek(4096)[:4096].decode("utf-8", "replace"))
+    stream = io.TextIOWrapper(buffered, encoding="utf-8", errors="replace")
+    return stream, reader, timer
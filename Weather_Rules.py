@@ -0,0 +1,208 @@
+'''
+Name: Eric and Sanvi
+Last modified: May 21, 2025
+Program details: An application that provides weather monitoring with a GUI from tkinter package.
+                 It will read weather data from a file, automatically updates conditions at set intervals, and
+                 dynamically display weather conditions (e.g., Sunny, Rainy, or Snowy).
+
+Loads the weather condition rules from a JSON file and compiles them once, so each region
+can use its own thresholds without a code change.
+'''
+import bisect
+import json
+import operator
+import os
+
+#Comparisons a rule may use
+OPERATORS = {"<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge, "==": operator.eq}
+#Rule file used when none is given
+DEFAULT_RULES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "conditions.json")
+
+class Rule_Table():
+    """
+    The compiled condition rules. A plain rule is a list of comparisons that must all
+    (or any) hold; a band rule picks at most one band of a field, found with one bisect
+    over the sorted lower edges. Conditions are reported in the order of the rules.
+    """
+    def __init__(self, table):
+        """
+        Compiles a rule table.
+
+        Parameters:
+            table: the parsed rule file, with "rules" and "default" (dict)
+        """
+        self.__rules = [] #compiled rules, in order
+        self.__images = {} #maps condition names to image names
+        for rule in table["rules"]:
+            if "bands" in rule:
+                bands = sorted(rule["bands"], key=lambda band: band["min"])
+                for lower, upper in zip(bands, bands[1:]):
+                    if lower["max"] is None or lower["max"] >= upper["min"]:
+                        raise ValueError("bands of " + rule["field"] + " overlap at " + lower["name"])
+                lows = [band["min"] for band in bands]
+                highs = [float("inf") if band["max"] is None else band["max"] for band in bands]
+                results = [(band["name"], band["description"]) for band in bands]
+                self.__rules.append(("band", rule["field"], lows, highs, results))
+                for band in bands:
+                    self.__images[band["name"]] = band.get("image")
+            else:
+                mode = "all" if "all" in rule else "any"
+                checks = []
+                for field, op, threshold in rule[mode]:
+                    if op not in OPERATORS:
+                        raise ValueError("unknown operator " + op + " in " + rule["name"])
+                    checks.append((field, OPERATORS[op], threshold))
+                self.__rules.append((mode, tuple(checks), (rule["name"], rule["description"])))
+                self.__images[rule["name"]] = rule.get("image")
+        default = table["default"]
+        self.__default = (default["name"], default["description"])
+        self.__images[default["name"]] = default.get("image")
+        self.__names = [name for name in self.__images if name != default["name"]]
+        self.__alerts = []
+        for alert in table.get("alerts", []):
+            if ("above" in alert) == ("below" in alert):
+                raise ValueError("alert " + alert["name"] + " needs either above or below")
+            if "above" in alert and alert["clear"] > alert["above"] or "below" in alert and alert["clear"] < alert["below"]:
+                raise ValueError("alert " + alert["name"] + " clears on the wrong side of its threshold")
+            self.__alerts.append(alert)
+
+    def evaluate(self, values):
+        """
+        Finds the conditions of one day.
+
+        Parameters:
+            values: maps field names, measured and derived, to numbers (dict)
+        Returns:
+            condition, description: the matching names and descriptions joined by spaces,
+                                    or the default when nothing matches (tuple of str)
+        """
+        names = []
+        descriptions = []
+        for rule in self.__rules:
+            if rule[0] == "band":
+                _, field, lows, highs, results = rule
+                value = values[field]
+                slot = bisect.bisect_right(lows, value) - 1
+                if slot < 0 or value > highs[slot]:
+                    continue #below the first band or in a gap between bands
+                result = results[slot]
+            else:
+                mode, checks, result = rule
+                if mode == "all":
+                    matched = all(compare(values[field], threshold) for field, compare, threshold in checks)
+                else:
+                    matched = any(compare(values[field], threshold) for field, compare, threshold in checks)
+                if not matched:
+                    continue
+            names.append(result[0])
+            descriptions.append(result[1])
+        if not names:
+            return self.__default
+        return " ".join(names), " ".join(descriptions)
+
+    def evaluate_batch(self, columns):
+        """
+        Finds the conditions of many days, working through one rule at a time over whole columns.
+
+        Parameters:
+            columns: maps field names to lists of numbers, all the same length (dict)
+        Returns:
+            conditions, descriptions: one joined string per day (tuple of lists)
+        """
+        count = len(next(iter(columns.values()))) if columns else 0
+        names = [[] for _ in range(count)]
+        descriptions = [[] for _ in range(count)]
+        for rule in self.__rules:
+            if rule[0] == "band":
+                _, field, lows, highs, results = rule
+                for day, value in enumerate(columns[field]):
+                    slot = bisect.bisect_right(lows, value) - 1
+                    if slot >= 0 and value <= highs[slot]:
+                        names[day].append(results[slot][0])
+                        descriptions[day].append(results[slot][1])
+                continue
+            mode, checks, result = rule
+            #starts from the first comparison and narrows (or widens) with the others
+            field, compare, threshold = checks[0]
+            matched = [compare(value, threshold) for value in columns[field]]
+            for field, compare, threshold in checks[1:]:
+                if mode == "all":
+                    matched = [hit and compare(value, threshold) for hit, value in zip(matched, columns[field])]
+                else:
+                    matched = [hit or compare(value, threshold) for hit, value in zip(matched, columns[field])]
+            for day, hit in enumerate(matched):
+                if hit:
+                    names[day].append(result[0])
+                    descriptions[day].append(result[1])
+        conditions = []
+        texts = []
+        for day in range(count):
+            if names[day]:
+                conditions.append(" ".join(names[day]))
+                texts.append(" ".join(descriptions[day]))
+            else:
+                conditions.append(self.__default[0])
+                texts.append(self.__default[1])
+        return conditions, texts
+
+    def get_names(self):
+        """
+        Returns the names of every condition the rules can report, without the default.
+        Returns:
+            self.__names: condition names in rule order (list)
+        """
+        return self.__names
+
+    def get_default(self):
+        """
+        Returns the condition used when no rule matches.
+        Returns:
+            self.__default: name and description (tuple)
+        """
+        return self.__default
+
+    def get_alerts(self):
+        """
+        Returns the alert thresholds: each alert is raised when its field goes above
+        (or below) one value and cleared only when it comes back past another.
+        Returns:
+            self.__alerts: dictionaries with name, field, above or below, and clear (list)
+        """
+        return self.__alerts
+
+    def get_images(self):
+        """
+        Returns the image of every condition, including the default.
+        Returns:
+            self.__images: maps condition names to image names (dict)
+        """
+        return self.__images
+
+def load(file_name=None):
+    """
+    Reads and compiles a rule file.
+
+    Parameters:
+        file_name: the JSON rule file, default is the WEATHER_RULES environment variable
+                   or conditions.json next to this module (str)
+    Returns:
+        table: the compiled rules (Rule_Table)
+    """
+    if file_name is None:
+        file_name = os.environ.get("WEATHER_RULES", DEFAULT_RULES)
+    with open(file_name, encoding="utf-8") as rule_file:
+        return Rule_Table(json.load(rule_file))
+
+#Compiled default rules, loaded on first use
+_default_table = None
+
+def get_rule_table():
+    """
+    Returns the default rules, compiling them only the first time.
+    Returns:
+        table: the compiled rules (Rule_Table)
+    """
+    global _default_table
+    if _default_table is None:
+        _default_table = load()
+    return _default_table
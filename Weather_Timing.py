@@ -0,0 +1,183 @@
+'''
+Name: Eric and Sanvi
+Last modified: May 21, 2025
+Program details: An application that provides weather monitoring with a GUI from tkinter package.
+                 It will read weather data from a file, automatically updates conditions at set intervals, and
+                 dynamically display weather conditions (e.g., Sunny, Rainy, or Snowy).
+'''
+import collections
+import math
+import signal
+import sys
+import time
+
+class Span():
+    """
+    Times one phase between entering and leaving a with block.
+    """
+    __slots__ = ("timer", "name", "start")
+
+    def __init__(self, timer, name):
+        """
+        Initializes the Span for a phase.
+
+        Parameters:
+            timer: the timer the duration is recorded in (Phase_Timer)
+            name: name of the phase (str)
+        """
+        self.timer = timer
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        """
+        Starts timing the phase.
+        """
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        """
+        Stops timing and records the duration, even if the phase raised.
+        """
+        self.timer.record(self.name, time.perf_counter() - self.start)
+        return False
+
+class No_Span():
+    """
+    Stands in for Span while timing is disabled, so a with block costs almost nothing.
+    """
+    __slots__ = ()
+
+    def __enter__(self):
+        """
+        Does nothing.
+        """
+        return self
+
+    def __exit__(self, *exc_info):
+        """
+        Does nothing.
+        """
+        return False
+
+#Shared span handed out while timing is disabled
+NO_SPAN = No_Span()
+
+class Phase_Timer():
+    """
+    Keeps the most recent durations of every named phase, so slow refreshes
+    can be traced to read_data, the derived-metric loops or a redraw step.
+    """
+    def __init__(self, enabled=True, window=512):
+        """
+        Initializes the Phase_Timer with no recorded phases.
+
+        Parameters:
+            enabled: False to make span() a no-op, default is True (bool)
+            window: number of recent durations kept per phase, default is 512 (int)
+        """
+        self.__enabled = enabled
+        self.__window = window
+        self.__samples = {} #maps phase names to a deque of recent durations
+        self.__counts = {} #maps phase names to how many times they ran in total
+
+    def span(self, name):
+        """
+        Returns a context manager that times the with block as the named phase.
+
+        Parameters:
+            name: name of the phase, e.g. "refresh.read_data" (str)
+        Returns:
+            a Span, or NO_SPAN when timing is disabled (object)
+        """
+        if not self.__enabled:
+            return NO_SPAN
+        return Span(self, name)
+
+    def record(self, name, seconds):
+        """
+        Adds one duration to a phase.
+
+        Parameters:
+            name: name of the phase (str)
+            seconds: how long the phase took (float)
+        """
+        samples = self.__samples.get(name)
+        if samples is None:
+            samples = self.__samples[name] = collections.deque(maxlen=self.__window)
+            self.__counts[name] = 0
+        samples.append(seconds)
+        self.__counts[name] += 1
+
+    def set_enabled(self, enabled):
+        """
+        Turns timing on or off.
+
+        Parameters:
+            enabled: True to time phases (bool)
+        """
+        self.__enabled = enabled
+
+    def is_enabled(self):
+        """
+        Tells whether phases are being timed.
+        Returns:
+            self.__enabled (bool)
+        """
+        return self.__enabled
+
+    def get_summary(self):
+        """
+        Summarizes the recent durations of every phase.
+        Returns:
+            summary: maps phase names to count, last, mean, p50, p95, p99 and max in seconds (dict)
+        """
+        summary = {}
+        for name, samples in self.__samples.items():
+            ordered = sorted(samples)
+            summary[name] = {
+                "count": self.__counts[name],
+                "last": samples[-1],
+                "mean": sum(ordered) / len(ordered),
+                "p50": ordered[max(0, math.ceil(0.50 * len(ordered)) - 1)],
+                "p95": ordered[max(0, math.ceil(0.95 * len(ordered)) - 1)],
+                "p99": ordered[max(0, math.ceil(0.99 * len(ordered)) - 1)],
+                "max": ordered[-1]
+            }
+        return summary
+
+    def dump(self, out=None):
+        """
+        Prints a table of the phase summary.
+
+        Parameters:
+            out: file to print to, default is sys.stderr (file object)
+        """
+        out = out or sys.stderr
+        print("%-34s %7s %9s %9s %9s %9s %9s" % ("phase", "count", "last ms", "p50 ms", "p95 ms", "p99 ms", "max ms"), file=out)
+        for name, row in sorted(self.get_summary().items()):
+            print("%-34s %7d %9.2f %9.2f %9.2f %9.2f %9.2f" % (
+                name, row["count"], row["last"] * 1000, row["p50"] * 1000, row["p95"] * 1000,
+                row["p99"] * 1000, row["max"] * 1000), file=out)
+        out.flush()
+
+    def install_signal(self, signal_number=None):
+        """
+        Dumps the summary whenever the process gets a signal (SIGUSR1 by default).
+        Does nothing on platforms without that signal.
+
+        Parameters:
+            signal_number: the signal to listen for (int)
+        Returns:
+            True if the handler was installed (bool)
+        """
+        if signal_number is None:
+            signal_number = getattr(signal, "SIGUSR1", None)
+        if signal_number is None:
+            return False
+        try:
+            signal.signal(signal_number, lambda number, frame: self.dump())
+        except ValueError:
+            return False #signals can only be handled in the main thread
+        return True